@@ -1,19 +1,36 @@
-"""Builds refmaster_data.json from a hardcoded ticker list using SEC CIK and LLM-enriched identifiers."""
+"""
+Builds refmaster_data.json from a ticker universe using SEC CIK, FMP and LLM-enriched identifiers.
 
-import json
+The build is incremental: the existing JSON is loaded and only symbols that
+are new, whose SEC CIK changed, or that still carry placeholder identifiers
+while an identifier source is configured are rebuilt; the rest are kept
+as-is. Identifier lookups for the rebuilt symbols run concurrently through
+the vendor session managers, so they share the usual rate limiter and
+concurrency cap. The output is written atomically.
+"""
+
+import argparse
 import hashlib
+import json
 import os
-from typing import Dict, List
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from dotenv import load_dotenv
 import requests
 
+from src.data_tools.batch import fetch_many
+from src.data_tools.http_client import get_session_manager
+from src.data_tools.sec_cik import load_cik_index
 from src.refmaster.schema import RefMasterEquity
-from src.data_tools.sec_cik import get_cik_for_ticker
 
 load_dotenv()
 
+DEFAULT_OUTPUT = Path(__file__).parent / "refmaster_data.json"
+LLM_VENDOR = "llm"
+LLM_BATCH_SIZE = 50  # tickers per enrichment prompt
 
 TICKERS = [
     "AAPL", "MSFT", "GOOG", "AMZN", "NVDA", "META", "TSLA", "BRK.B", "JPM", "V",
@@ -24,12 +41,8 @@ TICKERS = [
 ]
 
 
-def _to_equity(symbol: str) -> RefMasterEquity:
+def _to_equity(symbol: str, cik: str = "") -> RefMasterEquity:
     """Create an Equity record with SEC CIK (if available) and placeholder IDs."""
-    try:
-        cik = get_cik_for_ticker(symbol) or ""
-    except Exception:
-        cik = ""
     eq = RefMasterEquity(
         symbol=symbol,
         isin="",
@@ -100,7 +113,7 @@ def _assign_exchange(symbol: str) -> str:
     return "NASDAQ"
 
 
-def _ensure_defaults(eq: Equity) -> None:
+def _ensure_defaults(eq: RefMasterEquity) -> None:
     if not eq.cusip:
         eq.cusip = _generate_cusip(eq.symbol)
     if not eq.isin:
@@ -111,79 +124,279 @@ def _ensure_defaults(eq: Equity) -> None:
         eq.exchange = _assign_exchange(eq.symbol)
 
 
-def build(output_path: Path | str | None = None) -> Path:
-    """Write the hardcoded tickers to refmaster_data.json with Equity schema."""
-    path = Path(output_path) if output_path else Path(__file__).parent / "refmaster_data.json"
-    base_equities: Dict[str, RefMasterEquity] = {t: _to_equity(t) for t in TICKERS}
-    enriched_equities = _enrich_with_llm(list(base_equities.values()))
-    final_equities = []
-    for sym, base in base_equities.items():
-        enriched = enriched_equities.get(sym, base)
-        # Only set CIK if we have at least one other identifier (to avoid overwriting blanks)
-        if (enriched.isin or enriched.cusip) and base.cik:
-            enriched.cik = base.cik
-        elif not enriched.cik:
-            enriched.cik = base.cik
-        _ensure_defaults(enriched)
-        final_equities.append(enriched)
-    payload = {"equities": [eq.model_dump() for eq in final_equities]}
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    return path
-
-
-def _enrich_with_llm(equities: List[RefMasterEquity]) -> Dict[str, RefMasterEquity]:
-    """Call LLM once to fill identifiers; fallback to original on failure."""
+def _has_placeholder_ids(eq: RefMasterEquity) -> bool:
+    """True when the CUSIP is the deterministic placeholder rather than a sourced identifier."""
+    return eq.cusip == _generate_cusip(eq.symbol)
+
+
+def _llm_settings() -> Optional[Tuple[str, str, str]]:
     model = os.getenv("LLM_MODEL") or os.getenv("OPENAI_MODEL")
     api_key = os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY")
     endpoint = os.getenv("LLM_API_URL") or os.getenv("OPENAI_API_URL") or "https://api.openai.com/v1/chat/completions"
     if not model or not api_key:
-        return {eq.symbol: eq for eq in equities}
+        return None
+    return model, api_key, endpoint
+
+
+def _identifier_sources_configured() -> bool:
+    return bool(os.getenv("FMP_API_KEY")) or _llm_settings() is not None
+
+
+def _merge(base: RefMasterEquity, enriched: RefMasterEquity) -> RefMasterEquity:
+    # Only set CIK if we have at least one other identifier (to avoid overwriting blanks)
+    if (enriched.isin or enriched.cusip) and base.cik:
+        enriched.cik = base.cik
+    elif not enriched.cik:
+        enriched.cik = base.cik
+    _ensure_defaults(enriched)
+    return enriched
+
+
+@dataclass
+class BuildReport:
+    """Outcome of an incremental build: which symbols were rebuilt, kept or dropped."""
+
+    path: Path
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    written: bool = False
+
+    @property
+    def total(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.unchanged)
+
+
+def load_existing(path: Path | str) -> Dict[str, RefMasterEquity]:
+    """Records of a previous build by symbol; empty if the file is missing or unreadable."""
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        records = [RefMasterEquity(**item) for item in payload.get("equities", [])]
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+    return {eq.symbol: eq for eq in records}
+
+
+def _sec_ciks() -> Dict[str, str]:
+    """Ticker -> CIK from the cached SEC index (one download at most, none when fresh)."""
+    try:
+        return load_cik_index().ticker_to_cik
+    except (requests.exceptions.RequestException, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, equities: Iterable[RefMasterEquity]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"equities": [eq.model_dump() for eq in equities]}
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def build_universe(
+    symbols: Optional[Iterable[str]] = None,
+    output_path: Path | str | None = None,
+    full: bool = False,
+    max_workers: Optional[int] = None,
+) -> BuildReport:
+    """
+    Incrementally rebuild refmaster_data.json for a ticker universe.
+
+    A symbol is rebuilt when it is not in the existing file, its SEC CIK
+    changed, or its identifiers are still placeholders and FMP_API_KEY or
+    LLM settings are available; ``full`` rebuilds every symbol. Symbols no
+    longer in the universe are dropped. Rebuilt symbols get identifiers from
+    FMP bulk profiles first, then from concurrent LLM prompts for whatever
+    FMP did not cover. Nothing is written when no record changed.
 
-    tickers = [eq.symbol for eq in equities]
+    Args:
+        symbols: Tickers to include (default: TICKERS).
+        output_path: Output JSON (default: refmaster_data.json next to this file).
+        full: Rebuild every symbol and rewrite the file.
+        max_workers: Concurrent vendor requests (default DATA_TOOLS_MAX_CONCURRENCY).
+    """
+    path = Path(output_path) if output_path else DEFAULT_OUTPUT
+    universe = list(dict.fromkeys(s.strip().upper() for s in (symbols or TICKERS) if s and s.strip()))
+    existing = load_existing(path)
+    ciks = _sec_ciks()
+    report = BuildReport(path=path)
+    refresh_placeholders = _identifier_sources_configured()
+
+    rebuild: List[str] = []
+    for symbol in universe:
+        current = existing.get(symbol)
+        cik = ciks.get(symbol, "")
+        if current is None:
+            report.added.append(symbol)
+            rebuild.append(symbol)
+        elif full or (cik and current.cik != cik) or (refresh_placeholders and _has_placeholder_ids(current)):
+            report.updated.append(symbol)
+            rebuild.append(symbol)
+        else:
+            report.unchanged.append(symbol)
+    members = set(universe)
+    report.removed = [symbol for symbol in existing if symbol not in members]
+
+    base_equities = {symbol: _to_equity(symbol, ciks.get(symbol, "")) for symbol in rebuild}
+    enriched = _enrich_with_fmp(list(base_equities.values()), max_workers=max_workers)
+    remaining = [eq for symbol, eq in base_equities.items() if symbol not in enriched]
+    if remaining:
+        enriched.update(_enrich_with_llm(remaining, max_workers=max_workers))
+    rebuilt = {symbol: _merge(base, enriched.get(symbol, base)) for symbol, base in base_equities.items()}
+
+    # A rebuilt record identical to the stored one is not an update.
+    for symbol in list(report.updated):
+        if rebuilt[symbol] == existing[symbol]:
+            report.updated.remove(symbol)
+            report.unchanged.append(symbol)
+
+    if report.added or report.updated or report.removed or not path.exists() or full:
+        final = [rebuilt[symbol] if symbol in rebuilt else existing[symbol] for symbol in universe]
+        _write_atomic(path, final)
+        report.written = True
+    return report
+
+
+def build(output_path: Path | str | None = None) -> Path:
+    """Write the hardcoded tickers to refmaster_data.json with Equity schema."""
+    return build_universe(output_path=output_path).path
+
+
+def _enrich_with_fmp(
+    equities: List[RefMasterEquity], max_workers: Optional[int] = None
+) -> Dict[str, RefMasterEquity]:
+    """Identifiers from FMP bulk profiles (when FMP_API_KEY is set) for symbols FMP knows."""
+    if not equities or not os.getenv("FMP_API_KEY"):
+        return {}
+    from src.data_tools.fmp_api import get_security_identifiers_batch
+
+    lookup = get_security_identifiers_batch([eq.symbol for eq in equities], max_workers=max_workers)
+    mapping: Dict[str, RefMasterEquity] = {}
+    for eq in equities:
+        profile = lookup.equities.get(eq.symbol)
+        if profile is None or not (profile.isin or profile.cusip):
+            continue
+        mapping[eq.symbol] = RefMasterEquity(
+            **{
+                **eq.model_dump(),
+                "isin": profile.isin,
+                "cusip": profile.cusip,
+                "cik": eq.cik or profile.cik,
+                "currency": profile.currency or eq.currency,
+                "exchange": profile.exchange or eq.exchange,
+            }
+        )
+    return mapping
+
+
+def _request_llm_identifiers(symbols: Tuple[str, ...]) -> Dict[str, RefMasterEquity]:
+    """One enrichment prompt for a chunk of tickers; raises on transport or format errors."""
+    model, api_key, endpoint = _llm_settings()
     system_prompt = (
         "You are a reference data assistant. For each US ticker provided, supply CUSIP, ISIN, exchange, and currency. "
         "Return JSON: {\"equities\": [{\"symbol\": str, \"cusip\": str, \"isin\": str, "
         "\"exchange\": str, \"currency\": str}]}."
     )
-    user_prompt = "Tickers: " + ", ".join(tickers)
+    user_prompt = "Tickers: " + ", ".join(symbols)
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
     ]
-    try:
-        resp = requests.post(
-            endpoint,
-            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-            json={"model": model, "messages": messages},
-            timeout=300,
+    resp = get_session_manager(LLM_VENDOR).post(
+        endpoint,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        json={"model": model, "messages": messages},
+        timeout=300,
+    )
+    resp.raise_for_status()
+    content = resp.json()["choices"][0]["message"]["content"]
+    data = json.loads(content)
+    items = data.get("equities", []) if isinstance(data, dict) else []
+    requested = set(symbols)
+    mapping: Dict[str, RefMasterEquity] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        sym = item.get("symbol")
+        if not sym or sym.upper() not in requested:
+            continue
+        eq = RefMasterEquity(
+            symbol=sym,
+            isin=item.get("isin", "") or "",
+            cusip=item.get("cusip", "") or "",
+            cik="",  # handled separately
+            currency=item.get("currency", "USD") or "USD",
+            exchange=item.get("exchange", "") or _assign_exchange(sym),
+            pricing_source="llm",
         )
-        resp.raise_for_status()
-        content = resp.json()["choices"][0]["message"]["content"]
-        data = json.loads(content)
-        items = data.get("equities", []) if isinstance(data, dict) else []
-        mapping: Dict[str, RefMasterEquity] = {}
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            sym = item.get("symbol")
-            if not sym:
-                continue
-            eq = RefMasterEquity(
-                symbol=sym,
-                isin=item.get("isin", "") or "",
-                cusip=item.get("cusip", "") or "",
-                cik="",  # handled separately
-                currency=item.get("currency", "USD") or "USD",
-                exchange=item.get("exchange", "") or _assign_exchange(sym),
-                pricing_source="llm",
-            )
-            _ensure_defaults(eq)
-            mapping[sym.upper()] = eq
+        _ensure_defaults(eq)
+        mapping[sym.upper()] = eq
+    return mapping
+
+
+def _enrich_with_llm(
+    equities: List[RefMasterEquity], max_workers: Optional[int] = None
+) -> Dict[str, RefMasterEquity]:
+    """
+    Fill identifiers with LLM_BATCH_SIZE tickers per prompt; fallback to original on failure.
+
+    Prompts run concurrently through the "llm" session manager, so
+    DATA_TOOLS_VENDOR_RPS=llm=<rps> caps their rate. A failed prompt only
+    falls back for its own tickers.
+    """
+    mapping = {eq.symbol: eq for eq in equities}
+    if not equities or _llm_settings() is None:
         return mapping
-    except Exception:
-        return {eq.symbol: eq for eq in equities}
+    symbols = list(mapping)
+    chunks = [tuple(symbols[i : i + LLM_BATCH_SIZE]) for i in range(0, len(symbols), LLM_BATCH_SIZE)]
+    results, _ = fetch_many(_request_llm_identifiers, chunks, max_workers=max_workers)
+    for chunk_result in results.values():
+        mapping.update(chunk_result)
+    return mapping
+
+
+def _read_symbols(path: Path) -> List[str]:
+    """Tickers from a file: whitespace/comma separated, ``#`` starts a comment."""
+    symbols: List[str] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0]
+        symbols.extend(part for part in line.replace(",", " ").split() if part)
+    return symbols
+
+
+def main(argv: Optional[List[str]] = None) -> BuildReport:
+    parser = argparse.ArgumentParser(description="Incrementally build refmaster_data.json.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--symbols", help="Comma-separated tickers (default: the built-in list).")
+    source.add_argument("--tickers-file", type=Path, help="File of tickers, whitespace or comma separated.")
+    source.add_argument("--sec-universe", action="store_true", help="Every ticker in the SEC ticker/CIK index.")
+    parser.add_argument("--limit", type=int, help="Keep only the first N tickers of the universe.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--full", action="store_true", help="Rebuild every symbol instead of diffing.")
+    parser.add_argument("--max-workers", type=int)
+    args = parser.parse_args(argv)
+
+    if args.symbols:
+        symbols = args.symbols.split(",")
+    elif args.tickers_file:
+        symbols = _read_symbols(args.tickers_file)
+    elif args.sec_universe:
+        symbols = list(load_cik_index().ticker_to_cik)
+    else:
+        symbols = list(TICKERS)
+    if args.limit:
+        symbols = symbols[: args.limit]
+
+    report = build_universe(symbols, output_path=args.output, full=args.full, max_workers=args.max_workers)
+    action = "Wrote" if report.written else "Up to date:"
+    print(
+        f"{action} {report.total} equities to {report.path} "
+        f"({len(report.added)} added, {len(report.updated)} updated, "
+        f"{len(report.unchanged)} unchanged, {len(report.removed)} removed)"
+    )
+    return report
 
 
 if __name__ == "__main__":
-    out = build()
-    print(f"Wrote {len(TICKERS)} equities to {out}")
+    main()
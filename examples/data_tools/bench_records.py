@@ -0,0 +1,86 @@
+"""Micro-benchmark: slotted snapshot records vs pydantic models for a large ticker universe."""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_tools.records import EquityRecord, PriceRecord  # noqa: E402
+from src.data_tools.schemas import EquitySnapshot, PriceSnapshot  # noqa: E402
+
+
+def _price_fields(i):
+    return {"ticker": f"T{i:05d}", "price": 100.0 + i, "return_1d": 1.001, "return_5d": 0.998, "date": "2024-06-05"}
+
+
+def _equity_fields(i):
+    return {
+        **_price_fields(i),
+        "market_cap": 1e9 + i,
+        "sector": "Technology",
+        "industry": "Software",
+        "volatility_20d": 0.21,
+        "drawdown": -0.03,
+        "max_drawdown": -0.08,
+    }
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _bytes_per_object(build, n):
+    """Traced allocation per object while building n of them (inputs are prepared beforehand)."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return allocated / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickers", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = args.tickers
+
+    cases = [
+        ("price", PriceSnapshot, PriceRecord, [_price_fields(i) for i in range(n)]),
+        ("equity", EquitySnapshot, EquityRecord, [_equity_fields(i) for i in range(n)]),
+    ]
+    print(
+        f"{'record':<7} {'tickers':>7} {'model ms':>9} {'record ms':>10} {'speedup':>8} "
+        f"{'model B/obj':>12} {'record B/obj':>13} {'model_dump ms':>14} {'to_dict ms':>11}"
+    )
+    for name, model_cls, record_cls, rows in cases:
+        build_models = lambda: [model_cls(**row) for row in rows]  # noqa: E731
+        build_records = lambda: [record_cls(**row) for row in rows]  # noqa: E731
+        model_s = _time(build_models, args.repeat)
+        record_s = _time(build_records, args.repeat)
+        model_b = _bytes_per_object(build_models, n)
+        record_b = _bytes_per_object(build_records, n)
+        models, records = build_models(), build_records()
+        dump_s = _time(lambda: [m.model_dump() for m in models], args.repeat)
+        to_dict_s = _time(lambda: [r.to_dict() for r in records], args.repeat)
+        print(
+            f"{name:<7} {n:>7} {model_s * 1e3:>9.2f} {record_s * 1e3:>10.2f} {model_s / record_s:>7.1f}x "
+            f"{model_b:>12.0f} {record_b:>13.0f} {dump_s * 1e3:>14.2f} {to_dict_s * 1e3:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
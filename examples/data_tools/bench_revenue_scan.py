@@ -0,0 +1,106 @@
+"""Benchmark: early-exit html.parser revenue scan vs pd.read_html over every table of a 10-K."""
+
+import argparse
+import re
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_tools.revenue_scanner import (  # noqa: E402
+    CHUNK_CHARS,
+    _Found,
+    _parse_numeric,
+    _RevenueTableScanner,
+    scan_revenue_table,
+)
+
+DEFAULT_FILING = REPO_ROOT / "examples" / "data_tools" / "filings" / "aapl-20230930.htm"
+YEAR_PATTERN = re.compile(r"(20\d{2})")
+
+
+def _read_html_revenue(html, max_years=4):
+    """The previous implementation: DataFrames for every table, then iterrows until a revenue row."""
+    import pandas as pd
+
+    try:
+        tables = pd.read_html(StringIO(html))
+    except ValueError:
+        return []
+    for table in tables:
+        if table.empty or table.shape[1] < 2:
+            continue
+        table = table.dropna(how="all", axis=1)
+        if table.empty or table.shape[1] < 2:
+            continue
+        first_col = table.columns[0]
+        for _, row in table.iterrows():
+            label = str(row.get(first_col, "")).lower()
+            if "revenue" not in label:
+                continue
+            if "total" not in label and "net" not in label and not label.startswith("revenue"):
+                continue
+            entries = []
+            for col in table.columns[1:]:
+                year_match = YEAR_PATTERN.search(str(col))
+                if not year_match:
+                    continue
+                value = _parse_numeric(row.get(col))
+                if value is None:
+                    continue
+                entries.append({"year": int(year_match.group(1)), "value": value})
+            if entries:
+                entries.sort(key=lambda item: item["year"], reverse=True)
+                return entries[:max_years]
+    return []
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filing", type=Path, default=DEFAULT_FILING)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = args.filing.read_text(encoding="utf-8")
+    scan_s, scanned = _time(lambda: scan_revenue_table(html), args.repeat)
+    # How much of the document the scanner tokenized before stopping.
+    probe = _RevenueTableScanner(4)
+    fed = 0
+    try:
+        for fed in range(0, len(html), CHUNK_CHARS):
+            probe.feed(html[fed : fed + CHUNK_CHARS])
+    except _Found:
+        pass
+    fed = min(fed + CHUNK_CHARS, len(html))
+    print(f"filing: {args.filing.name} ({len(html) / 1e6:.2f} MB)")
+    print(
+        f"scanner:   {scan_s * 1e3:8.1f} ms  rows {probe.rows_checked:>5}  "
+        f"tokenized {fed / len(html):5.1%}  -> {scanned}"
+    )
+    try:
+        import pandas  # noqa: F401
+
+        read_s, read = _time(lambda: _read_html_revenue(html), args.repeat)
+    except ImportError as exc:
+        print(f"read_html: skipped ({exc})")
+        return
+    print(f"read_html: {read_s * 1e3:8.1f} ms  -> {read}")
+    print(f"speedup:   {read_s / scan_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
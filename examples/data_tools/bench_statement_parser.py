@@ -0,0 +1,94 @@
+"""Micro-benchmark: schema-driven statement parsing vs per-entry case-insensitive alias scans."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.data_tools.statement_parser import (  # noqa: E402
+    BALANCE_SHEET_FIELDS,
+    CASH_FLOW_FIELDS,
+    INCOME_STATEMENT_FIELDS,
+    _resolved_entries,
+    parse_balance_sheets,
+    parse_cash_flow_statements,
+    parse_income_statements,
+)
+
+
+def _scan_get_field(entry, *field_names):
+    """The previous per-entry helper: exact lookup, then a case-insensitive scan of every key."""
+    for name in field_names:
+        value = entry.get(name)
+        if value is not None:
+            return value
+        for key in entry.keys():
+            if isinstance(key, str) and key.lower() == name.lower():
+                return entry[key]
+    return None
+
+
+def _scan_parse(fields, statements):
+    return [{field: _scan_get_field(entry, *aliases) for field, aliases in fields.items()} for entry in statements]
+
+
+def _payload(n, fields, camel):
+    """n quarterly entries keyed by an upper-cased last alias (worst case for alias scans) plus noise keys."""
+    entries = []
+    for i in range(n):
+        entry = {f"extra_metric_{k}": float(k) for k in range(40)}
+        entry["report_period"] = f"{2024 - i // 4}-{3 * (i % 4) + 1:02d}-28"
+        entry["period"] = "quarterly"
+        for field, aliases in fields.items():
+            if field in ("report_period", "date"):
+                continue
+            name = aliases[-1]
+            if field in ("fiscal_period", "currency"):
+                value = "Q1" if field == "fiscal_period" else "USD"
+            elif field == "fiscal_year":
+                value = 2024 - i // 4
+            else:
+                value = float(i)
+            entry[name.upper() if camel else name] = value
+        entries.append(entry)
+    return entries
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=400, help="Statements per payload")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = [
+        ("income", INCOME_STATEMENT_FIELDS, parse_income_statements),
+        ("balance", BALANCE_SHEET_FIELDS, parse_balance_sheets),
+        ("cash_flow", CASH_FLOW_FIELDS, parse_cash_flow_statements),
+    ]
+    print(f"{'statement':<10} {'entries':>7} {'alias scan ms':>14} {'resolver ms':>12} {'full parse ms':>14} {'speedup':>8}")
+    for name, fields, parse in cases:
+        payload = _payload(args.entries, fields, camel=True)
+        scan = _time(lambda: _scan_parse(fields, payload), args.repeat)
+        full = _time(lambda: parse(payload, "BENCH", len(payload), "quarterly"), args.repeat)
+        # Resolution only, without pydantic model construction.
+        resolve = _time(lambda: list(_resolved_entries(fields, payload)), args.repeat)
+        print(
+            f"{name:<10} {args.entries:>7} {scan * 1e3:>14.2f} {resolve * 1e3:>12.2f} {full * 1e3:>14.2f} {scan / resolve:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
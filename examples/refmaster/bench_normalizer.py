@@ -0,0 +1,94 @@
+"""Benchmark: NormalizerAgent exact-identifier index lookups vs the per-equity scoring loop."""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from data.refmaster_builder import _cusip_check_digit, _generate_isin_from_cusip  # noqa: E402
+from src.refmaster.normalizer_agent import NormalizerAgent  # noqa: E402
+from src.refmaster.schema import RefMasterEquity  # noqa: E402
+
+
+class ScanOnlyAgent(NormalizerAgent):
+    """The previous behaviour: every input goes through the scoring loop."""
+
+    def _exact_matches(self, extracted, input_str):
+        return None
+
+
+def _symbol(i):
+    # Distinct 4-5 letter symbols ("BAAA", "BAAB", ...), skipping 1-3 letter ones.
+    letters = []
+    i += 26 ** 3
+    while i:
+        i, rem = divmod(i, 26)
+        letters.append(string.ascii_uppercase[rem])
+    return "".join(reversed(letters))
+
+
+def _universe(size):
+    equities = []
+    for i in range(size):
+        base = f"{i:08d}"
+        cusip = base + _cusip_check_digit(base)
+        equities.append(
+            RefMasterEquity(
+                symbol=_symbol(i),
+                isin=_generate_isin_from_cusip(cusip),
+                cusip=cusip,
+                cik=str(1_000_000 + i).zfill(10),
+                currency="USD",
+                exchange="NASDAQ" if i % 2 else "NYSE",
+                pricing_source="synthetic",
+            )
+        )
+    return equities
+
+
+def _time_queries(agent, queries):
+    start = time.perf_counter()
+    tops = [agent.normalize(q, top_k=1)[0].equity.symbol for q in queries]
+    return (time.perf_counter() - start) / len(queries), tops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=20, help="Queries per identifier kind.")
+    args = parser.parse_args()
+
+    equities = _universe(args.size)
+    start = time.perf_counter()
+    agent = NormalizerAgent(equities=equities)
+    build_s = time.perf_counter() - start
+    scan_agent = ScanOnlyAgent(equities=equities)
+    print(f"universe: {args.size:,} equities, index build {build_s * 1e3:.1f} ms")
+
+    sample = random.Random(0).sample(equities, args.queries)
+    kinds = {
+        "isin": [eq.isin for eq in sample],
+        "cusip": [eq.cusip for eq in sample],
+        "cik": [eq.cik for eq in sample],
+        "symbol": [eq.symbol for eq in sample],
+    }
+    for kind, queries in kinds.items():
+        indexed_s, indexed_tops = _time_queries(agent, queries)
+        scan_s, scan_tops = _time_queries(scan_agent, queries)
+        assert indexed_tops == scan_tops == [eq.symbol for eq in sample], kind
+        print(
+            f"{kind:>6}: indexed {indexed_s * 1e6:9.1f} us/query  "
+            f"scan {scan_s * 1e3:8.1f} ms/query  speedup {scan_s / indexed_s:10,.0f}x"
+        )
+    fuzzy_s, _ = _time_queries(agent, [f"{eq.symbol} {eq.exchange}" for eq in sample[:5]])
+    print(f" fuzzy: scan {fuzzy_s * 1e3:8.1f} ms/query (unchanged path)")
+
+
+if __name__ == "__main__":
+    main()
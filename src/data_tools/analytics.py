@@ -0,0 +1,174 @@
+"""Vectorized return, realized-volatility and drawdown engine over (symbols x days) close matrices."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data_tools.price_history import PriceHistoryStore, get_price_history
+
+TRADING_DAYS_PER_YEAR = 252
+RETURN_HORIZONS = (1, 5, 20)
+VOL_WINDOW = 20
+DRAWDOWN_LOOKBACK = 63
+
+
+def clean_closes(closes: np.ndarray, volumes: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Forward-fill gaps along the day axis.
+
+    Zero-volume days are treated as missing (same rule as get_price_snapshot),
+    so a halted or not-yet-listed symbol carries its last close; leading gaps
+    stay NaN.
+    """
+    closes = np.array(closes, dtype=np.float64, copy=True)
+    if volumes is not None:
+        closes[~(np.asarray(volumes) > 0)] = np.nan
+    valid = ~np.isnan(closes)
+    idx = np.where(valid, np.arange(closes.shape[1]), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = np.take_along_axis(closes, idx, axis=1)
+    # Columns before the first valid value pick index 0, which may itself be NaN: keep them NaN.
+    filled[np.cumsum(valid, axis=1) == 0] = np.nan
+    return filled
+
+
+def n_day_returns(closes: np.ndarray, n: int) -> np.ndarray:
+    """Return multipliers close[t] / close[t - n]; NaN where t < n or either close is missing."""
+    out = np.full(closes.shape, np.nan)
+    if n < closes.shape[1]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[:, n:] = closes[:, n:] / closes[:, :-n]
+    return out
+
+
+def rolling_volatility(closes: np.ndarray, window: int = VOL_WINDOW, annualize: bool = True) -> np.ndarray:
+    """
+    Sample std of daily log returns over the trailing ``window`` returns.
+
+    Computed from running sums of r and r^2 so the cost is O(symbols x days)
+    regardless of window; NaN until a full window of returns is available.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ret = np.diff(np.log(closes), axis=1)
+    valid = ~np.isnan(log_ret)
+    r = np.where(valid, log_ret, 0.0)
+    zeros = np.zeros((closes.shape[0], 1))
+    csum = np.concatenate([zeros, np.cumsum(r, axis=1)], axis=1)
+    csq = np.concatenate([zeros, np.cumsum(r * r, axis=1)], axis=1)
+    ccount = np.concatenate([zeros, np.cumsum(valid, axis=1)], axis=1)
+
+    out = np.full(closes.shape, np.nan)
+    if window < 2 or log_ret.shape[1] < window:
+        return out
+    s = csum[:, window:] - csum[:, :-window]
+    sq = csq[:, window:] - csq[:, :-window]
+    count = ccount[:, window:] - ccount[:, :-window]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (sq - s * s / count) / (count - 1)
+    vol = np.sqrt(np.clip(var, 0.0, None))
+    vol[count < window] = np.nan
+    if annualize:
+        vol *= np.sqrt(TRADING_DAYS_PER_YEAR)
+    # log_ret column j is the return into day j + 1, so the window ending at return j aligns with day j + 1.
+    out[:, window:] = vol
+    return out
+
+
+def drawdowns(closes: np.ndarray) -> np.ndarray:
+    """Fractional drawdown from the running peak (<= 0) across the supplied days."""
+    peaks = np.fmax.accumulate(closes, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return closes / peaks - 1.0
+
+
+def compute_metrics(
+    closes: np.ndarray,
+    horizons: Sequence[int] = RETURN_HORIZONS,
+    vol_window: int = VOL_WINDOW,
+    drawdown_lookback: int = DRAWDOWN_LOOKBACK,
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics at the last column for every row of a cleaned close matrix.
+
+    Returns arrays of length ``closes.shape[0]``: ``return_{n}d`` multipliers,
+    annualized ``volatility_{vol_window}d``, and ``drawdown`` / ``max_drawdown``
+    over the trailing ``drawdown_lookback`` days.
+    """
+    metrics: Dict[str, np.ndarray] = {}
+    last = closes[:, -1]
+    for n in horizons:
+        if n < closes.shape[1]:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                metrics[f"return_{n}d"] = last / closes[:, -1 - n]
+        else:
+            metrics[f"return_{n}d"] = np.full(closes.shape[0], np.nan)
+    vol = rolling_volatility(closes[:, -(vol_window + 1):], vol_window)
+    metrics[f"volatility_{vol_window}d"] = vol[:, -1]
+    dd = drawdowns(closes[:, -drawdown_lookback:])
+    metrics["drawdown"] = dd[:, -1]
+    worst = np.min(np.where(np.isnan(dd), np.inf, dd), axis=1)
+    metrics["max_drawdown"] = np.where(np.isinf(worst), np.nan, worst)
+    return metrics
+
+
+_cache: "OrderedDict[Tuple[int, float, str], Dict[str, Dict[str, float]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_SIZE = 8
+
+
+def universe_metrics(
+    end_date: date,
+    symbols: Optional[Iterable[str]] = None,
+    history: Optional[PriceHistoryStore] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Per-symbol metrics as of ``end_date`` from the price history matrix.
+
+    The whole universe is computed in one vectorized pass and cached per
+    (history build, date), so per-ticker lookups after the first are dict reads.
+    Symbols without a close on or before ``end_date`` are omitted; NaN metrics
+    are dropped from each symbol's dict.
+    """
+    history = history or get_price_history()
+    if history is None:
+        return {}
+    key = (id(history), history.built_at, end_date.isoformat())
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+    if cached is None:
+        cols = history.columns(None, end_date)
+        lookback = max(DRAWDOWN_LOOKBACK, VOL_WINDOW + 1, max(RETURN_HORIZONS) + 1)
+        start = max(cols.stop - lookback, 0)
+        closes = clean_closes(history.closes[:, start:cols.stop], history.volumes[:, start:cols.stop])
+        cached = {}
+        if closes.shape[1]:
+            arrays = compute_metrics(closes)
+            for row, symbol in enumerate(history.symbols):
+                if np.isnan(closes[row, -1]):
+                    continue
+                cached[symbol] = {
+                    name: float(values[row]) for name, values in arrays.items() if not np.isnan(values[row])
+                }
+        with _cache_lock:
+            _cache[key] = cached
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    if symbols is None:
+        return dict(cached)
+    wanted = {s.upper().strip() for s in symbols}
+    return {s: m for s, m in cached.items() if s in wanted}
+
+
+def snapshot_metrics(ticker: str, end_date: date) -> Dict[str, float]:
+    """Engine metrics for one ticker, or {} when the history does not cover it."""
+    history = get_price_history()
+    if history is None or not history.covers(ticker, end_date, end_date):
+        return {}
+    return universe_metrics(end_date, history=history).get(ticker.upper().strip(), {})
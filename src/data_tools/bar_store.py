@@ -0,0 +1,127 @@
+"""Persistent SQLite store of daily price bars keyed by (ticker, date)."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.data_tools.config import load_cache_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    close REAL NOT NULL,
+    volume REAL,
+    PRIMARY KEY (ticker, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL
+);
+"""
+
+
+class DailyBarStore:
+    """
+    Local daily-bar cache with per-ticker coverage tracking.
+
+    ``coverage`` records the contiguous calendar range whose bars have been
+    fetched from the vendor, so holidays and weekends inside that range are
+    known-empty rather than missing and never trigger a refetch.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def coverage(self, ticker: str) -> Optional[Tuple[date, date]]:
+        """Return the fetched (start, end) range for a ticker, if any."""
+        row = self._conn().execute(
+            "SELECT start_date, end_date FROM coverage WHERE ticker = ?", (ticker,)
+        ).fetchone()
+        if not row:
+            return None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+
+    def tickers(self) -> List[str]:
+        """Tickers with any fetched coverage."""
+        return [r[0] for r in self._conn().execute("SELECT ticker FROM coverage ORDER BY ticker").fetchall()]
+
+    def get_bars(self, ticker: str, start: date, end: date) -> List[Dict]:
+        """Return stored bars for ticker within [start, end], oldest first."""
+        rows = self._conn().execute(
+            "SELECT date, close, volume FROM bars WHERE ticker = ? AND date >= ? AND date <= ? ORDER BY date",
+            (ticker, start.isoformat(), end.isoformat()),
+        ).fetchall()
+        return [{"date": r[0], "close": r[1], "volume": r[2]} for r in rows]
+
+    def save(self, ticker: str, bars: List[Dict], start: date, covered_through: Optional[date]) -> None:
+        """
+        Upsert bars and extend coverage to [start, covered_through].
+
+        Coverage is merged with the existing range when the two overlap or touch;
+        otherwise the new range replaces it (older bars stay queryable).
+        """
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars (ticker, date, close, volume) VALUES (?, ?, ?, ?)",
+                [(ticker, b["date"], float(b["close"]), b.get("volume")) for b in bars if b.get("date") and b.get("close") is not None],
+            )
+            if covered_through is None or covered_through < start:
+                return
+            existing = self.coverage(ticker)
+            new_start, new_end = start, covered_through
+            if existing:
+                old_start, old_end = existing
+                if new_start <= old_end + timedelta(days=1) and new_end >= old_start - timedelta(days=1):
+                    new_start, new_end = min(old_start, new_start), max(old_end, new_end)
+            conn.execute(
+                "INSERT OR REPLACE INTO coverage (ticker, start_date, end_date) VALUES (?, ?, ?)",
+                (ticker, new_start.isoformat(), new_end.isoformat()),
+            )
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        """Drop cached bars and coverage for one ticker or the whole store."""
+        conn = self._conn()
+        with conn:
+            if ticker:
+                conn.execute("DELETE FROM bars WHERE ticker = ?", (ticker,))
+                conn.execute("DELETE FROM coverage WHERE ticker = ?", (ticker,))
+            else:
+                conn.execute("DELETE FROM bars")
+                conn.execute("DELETE FROM coverage")
+
+
+_stores: Dict[Path, DailyBarStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_bar_store() -> Optional[DailyBarStore]:
+    """Return the configured bar store, or None when the bar cache is disabled."""
+    cfg = load_cache_config()
+    if not cfg["bar_cache_enabled"]:
+        return None
+    path = Path(cfg["cache_dir"]) / "daily_bars.sqlite"
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = DailyBarStore(path)
+            _stores[path] = store
+    return store
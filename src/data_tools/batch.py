@@ -0,0 +1,56 @@
+"""Bounded concurrent fan-out for per-key vendor fetches."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from src.data_tools.config import load_http_config
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def fetch_many(
+    fn: Callable[[K], V],
+    keys: Iterable[K],
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[K, V], Dict[K, Exception]]:
+    """
+    Call ``fn`` once per distinct key under a single concurrency limit.
+
+    Duplicate keys are fetched once. A failing key is recorded in the error map
+    and never aborts the rest of the batch.
+
+    Args:
+        fn: Single-key fetcher (e.g. ``lambda t: get_price_snapshot(t, end_date)``).
+        keys: Keys to fetch; order of first appearance is preserved in the results.
+        max_workers: Concurrency limit; defaults to ``DATA_TOOLS_MAX_CONCURRENCY``.
+
+    Returns:
+        Tuple of (results by key, exception by key).
+    """
+    unique = list(dict.fromkeys(keys))
+    results: Dict[K, V] = {}
+    errors: Dict[K, Exception] = {}
+    if not unique:
+        return results, errors
+    limit = max_workers or int(load_http_config()["max_concurrency"])
+    limit = max(1, min(limit, len(unique)))
+    if limit == 1:
+        for key in unique:
+            try:
+                results[key] = fn(key)
+            except Exception as exc:
+                errors[key] = exc
+        return results, errors
+    with ThreadPoolExecutor(max_workers=limit) as pool:
+        futures = {pool.submit(fn, key): key for key in unique}
+        for fut in as_completed(futures):
+            key = futures[fut]
+            try:
+                results[key] = fut.result()
+            except Exception as exc:
+                errors[key] = exc
+    ordered = {key: results[key] for key in unique if key in results}
+    return ordered, errors
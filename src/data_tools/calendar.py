@@ -0,0 +1,158 @@
+"""NYSE trading calendar with a precomputed session bitmap for O(1) business-day arithmetic."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Set
+
+import numpy as np
+
+CALENDAR_START_YEAR = 1990
+CALENDAR_END_YEAR = 2060
+
+# Unscheduled full-day closures (national mourning, weather, 9/11).
+NYSE_SPECIAL_CLOSURES = {
+    date(1994, 4, 27),
+    date(2001, 9, 11),
+    date(2001, 9, 12),
+    date(2001, 9, 13),
+    date(2001, 9, 14),
+    date(2004, 6, 11),
+    date(2007, 1, 2),
+    date(2012, 10, 29),
+    date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+}
+
+
+def easter_sunday(year: int) -> date:
+    """Gregorian Easter (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based) weekday of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays move to Friday, Sunday holidays to Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> Set[date]:
+    """Full-day NYSE holidays for a year (observed dates)."""
+    holidays = set()
+    new_year = date(year, 1, 1)
+    # NYSE does not close on Friday Dec 31 when Jan 1 falls on a Saturday.
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    holidays.add(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+    holidays.add(easter_sunday(year) - timedelta(days=2))  # Good Friday
+    holidays.add(_nth_weekday(year, 5, 0, -1))  # Memorial Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.add(_observed(date(year, 7, 4)))
+    holidays.add(_nth_weekday(year, 9, 0, 1))  # Labor Day
+    holidays.add(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+    holidays.add(_observed(date(year, 12, 25)))
+    return {d for d in holidays if d.year == year}
+
+
+class TradingCalendar:
+    """
+    Session lookup over a fixed date range.
+
+    ``_is_session[i]`` says whether day ``start + i`` is a trading session and
+    ``_rank[i]`` counts sessions on or before it, so membership, session counts
+    and n-sessions-forward/back are array lookups rather than date loops.
+    """
+
+    def __init__(self, holidays: Iterable[date], start: date, end: date) -> None:
+        self.start = start
+        self.end = end
+        days = (end - start).days + 1
+        ordinals = np.arange(start.toordinal(), start.toordinal() + days)
+        # date.weekday() == (ordinal - 1) % 7
+        is_session = ((ordinals - 1) % 7) < 5
+        for holiday in holidays:
+            if start <= holiday <= end:
+                is_session[(holiday - start).days] = False
+        self._is_session = is_session
+        self._rank = np.cumsum(is_session, dtype=np.int64)
+        self._sessions = np.flatnonzero(is_session)
+
+    def _index(self, day: date) -> int:
+        if not (self.start <= day <= self.end):
+            raise ValueError(f"{day} is outside the trading calendar range {self.start}..{self.end}")
+        return (day - self.start).days
+
+    def _session_at(self, rank: int) -> date:
+        if rank < 1 or rank > len(self._sessions):
+            raise ValueError("Session arithmetic ran past the trading calendar range")
+        return self.start + timedelta(days=int(self._sessions[rank - 1]))
+
+    def covers(self, *days: date) -> bool:
+        """Whether every day falls inside the calendar range (other methods raise ValueError otherwise)."""
+        return all(self.start <= day <= self.end for day in days)
+
+    def is_session(self, day: date) -> bool:
+        return bool(self._is_session[self._index(day)])
+
+    def sessions_between(self, start: date, end: date) -> int:
+        """Sessions in (start, end]; negative when end < start."""
+        return int(self._rank[self._index(end)] - self._rank[self._index(start)])
+
+    def next_session(self, day: date, n: int = 1) -> date:
+        """n-th session strictly after ``day``."""
+        return self._session_at(int(self._rank[self._index(day)]) + n)
+
+    def previous_session(self, day: date, n: int = 1) -> date:
+        """n-th session strictly before ``day``."""
+        i = self._index(day)
+        return self._session_at(int(self._rank[i]) - int(self._is_session[i]) - n + 1)
+
+    def session_on_or_before(self, day: date) -> date:
+        return day if self.is_session(day) else self.previous_session(day)
+
+    def add_sessions(self, day: date, n: int) -> date:
+        """T+n: n sessions after ``day`` (or before, for negative n)."""
+        if n >= 0:
+            return self.next_session(day, n) if n else day
+        return self.previous_session(day, -n)
+
+    def sessions(self, start: date, end: date) -> List[date]:
+        """Sessions in [start, end], oldest first."""
+        lo, hi = self._index(start), self._index(end)
+        return [self.start + timedelta(days=int(i)) for i in self._sessions[(self._sessions >= lo) & (self._sessions <= hi)]]
+
+
+@lru_cache(maxsize=1)
+def get_calendar() -> TradingCalendar:
+    """The process-wide NYSE calendar."""
+    holidays: Set[date] = set(NYSE_SPECIAL_CLOSURES)
+    for year in range(CALENDAR_START_YEAR, CALENDAR_END_YEAR + 1):
+        holidays |= nyse_holidays(year)
+    return TradingCalendar(holidays, date(CALENDAR_START_YEAR, 1, 1), date(CALENDAR_END_YEAR, 12, 31))
@@ -0,0 +1,213 @@
+"""Record/replay transport for vendor HTTP calls: offline benchmarking with realistic latency and injected faults."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.data_tools.config import load_cassette_config
+
+# Query parameters that carry credentials; never part of a key or written to disk.
+_SECRET_PARAMS = frozenset({"apikey", "api_key", "access_token", "token", "key"})
+# Response headers worth replaying (content negotiation, throttling, revalidation).
+_KEPT_HEADERS = ("content-type", "retry-after", "etag", "last-modified", "cache-control")
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """Replay mode found no recorded response for a request."""
+
+
+def _query(url: str, params: Any) -> Tuple[str, List[Tuple[str, str]]]:
+    """(url without query, sorted non-secret query pairs) from the URL and params together."""
+    parts = urlsplit(url)
+    items = params.items() if isinstance(params, dict) else (params or [])
+    pairs = parse_qsl(parts.query, keep_blank_values=True) + [(str(k), str(v)) for k, v in items]
+    base = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    return base, sorted((k, v) for k, v in pairs if k.lower() not in _SECRET_PARAMS)
+
+
+def cassette_key(vendor: str, method: str, url: str, params: Any = None, body: Any = None) -> str:
+    """Content address of a request: sha256 over vendor, method, URL, query and JSON body (headers excluded)."""
+    base, query = _query(url, params)
+    canonical = json.dumps(
+        {"vendor": vendor, "method": method.upper(), "url": base, "query": query, "body": body},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CassetteTransport:
+    """
+    Process-wide record/replay store under ``<dir>/<vendor>/<key[:2]>/<key>.json``.
+
+    Record mode is passive: the session manager sends the real request and
+    hands the response here (streamed bodies are teed as the caller reads
+    them). Replay mode builds the response from disk after sleeping for the
+    configured (or recorded) latency, and fails a configurable fraction of
+    calls with ``error_status`` (or a timeout when it is 0).
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config = config
+        self.mode: str = config["mode"]
+        self.root = Path(config["dir"])
+        self._rng = random.Random(config.get("seed"))
+        self._lock = threading.Lock()
+        self._counts = {"recorded": 0, "replayed": 0, "misses": 0, "injected_errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def path_for(self, vendor: str, key: str) -> Path:
+        return self.root / vendor / key[:2] / f"{key}.json"
+
+    def record(
+        self,
+        vendor: str,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        response: Any,
+        elapsed_s: float,
+        content: Optional[bytes] = None,
+    ) -> Path:
+        """Write a live response (requests or httpx) to its content-addressed path; ``content`` overrides the body."""
+        key = cassette_key(vendor, method, url, params, body)
+        base, query = _query(url, params)
+        if content is None:
+            content = response.content or b""
+        try:
+            payload = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            payload = {"base64": base64.b64encode(content).decode("ascii")}
+        entry = {
+            "vendor": vendor,
+            "method": method.upper(),
+            "url": base,
+            "query": query,
+            "status_code": response.status_code,
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+            "elapsed_ms": round(elapsed_s * 1000, 3),
+            "recorded_at": time.time(),
+            **payload,
+        }
+        path = self.path_for(vendor, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+        self._count("recorded")
+        return path
+
+    def record_stream(
+        self, vendor: str, method: str, url: str, params: Any, body: Any, response: requests.Response, elapsed_s: float
+    ) -> None:
+        """
+        Tee a ``stream=True`` response into the cassette as the caller iterates it.
+
+        Reading ``response.content`` here would buffer the whole body before the
+        caller sees a byte, so the chunks are collected on their way through
+        ``iter_content`` and written once the body has been read to the end. A
+        stream closed early records nothing (a truncated body would replay wrong).
+        """
+        iter_content = response.iter_content
+        chunks: List[bytes] = []
+
+        def tee(chunk_size: Optional[int] = 1, decode_unicode: bool = False):
+            for chunk in iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode):
+                chunks.append(chunk.encode(response.encoding or "utf-8") if isinstance(chunk, str) else chunk)
+                yield chunk
+            self.record(vendor, method, url, params, body, response, elapsed_s, content=b"".join(chunks))
+
+        # Instance attribute shadows the method, so .content and iter_lines() go through the tee too.
+        response.iter_content = tee
+
+    def _plan(self, vendor: str, method: str, url: str, params: Any, body: Any) -> Tuple[Dict[str, Any], float, bool]:
+        """(entry, delay_s, inject_error) for a replayed request."""
+        path = self.path_for(vendor, cassette_key(vendor, method, url, params, body))
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._count("misses")
+            raise CassetteMissError(f"No cassette for {method.upper()} {_query(url, params)[0]} ({vendor}) at {path}")
+        latency_ms = self.config["latency_ms"]
+        if latency_ms is None:
+            latency_ms = float(entry.get("elapsed_ms", 0.0)) * self.config["latency_scale"]
+        with self._lock:
+            inject = self._rng.random() < self.config["error_rate"]
+        return entry, max(latency_ms, 0.0) / 1000.0, inject
+
+    def _outcome(self, entry: Dict[str, Any], inject: bool, delay_s: float) -> Tuple[int, Dict[str, str], bytes]:
+        if inject:
+            self._count("injected_errors")
+            status = self.config["error_status"]
+            if not status:
+                raise requests.exceptions.Timeout(f"Injected timeout after {delay_s * 1000:.0f}ms for {entry['url']}")
+            return status, {"content-type": "application/json"}, json.dumps({"error": "injected fault"}).encode()
+        self._count("replayed")
+        content = entry["text"].encode("utf-8") if "text" in entry else base64.b64decode(entry.get("base64", ""))
+        return int(entry["status_code"]), dict(entry.get("headers") or {}), content
+
+    def replay(self, vendor: str, method: str, url: str, params: Any = None, body: Any = None) -> requests.Response:
+        """Recorded response as a ``requests.Response`` after the injected latency."""
+        entry, delay_s, inject = self._plan(vendor, method, url, params, body)
+        if delay_s:
+            time.sleep(delay_s)
+        status, headers, content = self._outcome(entry, inject, delay_s)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        # Lets stream=True callers use iter_content() over the replayed body.
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = entry["url"]
+        response.elapsed = timedelta(seconds=delay_s)
+        return response
+
+    async def areplay(self, vendor: str, method: str, url: str, params: Any = None, body: Any = None) -> Any:
+        """Async variant of replay returning an ``httpx.Response``."""
+        import httpx
+
+        entry, delay_s, inject = self._plan(vendor, method, url, params, body)
+        if delay_s:
+            await asyncio.sleep(delay_s)
+        status, headers, content = self._outcome(entry, inject, delay_s)
+        return httpx.Response(status, headers=headers, content=content, request=httpx.Request(method.upper(), entry["url"]))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"mode": self.mode, "dir": str(self.root), **self._counts}
+
+
+_transport: Optional[CassetteTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[CassetteTransport]:
+    """The configured transport, or None when record/replay is off; rebuilt when settings change."""
+    global _transport
+    cfg = load_cassette_config()
+    if cfg["mode"] not in ("record", "replay"):
+        return None
+    with _transport_lock:
+        if _transport is None or _transport.config != cfg:
+            _transport = CassetteTransport(cfg)
+        return _transport
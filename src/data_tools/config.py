@@ -0,0 +1,287 @@
+"""
+Config loader for data_tools HTTP clients and caches.
+
+Each ``load_*_config`` parses the environment once and returns the same dict
+afterwards (treat it as read-only); call ``reset_config_cache`` after
+changing ``DATA_TOOLS_*`` variables in a running process.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+DEFAULTS = {
+    "pool_connections": 4,
+    "pool_maxsize": 16,
+    "pool_block": False,
+    "keep_alive": True,
+    "default_timeout_s": 10.0,
+    "max_concurrency": 8,
+    # Statement requests asking for at least this many entries are decoded from the
+    # response stream instead of buffering the whole body.
+    "stream_min_items": 40,
+    "stream_chunk_bytes": 65536,
+    # Longest matching path prefix wins; anything unmatched uses default_timeout_s.
+    "endpoint_timeouts": {
+        "/prices": 10.0,
+        "/company/facts": 10.0,
+        "/financials": 15.0,
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def load_http_config() -> Dict[str, Any]:
+    """Load HTTP pool settings with defaults and environment overrides."""
+    cfg = dict(DEFAULTS)
+    cfg["endpoint_timeouts"] = dict(DEFAULTS["endpoint_timeouts"])
+    cfg["pool_connections"] = int(os.getenv("DATA_TOOLS_POOL_CONNECTIONS", cfg["pool_connections"]))
+    cfg["pool_maxsize"] = int(os.getenv("DATA_TOOLS_POOL_MAXSIZE", cfg["pool_maxsize"]))
+    cfg["pool_block"] = str(os.getenv("DATA_TOOLS_POOL_BLOCK", cfg["pool_block"])).lower() in ("1", "true", "yes")
+    cfg["keep_alive"] = str(os.getenv("DATA_TOOLS_KEEP_ALIVE", cfg["keep_alive"])).lower() in ("1", "true", "yes")
+    cfg["default_timeout_s"] = float(os.getenv("DATA_TOOLS_TIMEOUT_S", cfg["default_timeout_s"]))
+    cfg["max_concurrency"] = int(os.getenv("DATA_TOOLS_MAX_CONCURRENCY", cfg["max_concurrency"]))
+    cfg["stream_min_items"] = int(os.getenv("DATA_TOOLS_STREAM_MIN_ITEMS", cfg["stream_min_items"]))
+    cfg["stream_chunk_bytes"] = int(os.getenv("DATA_TOOLS_STREAM_CHUNK_BYTES", cfg["stream_chunk_bytes"]))
+    # Format: "/prices=5,/financials=20"
+    overrides = os.getenv("DATA_TOOLS_ENDPOINT_TIMEOUTS")
+    if overrides:
+        for part in overrides.split(","):
+            if "=" not in part:
+                continue
+            prefix, value = part.split("=", 1)
+            try:
+                cfg["endpoint_timeouts"]["/" + prefix.strip().lstrip("/")] = float(value)
+            except ValueError:
+                continue
+    return cfg
+
+
+CACHE_DEFAULTS = {
+    "cache_dir": "data/cache",
+    "bar_cache_enabled": True,
+    "price_history_enabled": True,
+    # In-memory CompanyFacts cache: fresh for ttl, then served stale for up to
+    # max_stale while a background refresh runs. ttl 0 disables it.
+    "facts_ttl_s": 3600.0,
+    "facts_max_stale_s": 86400.0,
+    "facts_max_size": 4096,
+    "fundamentals_enabled": True,
+    # Minimum age before the fundamentals warehouse asks the vendor for newer statements.
+    "fundamentals_refresh_s": 86400.0,
+    # Persistent symbol -> CUSIP/ISIN/CIK cache for fmp_api identifier lookups.
+    "identifiers_enabled": True,
+    "identifiers_ttl_s": 7 * 86400.0,
+    # Age after which the on-disk SEC ticker/CIK index is revalidated with a conditional GET.
+    "sec_cik_revalidate_s": 86400.0,
+    # Wait after a failed revalidation before trying the SEC again; the stale index is served meanwhile.
+    "sec_cik_retry_s": 300.0,
+    # Content-addressed cache of parsed 10-K items used by qa_builder.
+    "filings_enabled": True,
+}
+
+
+@lru_cache(maxsize=1)
+def load_cache_config() -> Dict[str, Any]:
+    """Load on-disk cache settings with defaults and environment overrides."""
+    cfg = dict(CACHE_DEFAULTS)
+    cfg["cache_dir"] = os.getenv("DATA_TOOLS_CACHE_DIR", cfg["cache_dir"])
+    cfg["bar_cache_enabled"] = str(os.getenv("DATA_TOOLS_BAR_CACHE", cfg["bar_cache_enabled"])).lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    cfg["price_history_enabled"] = str(
+        os.getenv("DATA_TOOLS_PRICE_HISTORY", cfg["price_history_enabled"])
+    ).lower() in ("1", "true", "yes")
+    cfg["facts_ttl_s"] = float(os.getenv("DATA_TOOLS_FACTS_TTL_S", cfg["facts_ttl_s"]))
+    cfg["facts_max_stale_s"] = float(os.getenv("DATA_TOOLS_FACTS_MAX_STALE_S", cfg["facts_max_stale_s"]))
+    cfg["facts_max_size"] = int(os.getenv("DATA_TOOLS_FACTS_CACHE_SIZE", cfg["facts_max_size"]))
+    cfg["fundamentals_enabled"] = str(
+        os.getenv("DATA_TOOLS_FUNDAMENTALS_CACHE", cfg["fundamentals_enabled"])
+    ).lower() in ("1", "true", "yes")
+    cfg["fundamentals_refresh_s"] = float(os.getenv("DATA_TOOLS_FUNDAMENTALS_REFRESH_S", cfg["fundamentals_refresh_s"]))
+    cfg["identifiers_enabled"] = str(os.getenv("DATA_TOOLS_IDENTIFIER_CACHE", cfg["identifiers_enabled"])).lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    cfg["identifiers_ttl_s"] = float(os.getenv("DATA_TOOLS_IDENTIFIER_TTL_S", cfg["identifiers_ttl_s"]))
+    cfg["sec_cik_revalidate_s"] = float(os.getenv("DATA_TOOLS_SEC_CIK_REVALIDATE_S", cfg["sec_cik_revalidate_s"]))
+    cfg["sec_cik_retry_s"] = float(os.getenv("DATA_TOOLS_SEC_CIK_RETRY_S", cfg["sec_cik_retry_s"]))
+    cfg["filings_enabled"] = str(os.getenv("DATA_TOOLS_FILING_CACHE", cfg["filings_enabled"])).lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    return cfg
+
+
+RATE_LIMIT_DEFAULTS = {
+    "enabled": True,
+    # "thread": buckets shared by all threads of one process; "file": one bucket per
+    # vendor shared by every process on the host through a lock file in cache_dir.
+    "backend": "thread",
+    # Sustained requests per second; vendors not listed get adaptive concurrency only.
+    "vendor_rps": {
+        "financialdatasets": 20.0,
+        "fmp": 5.0,
+        "sec": 10.0,
+    },
+    # Bucket capacity as seconds of sustained rate (burst allowance).
+    "burst_s": 1.0,
+    "min_concurrency": 1,
+    # A call slower than this multiple of the vendor's EWMA latency counts as a spike.
+    "latency_spike_factor": 3.0,
+    "decrease_factor": 0.5,
+    # Pause applied on 429 when the vendor sends no Retry-After header.
+    "default_retry_after_s": 1.0,
+}
+
+
+@lru_cache(maxsize=1)
+def load_rate_limit_config() -> Dict[str, Any]:
+    """Load vendor rate-limit settings with defaults and environment overrides."""
+    cfg = dict(RATE_LIMIT_DEFAULTS)
+    cfg["vendor_rps"] = dict(RATE_LIMIT_DEFAULTS["vendor_rps"])
+    cfg["enabled"] = str(os.getenv("DATA_TOOLS_RATE_LIMIT", cfg["enabled"])).lower() in ("1", "true", "yes")
+    cfg["backend"] = os.getenv("DATA_TOOLS_RATE_LIMIT_BACKEND", cfg["backend"]).strip().lower()
+    cfg["burst_s"] = float(os.getenv("DATA_TOOLS_RATE_BURST_S", cfg["burst_s"]))
+    cfg["min_concurrency"] = int(os.getenv("DATA_TOOLS_MIN_CONCURRENCY", cfg["min_concurrency"]))
+    cfg["latency_spike_factor"] = float(os.getenv("DATA_TOOLS_LATENCY_SPIKE_FACTOR", cfg["latency_spike_factor"]))
+    # Format: "fmp=2,sec=10"
+    overrides = os.getenv("DATA_TOOLS_VENDOR_RPS")
+    if overrides:
+        for part in overrides.split(","):
+            if "=" not in part:
+                continue
+            vendor, value = part.split("=", 1)
+            try:
+                cfg["vendor_rps"][vendor.strip()] = float(value)
+            except ValueError:
+                continue
+    return cfg
+
+
+CASSETTE_DEFAULTS = {
+    # "off": live vendors; "record": live vendors + write each response to disk;
+    # "replay": serve from disk only (no network), missing entries raise.
+    "mode": "off",
+    # Defaults to <cache_dir>/cassettes.
+    "dir": None,
+    # Replay latency: fixed milliseconds if set, else the recorded latency x latency_scale.
+    "latency_ms": None,
+    "latency_scale": 1.0,
+    # Fraction of replayed calls that fail; error_status 0 raises a timeout instead of a response.
+    "error_rate": 0.0,
+    "error_status": 503,
+    "seed": None,
+}
+
+
+@lru_cache(maxsize=1)
+def load_cassette_config() -> Dict[str, Any]:
+    """Load vendor record/replay settings with defaults and environment overrides."""
+    cfg = dict(CASSETTE_DEFAULTS)
+    cfg["mode"] = os.getenv("DATA_TOOLS_CASSETTE_MODE", cfg["mode"]).strip().lower()
+    cfg["dir"] = os.getenv("DATA_TOOLS_CASSETTE_DIR") or os.path.join(load_cache_config()["cache_dir"], "cassettes")
+    latency = os.getenv("DATA_TOOLS_CASSETTE_LATENCY_MS")
+    cfg["latency_ms"] = float(latency) if latency not in (None, "") else None
+    cfg["latency_scale"] = float(os.getenv("DATA_TOOLS_CASSETTE_LATENCY_SCALE", cfg["latency_scale"]))
+    cfg["error_rate"] = float(os.getenv("DATA_TOOLS_CASSETTE_ERROR_RATE", cfg["error_rate"]))
+    cfg["error_status"] = int(os.getenv("DATA_TOOLS_CASSETTE_ERROR_STATUS", cfg["error_status"]))
+    seed = os.getenv("DATA_TOOLS_CASSETTE_SEED")
+    cfg["seed"] = int(seed) if seed not in (None, "") else None
+    return cfg
+
+
+RESILIENCE_DEFAULTS = {
+    # Circuit breakers: after failure_threshold consecutive failures (transport errors,
+    # timeouts, 5xx) an endpoint fails fast for reset_s, then lets one trial call through.
+    "breaker_enabled": True,
+    "breaker_failure_threshold": 5,
+    "breaker_reset_s": 30.0,
+    # Path prefixes that get their own breaker (longest match); other paths share the
+    # vendor-wide "*" breaker.
+    "breaker_endpoints": [
+        "/prices",
+        "/company/facts",
+        "/financials",
+        "/api/v3/profile",
+        "/api/v3/historical-price-full",
+        "/files",
+    ],
+    # Hedged GETs: when a call outlives the endpoint's recent latency quantile, send a
+    # duplicate and take whichever answers first. Off by default (doubles tail traffic).
+    "hedge_enabled": False,
+    "hedge_quantile": 0.95,
+    "hedge_min_samples": 20,
+    "hedge_min_delay_s": 0.05,
+    "latency_window": 200,
+}
+
+
+@lru_cache(maxsize=1)
+def load_resilience_config() -> Dict[str, Any]:
+    """Load circuit breaker and hedged-request settings with defaults and environment overrides."""
+    cfg = dict(RESILIENCE_DEFAULTS)
+    cfg["breaker_endpoints"] = list(RESILIENCE_DEFAULTS["breaker_endpoints"])
+    cfg["breaker_enabled"] = str(os.getenv("DATA_TOOLS_BREAKER", cfg["breaker_enabled"])).lower() in ("1", "true", "yes")
+    cfg["breaker_failure_threshold"] = int(os.getenv("DATA_TOOLS_BREAKER_FAILURES", cfg["breaker_failure_threshold"]))
+    cfg["breaker_reset_s"] = float(os.getenv("DATA_TOOLS_BREAKER_RESET_S", cfg["breaker_reset_s"]))
+    cfg["hedge_enabled"] = str(os.getenv("DATA_TOOLS_HEDGE", cfg["hedge_enabled"])).lower() in ("1", "true", "yes")
+    cfg["hedge_quantile"] = float(os.getenv("DATA_TOOLS_HEDGE_QUANTILE", cfg["hedge_quantile"]))
+    cfg["hedge_min_samples"] = int(os.getenv("DATA_TOOLS_HEDGE_MIN_SAMPLES", cfg["hedge_min_samples"]))
+    cfg["hedge_min_delay_s"] = float(os.getenv("DATA_TOOLS_HEDGE_MIN_DELAY_S", cfg["hedge_min_delay_s"]))
+    return cfg
+
+
+ROUTING_DEFAULTS = {
+    # Vendors that can serve price lookups, in tie-break priority order. Vendors
+    # without credentials are skipped.
+    "price_vendors": ["financialdatasets", "fmp"],
+    # Rolling health per vendor: the last `window` calls no older than `window_s`.
+    "window": 50,
+    "window_s": 300.0,
+    # Vendors with fewer recent calls are probed before ranked ones so stale
+    # rankings correct themselves.
+    "min_samples": 3,
+    # Vendors above this recent error rate are tried only after healthy ones.
+    "max_error_rate": 0.5,
+}
+
+
+@lru_cache(maxsize=1)
+def load_routing_config() -> Dict[str, Any]:
+    """Load multi-vendor routing settings with defaults and environment overrides."""
+    cfg = dict(ROUTING_DEFAULTS)
+    # Format: "financialdatasets,fmp"
+    vendors = os.getenv("DATA_TOOLS_PRICE_VENDORS")
+    cfg["price_vendors"] = (
+        [v.strip() for v in vendors.split(",") if v.strip()] if vendors else list(ROUTING_DEFAULTS["price_vendors"])
+    )
+    cfg["window"] = int(os.getenv("DATA_TOOLS_ROUTING_WINDOW", cfg["window"]))
+    cfg["window_s"] = float(os.getenv("DATA_TOOLS_ROUTING_WINDOW_S", cfg["window_s"]))
+    cfg["min_samples"] = int(os.getenv("DATA_TOOLS_ROUTING_MIN_SAMPLES", cfg["min_samples"]))
+    cfg["max_error_rate"] = float(os.getenv("DATA_TOOLS_ROUTING_MAX_ERROR_RATE", cfg["max_error_rate"]))
+    return cfg
+
+
+def reset_config_cache() -> None:
+    """Re-read the environment on the next ``load_*_config`` call (tests and config reloads)."""
+    for loader in (
+        load_http_config,
+        load_cache_config,
+        load_rate_limit_config,
+        load_cassette_config,
+        load_resilience_config,
+        load_routing_config,
+    ):
+        loader.cache_clear()
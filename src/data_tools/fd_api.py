@@ -1,12 +1,24 @@
 """FinancialDatasets.ai client for basic equity snapshots."""
 
+import asyncio
 import os
+import time
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
 
+from src.data_tools.analytics import snapshot_metrics
+from src.data_tools.bar_store import DailyBarStore, get_bar_store
+from src.data_tools.batch import fetch_many
+from src.data_tools.calendar import get_calendar
+from src.data_tools.config import load_cache_config, load_http_config
+from src.data_tools.fundamentals_store import FundamentalsStore, get_fundamentals_store
+from src.data_tools.http_client import get_async_client_manager, get_session_manager
+from src.data_tools.json_stream import iter_json_array
+from src.data_tools.price_history import get_price_history
+from src.data_tools.records import EquityRecord, PriceRecord
 from src.data_tools.schemas import (
     BalanceSheet,
     CashFlowStatement,
@@ -15,11 +27,23 @@ from src.data_tools.schemas import (
     IncomeStatement,
     PriceSnapshot,
 )
+from src.data_tools.singleflight import get_singleflight, request_key
+from src.data_tools.statement_parser import (
+    parse_balance_sheets,
+    parse_cash_flow_statements,
+    parse_income_statements,
+)
+from src.data_tools.ttl_cache import TTLCache, get_ttl_cache
 
 # Load environment variables
 load_dotenv()
 
 BASE_URL = "https://api.financialdatasets.ai"
+VENDOR = "financialdatasets"
+PRICE_WINDOW_SESSIONS = 6  # latest close plus five prior sessions for the 5D return
+# Extra sessions requested so a missing latest bar (vendor not yet published)
+# or zero-volume days inside the window still leave six usable closes.
+PRICE_WINDOW_SLACK_SESSIONS = 4
 
 
 def _get_api_key() -> str:
@@ -38,13 +62,150 @@ def _get_headers() -> Dict[str, str]:
     return {"X-API-KEY": _get_api_key()}
 
 
-def get_price_snapshot(ticker: str, end_date: date) -> PriceSnapshot:
+def _http_get(url: str, **kwargs) -> requests.Response:
     """
-    Fetch close, 1D, and 5D returns ending on end_date.
+    GET through the shared keep-alive session; timeouts come from the per-endpoint config.
 
-    IMPORTANT ASSUMPTION: No corporate-action adjustments (splits/dividends/etc.); returns are raw ratios on provided closes.
-    IMPORTANT ASSUMPTION: Trading-calendar awareness is absent; requests pull a window and infer trading days from nonzero-volume records.
+    Concurrent calls for the same (url, params) are coalesced into one request
+    whose body is read once and shared by every waiting caller.
+    """
+    def fetch() -> requests.Response:
+        response = get_session_manager(VENDOR).get(url, **kwargs)
+        response.content  # read the body once so followers can parse it concurrently
+        return response
+
+    return get_singleflight(VENDOR).do(request_key(url, kwargs.get("params")), fetch)
+
+
+def _http_stream(url: str, error_message: str, keys: Optional[Iterable[str]] = None, **kwargs) -> Iterator[Any]:
+    """
+    GET a JSON array payload and yield its elements while the body is still downloading.
+
+    Only the element being decoded is buffered. Streams are not coalesced:
+    each caller owns its connection until the generator finishes or is closed.
+    """
+    response = get_session_manager(VENDOR).get(url, stream=True, **kwargs)
+    try:
+        _raise_for_status(response, error_message)
+        chunk_bytes = int(load_http_config()["stream_chunk_bytes"])
+        yield from iter_json_array(response.iter_content(chunk_size=chunk_bytes), keys)
+    finally:
+        response.close()
+
+
+
+def _price_request(ticker: str, start: date, end: date) -> Tuple[str, Dict]:
+    """URL and query params for daily bars over [start, end]."""
+    params = {
+        "ticker": ticker,
+        "interval": "day",
+        "interval_multiplier": 1,
+        "start_date": start.strftime("%Y-%m-%d"),
+        "end_date": end.strftime("%Y-%m-%d"),
+        "limit": max((end - start).days + 1, 1),
+    }
+    return f"{BASE_URL}/prices", params
+
+
+def _parse_price_bars(prices_response, ticker: str, end: date) -> List[Dict]:
+    """Check a /prices response (requests or httpx) and return [{date, close, volume}] in vendor order."""
+    date_str = end.strftime("%Y-%m-%d")
+
+    # Check for API errors (non-200 status codes)
+    if prices_response.status_code != 200:
+        error_msg = f"API returned status {prices_response.status_code}"
+        try:
+            error_data = prices_response.json()
+            if "message" in error_data:
+                error_msg = error_data["message"]
+            elif "error" in error_data:
+                error_msg = error_data["error"]
+        except:
+            error_msg = prices_response.text or error_msg
+        raise requests.exceptions.RequestException(
+            f"Failed to fetch prices from FinancialDatasets.ai API for {ticker} "
+            f"on date {date_str}: {error_msg}"
+        )
+
+    prices_data = prices_response.json()
+
+    if isinstance(prices_data, dict) and "prices" in prices_data:
+        price_list = prices_data["prices"]
+    elif isinstance(prices_data, list):
+        price_list = prices_data
+    else:
+        price_list = []
+
+    bars = []
+    for price_item in price_list:
+        bar = _price_bar(price_item)
+        if bar is not None:
+            bars.append(bar)
+    return bars
+
+
+def _price_bar(price_item: Any) -> Optional[Dict]:
+    """{date, close, volume} from one vendor price row, or None if it has no close/date."""
+    if isinstance(price_item, dict):
+        close = price_item.get("close")
+        bar_date = price_item.get("date") or price_item.get("as_of_date")
+        if close is not None and bar_date:
+            return {"date": str(bar_date)[:10], "close": float(close), "volume": price_item.get("volume", 0)}
+    return None
+
+
+def _fetch_price_bars(ticker: str, start: date, end: date, headers: Dict[str, str]) -> List[Dict]:
+    """GET daily bars for [start, end]; return [{date, close, volume}] in vendor order."""
+    url, params = _price_request(ticker, start, end)
+    return _parse_price_bars(_http_get(url, headers=headers, params=params), ticker, end)
+
+
+def _missing_bar_start(store: DailyBarStore, ticker: str, window_start: date, end_date: date) -> Optional[date]:
+    """First day of [window_start, end_date] the bar store has not fetched yet; None if fully cached."""
+    coverage = store.coverage(ticker)
+    if coverage is None:
+        return window_start
+    covered_start, covered_end = coverage
+    if covered_start > window_start:
+        return window_start
+    if covered_end >= end_date:
+        return None
+    return max(covered_end + timedelta(days=1), window_start)
+
+
+def _history_bars(ticker: str, window_start: date, end_date: date) -> Optional[List[Dict]]:
+    """Bars from the memory-mapped price history when it fully covers the window, else None."""
+    history = get_price_history()
+    return history.bars(ticker, window_start, end_date) if history is not None else None
+
+
+def _covered_through(start: date, end: date, last_bar: Optional[str]) -> Optional[date]:
     """
+    Last day of [start, end] whose bars are known complete after a fetch, or None.
+
+    Today's bar may still change, so coverage stops at yesterday. If the vendor
+    did not return the last session before that (e.g. it has not published
+    yesterday's bar yet), coverage stops at the last bar it did return so the
+    missing session is fetched again next time.
+    """
+    through = min(end, date.today() - timedelta(days=1))
+    if through < start:
+        return None
+    expected = get_calendar().session_on_or_before(through)
+    if expected < start or (last_bar is not None and last_bar >= expected.isoformat()):
+        return through
+    return date.fromisoformat(last_bar) if last_bar else None
+
+
+def _price_window_start(end_date: date) -> date:
+    """First day of the PRICE_WINDOW_SESSIONS + PRICE_WINDOW_SLACK_SESSIONS window ending on or before end_date."""
+    calendar = get_calendar()
+    sessions_back = PRICE_WINDOW_SESSIONS + PRICE_WINDOW_SLACK_SESSIONS - 1
+    return calendar.previous_session(calendar.session_on_or_before(end_date), sessions_back)
+
+
+def _plan_price_snapshot(ticker: str, end_date: date) -> Tuple[str, date, Optional[DailyBarStore], Optional[date]]:
+    """Validate inputs and return (ticker, window_start, store, fetch_start); fetch_start is None when fully cached."""
     if not ticker or not isinstance(ticker, str):
         raise ValueError("Ticker must be a non-empty string")
     
@@ -52,99 +213,70 @@ def get_price_snapshot(ticker: str, end_date: date) -> PriceSnapshot:
         raise ValueError("end_date must be a date object")
     
     ticker = ticker.upper().strip()
-    headers = _get_headers()
-    
+    window_start = _price_window_start(end_date)
+    store = get_bar_store()
+    fetch_start = _missing_bar_start(store, ticker, window_start, end_date) if store else window_start
+    return ticker, window_start, store, fetch_start
+
+
+def _build_price_record(
+    ticker: str,
+    end_date: date,
+    window_start: date,
+    store: Optional[DailyBarStore],
+    fetch_start: Optional[date],
+    bars: List[Dict],
+) -> PriceRecord:
+    """Persist freshly fetched bars, read the window back and compute close/1D/5D returns."""
     date_str = end_date.strftime("%Y-%m-%d")
-    
-    snapshot = {"ticker": ticker, "source": "financialdatasets.ai"}
+
+    if store:
+        if fetch_start is not None:
+            last_bar = max((b["date"] for b in bars if b["date"] <= date_str), default=None)
+            store.save(ticker, bars, fetch_start, _covered_through(fetch_start, end_date, last_bar))
+        bars = store.get_bars(ticker, window_start, end_date)
+
+    return PriceRecord.from_bars(ticker, bars, date_str)
+
+
+def get_price_snapshot(ticker: str, end_date: date) -> PriceSnapshot:
+    """
+    Fetch close, 1D, and 5D returns ending on end_date as a validated PriceSnapshot.
+
+    See get_price_record for sourcing; internal pipelines use the record directly.
+    """
+    return get_price_record(ticker, end_date).to_model()
+
+
+def get_price_record(ticker: str, end_date: date) -> PriceRecord:
+    """
+    Fetch close, 1D, and 5D returns ending on end_date.
+
+    Bars come from the memory-mapped price history when it covers the window
+    (see price_history.py), otherwise from the local daily-bar store (see
+    bar_store.py); only the trailing days not yet fetched are requested from
+    the API and persisted. Days up to yesterday are marked as covered once the
+    vendor has returned their bars, so repeating a run for a past date makes
+    no network calls.
+
+    IMPORTANT ASSUMPTION: No corporate-action adjustments (splits/dividends/etc.); returns are raw ratios on provided closes.
+    The window spans PRICE_WINDOW_SESSIONS exchange sessions (see calendar.py)
+    plus PRICE_WINDOW_SLACK_SESSIONS of slack, so a latest bar the vendor has
+    not published yet or a zero-volume day does not leave fewer than six closes.
+    Trading days are still inferred from nonzero-volume records within it.
+    """
+    ticker, window_start, store, fetch_start = _plan_price_snapshot(ticker, end_date)
+    date_str = end_date.strftime("%Y-%m-%d")
+    history_bars = _history_bars(ticker, window_start, end_date)
+    if history_bars is not None:
+        store, fetch_start = None, None
+    headers = _get_headers() if fetch_start is not None else {}
     
     try:
-        days_to_request = 10
-        
-        start_date_obj = end_date - timedelta(days=days_to_request)
-        start_date_str = start_date_obj.strftime("%Y-%m-%d")
-        
-        prices_url = f"{BASE_URL}/prices"
-        prices_params = {
-            "ticker": ticker,
-            "interval": "day",
-            "interval_multiplier": 1,
-            "start_date": start_date_str,
-            "end_date": date_str,
-            "limit": days_to_request
-        }
-        
-        prices_response = requests.get(
-            prices_url,
-            headers=headers,
-            params=prices_params,
-            timeout=10
-        )
-        
-        # Check for API errors (non-200 status codes)
-        if prices_response.status_code != 200:
-            error_msg = f"API returned status {prices_response.status_code}"
-            try:
-                error_data = prices_response.json()
-                if "message" in error_data:
-                    error_msg = error_data["message"]
-                elif "error" in error_data:
-                    error_msg = error_data["error"]
-            except:
-                error_msg = prices_response.text or error_msg
-            raise requests.exceptions.RequestException(
-                f"Failed to fetch prices from FinancialDatasets.ai API for {ticker} "
-                f"on date {date_str}: {error_msg}"
-            )
-        
-        prices_data = prices_response.json()
-        
-        if isinstance(prices_data, dict) and "prices" in prices_data:
-            price_list = prices_data["prices"]
-        elif isinstance(prices_data, list):
-            price_list = prices_data
-        else:
-            price_list = []
-        
-        price_points = []
-        for price_item in price_list:
-            if isinstance(price_item, dict):
-                volume = price_item.get("volume", 0)
-                close = price_item.get("close")
-                if close is not None and volume and volume > 0:
-                    price_points.append(
-                        {
-                            "close": float(close),
-                            "date": price_item.get("date") or price_item.get("as_of_date"),
-                        }
-                    )
-
-        if not price_points:
-            raise ValueError(
-                f"Could not retrieve price data for ticker {ticker} on date {date_str}. "
-                f"API may not have data for this ticker/date."
-            )
-
-        closes = [p["close"] for p in price_points]
-        price = closes[-1]
-        snapshot["price"] = price
-        snapshot["date"] = price_points[-1]["date"] or date_str
-
-        if len(closes) < 2:
-            raise ValueError(f"Insufficient data to compute 1D return for {ticker} ending {snapshot['date']}")
-        prev_price = closes[-2]
-        if prev_price <= 0:
-            raise ValueError(f"Invalid previous price for 1D return for {ticker} ending {snapshot['date']}")
-        snapshot["return_1d"] = price / prev_price
-
-        if len(closes) < 6:
-            raise ValueError(f"Insufficient data to compute 5D return for {ticker} ending {snapshot['date']}")
-        price_5d_ago = closes[-6]
-        if price_5d_ago <= 0:
-            raise ValueError(f"Invalid historical price for 5D return for {ticker} ending {snapshot['date']}")
-        snapshot["return_5d"] = price / price_5d_ago
-
-        return PriceSnapshot(**snapshot)
+        bars: List[Dict] = history_bars or []
+        if fetch_start is not None:
+            bars = _fetch_price_bars(ticker, fetch_start, end_date, headers)
+        return _build_price_record(ticker, end_date, window_start, store, fetch_start, bars)
         
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(
@@ -157,56 +289,171 @@ def get_price_snapshot(ticker: str, end_date: date) -> PriceSnapshot:
         ) from e
 
 
-def get_company_facts(ticker: str) -> CompanyFacts:
-    """Fetch current market cap/sector/industry; raise on missing or failed data."""
-    if not ticker or not isinstance(ticker, str):
-        raise ValueError("Ticker must be a non-empty string")
-    
-    ticker = ticker.upper().strip()
+def get_price_snapshots(
+    tickers: Iterable[str],
+    end_date: date,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, PriceSnapshot], Dict[str, Exception]]:
+    """Validated-model variant of get_price_records."""
+    records, errors = get_price_records(tickers, end_date, max_workers=max_workers)
+    return {symbol: record.to_model() for symbol, record in records.items()}, errors
+
+
+def get_price_records(
+    tickers: Iterable[str],
+    end_date: date,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, PriceRecord], Dict[str, Exception]]:
+    """
+    Fetch price records for many tickers concurrently.
+
+    Tickers are upper-cased and de-duplicated, then fetched with at most
+    ``max_workers`` requests in flight (default ``DATA_TOOLS_MAX_CONCURRENCY``).
+    A failing ticker never fails the batch; its exception is returned instead.
+
+    Args:
+        tickers: Ticker symbols; duplicates and case variants are fetched once.
+        end_date: End date applied to every ticker (see get_price_record).
+        max_workers: Optional concurrency limit override.
+
+    Returns:
+        Tuple of (PriceRecord by ticker, exception by ticker).
+    """
+    if not isinstance(end_date, date):
+        raise ValueError("end_date must be a date object")
+
+    symbols: List[str] = []
+    invalid: Dict[str, Exception] = {}
+    for ticker in tickers:
+        if not ticker or not isinstance(ticker, str) or not ticker.strip():
+            invalid[str(ticker)] = ValueError("Ticker must be a non-empty string")
+            continue
+        symbols.append(ticker.upper().strip())
+
+    snapshots, errors = fetch_many(
+        lambda symbol: get_price_record(symbol, end_date),
+        symbols,
+        max_workers=max_workers,
+    )
+    errors.update(invalid)
+    return snapshots, errors
+
+
+def backfill_price_bars(
+    tickers: Iterable[str],
+    start: date,
+    end: date,
+    batch_size: int = 500,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, int], Dict[str, Exception]]:
+    """
+    Load long daily-bar ranges for many tickers into the bar store.
+
+    Each ticker's /prices response is decoded as a stream and written in
+    batches of ``batch_size`` bars while the rest is still downloading, so a
+    multi-year range never sits in memory as one body. Coverage is recorded only
+    after the whole range has arrived. Tickers run concurrently via fetch_many.
+
+    Returns:
+        Tuple of (bars stored by ticker, exception by ticker).
+    """
+    store = get_bar_store()
+    if store is None:
+        raise ValueError("Bar cache is disabled (DATA_TOOLS_BAR_CACHE=0); nothing to backfill into")
+    if not isinstance(start, date) or not isinstance(end, date) or start > end:
+        raise ValueError("start and end must be dates with start <= end")
     headers = _get_headers()
-    
+
+    def backfill(ticker: str) -> int:
+        url, params = _price_request(ticker, start, end)
+        message = f"Failed to fetch prices from FinancialDatasets.ai API for {ticker} from {start} to {end}"
+        batch: List[Dict] = []
+        stored = 0
+        last_bar: Optional[str] = None
+        for item in _http_stream(url, message, keys=("prices",), headers=headers, params=params):
+            bar = _price_bar(item)
+            if bar is None or bar["date"] > end.isoformat():
+                continue
+            last_bar = max(last_bar or bar["date"], bar["date"])
+            batch.append(bar)
+            if len(batch) >= batch_size:
+                store.save(ticker, batch, start, None)
+                stored += len(batch)
+                batch = []
+        store.save(ticker, batch, start, _covered_through(start, end, last_bar))
+        return stored + len(batch)
+
+    symbols = [t.upper().strip() for t in tickers if isinstance(t, str) and t.strip()]
+    return fetch_many(backfill, symbols, max_workers=max_workers)
+
+
+def _raise_for_status(response, message: str) -> None:
+    """Raise RequestException with the vendor's message/error text on a non-200 response."""
+    if response.status_code != 200:
+        error_msg = response.text or f"status {response.status_code}"
+        try:
+            error_data = response.json()
+            error_msg = error_data.get("message") or error_data.get("error") or error_msg
+        except Exception:
+            pass
+        raise requests.exceptions.RequestException(f"{message}: {error_msg}")
+
+
+def _parse_company_facts(company_response, ticker: str) -> CompanyFacts:
+    """Check a /company/facts response (requests or httpx) and build CompanyFacts."""
     facts = {
         "ticker": ticker,
         "source": "financialdatasets.ai"
     }
+    _raise_for_status(company_response, f"Failed to fetch company facts for {ticker}")
+
+    company_data = company_response.json()
+    if isinstance(company_data, dict) and "company_facts" in company_data:
+        company_facts = company_data["company_facts"]
+        if "sector" in company_facts:
+            facts["sector"] = str(company_facts["sector"])
+        if "industry" in company_facts:
+            facts["industry"] = str(company_facts.get("industry", ""))
+        if "market_cap" in company_facts:
+            facts["market_cap"] = float(company_facts["market_cap"])
+
+    missing = [field for field in ("market_cap", "sector") if field not in facts]
+    if missing:
+        raise ValueError(f"Company facts incomplete for {ticker}: missing {', '.join(missing)}")
+
+    return CompanyFacts(**facts)
+
+
+def _company_facts_cache() -> TTLCache:
+    cfg = load_cache_config()
+    return get_ttl_cache("company_facts", cfg["facts_ttl_s"], cfg["facts_max_stale_s"], cfg["facts_max_size"])
+
+
+def get_company_facts(ticker: str) -> CompanyFacts:
+    """
+    Fetch current market cap/sector/industry; raise on missing or failed data.
+
+    Results are kept in a process-wide TTL cache (see ttl_cache.py): stale
+    entries are returned immediately and refreshed in the background.
+    """
+    if not ticker or not isinstance(ticker, str):
+        raise ValueError("Ticker must be a non-empty string")
+
+    ticker = ticker.upper().strip()
+    return _company_facts_cache().get_or_load(ticker, lambda: _fetch_company_facts(ticker))
+
+
+def _fetch_company_facts(ticker: str) -> CompanyFacts:
+    headers = _get_headers()
     
     try:
         # Get company facts (current data, no explicit dates)
-        company_url = f"{BASE_URL}/company/facts"
-        company_params = {"ticker": ticker}
-        company_response = requests.get(
-            company_url,
+        company_response = _http_get(
+            f"{BASE_URL}/company/facts",
             headers=headers,
-            params=company_params,
-            timeout=10
+            params={"ticker": ticker},
         )
-        
-        if company_response.status_code != 200:
-            error_msg = company_response.text or f"status {company_response.status_code}"
-            try:
-                error_data = company_response.json()
-                error_msg = error_data.get("message") or error_data.get("error") or error_msg
-            except Exception:
-                pass
-            raise requests.exceptions.RequestException(
-                f"Failed to fetch company facts for {ticker}: {error_msg}"
-            )
-
-        company_data = company_response.json()
-        if isinstance(company_data, dict) and "company_facts" in company_data:
-            company_facts = company_data["company_facts"]
-            if "sector" in company_facts:
-                facts["sector"] = str(company_facts["sector"])
-            if "industry" in company_facts:
-                facts["industry"] = str(company_facts.get("industry", ""))
-            if "market_cap" in company_facts:
-                facts["market_cap"] = float(company_facts["market_cap"])
-
-        missing = [field for field in ("market_cap", "sector") if field not in facts]
-        if missing:
-            raise ValueError(f"Company facts incomplete for {ticker}: missing {', '.join(missing)}")
-
-        return CompanyFacts(**facts)
+        return _parse_company_facts(company_response, ticker)
         
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(
@@ -218,6 +465,43 @@ def get_company_facts(ticker: str) -> CompanyFacts:
         ) from e
 
 
+def _statement_request(endpoint: str, ticker: str, years: int, period: str) -> Tuple[str, str, Dict]:
+    """Validate statement arguments and return (symbol, url, params) for /financials/<endpoint>."""
+    if not ticker or not isinstance(ticker, str):
+        raise ValueError("Ticker must be a non-empty string")
+    if years <= 0:
+        raise ValueError("years must be a positive integer")
+
+    symbol = ticker.upper().strip()
+    params = {
+        "ticker": symbol,
+        "limit": years,
+        "period": period,
+    }
+    return symbol, f"{BASE_URL}/financials/{endpoint}", params
+
+
+def _statement_entries(payload, keys: Tuple[str, ...]) -> Optional[List]:
+    """Pull the statement list out of a /financials payload; the list key varies by endpoint."""
+    if isinstance(payload, list):
+        return payload
+    if not isinstance(payload, dict):
+        return None
+    statements = None
+    for key in keys:
+        statements = payload.get(key)
+        if statements:
+            break
+    if statements is None and "results" in payload:
+        statements = payload["results"]
+    if statements is None:
+        for value in payload.values():
+            if isinstance(value, list) and value:
+                statements = value
+                break
+    return statements
+
+
 def get_income_statements(
     ticker: str,
     years: int = 4,
@@ -234,121 +518,7 @@ def get_income_statements(
     Returns:
         List of dicts (newest first) with income statement fields.
     """
-    if not ticker or not isinstance(ticker, str):
-        raise ValueError("Ticker must be a non-empty string")
-    if years <= 0:
-        raise ValueError("years must be a positive integer")
-
-    symbol = ticker.upper().strip()
-    headers = _get_headers()
-    url = f"{BASE_URL}/financials/income-statements"
-    params = {
-        "ticker": symbol,
-        "limit": years,
-        "period": period,
-    }
-
-    response = requests.get(url, headers=headers, params=params, timeout=10)
-    if response.status_code != 200:
-        error_msg = response.text or f"status {response.status_code}"
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("message") or error_data.get("error") or error_msg
-        except Exception:
-            pass
-        raise requests.exceptions.RequestException(
-            f"Failed to fetch income statements for {symbol}: {error_msg}"
-        )
-
-    payload = response.json()
-    if isinstance(payload, dict):
-        statements = payload.get("financials") or payload.get("data") or payload.get("items")
-        if statements is None and "results" in payload:
-            statements = payload["results"]
-        if statements is None:
-            for value in payload.values():
-                if isinstance(value, list) and value:
-                    statements = value
-                    break
-    elif isinstance(payload, list):
-        statements = payload
-    else:
-        statements = None
-
-    if not statements:
-        raise ValueError(f"No income statements returned for {symbol}")
-
-    normalized: List[IncomeStatement] = []
-    for entry in statements:
-        if not isinstance(entry, dict):
-            continue
-        
-        # Helper function to try multiple field name variations (case-insensitive)
-        def get_field(*field_names):
-            for name in field_names:
-                # Try exact match first
-                value = entry.get(name)
-                if value is not None:
-                    return value
-                # Try case-insensitive match
-                for key in entry.keys():
-                    if isinstance(key, str) and key.lower() == name.lower():
-                        return entry[key]
-            return None
-        
-        # Extract fields with multiple fallback names
-        fiscal_year = get_field(
-            "fiscalYear", "fiscal_year", "calendarYear", "calendar_year", 
-            "year", "fiscalYearEnd", "fiscal_year_end"
-        )
-        # Try to extract year from date string if fiscal_year is None
-        if fiscal_year is None:
-            date_str = get_field("date", "reportDate", "report_date", "filingDate", "filing_date")
-            if date_str and isinstance(date_str, str):
-                try:
-                    # Try to extract year from YYYY-MM-DD format
-                    fiscal_year = int(date_str.split("-")[0])
-                except (ValueError, AttributeError):
-                    pass
-        
-        operating_income = get_field(
-            "operatingIncome", "operating_income", "operatingIncomeLoss", 
-            "operating_income_loss", "operatingProfit", "operating_profit",
-            "ebit", "EBIT"
-        )
-        
-        net_income = get_field(
-            "netIncome", "net_income", "netIncomeLoss", "net_income_loss",
-            "netIncomeApplicableToCommonShares", "net_income_applicable_to_common_shares",
-            "netEarnings", "net_earnings", "profit", "netProfit", "net_profit"
-        )
-        
-        diluted_eps = get_field(
-            "dilutedEPS", "diluted_eps", "epsDiluted", "eps_diluted",
-            "earningsPerShareDiluted", "earnings_per_share_diluted",
-            "eps", "EPS"
-        )
-        
-        model = IncomeStatement(
-            ticker=entry.get("ticker") or entry.get("symbol") or symbol,
-            period=str(entry.get("period") or entry.get("reportType") or entry.get("report_type") or period),
-            fiscal_year=int(fiscal_year) if fiscal_year is not None else None,
-            fiscal_period=get_field("fiscalPeriod", "fiscal_period", "quarter", "fiscalQuarter", "fiscal_quarter"),
-            total_revenue=get_field("totalRevenue", "total_revenue", "revenue", "sales", "netSales", "net_sales"),
-            cost_of_revenue=get_field("costOfRevenue", "cost_of_revenue", "costOfSales", "cost_of_sales", "cogs", "COGS"),
-            gross_profit=get_field("grossProfit", "gross_profit", "grossIncome", "gross_income"),
-            operating_income=operating_income,
-            net_income=net_income,
-            diluted_eps=diluted_eps,
-            currency=get_field("currency", "reportedCurrency", "reported_currency", "currencyCode", "currency_code"),
-            raw=entry,
-        )
-        normalized.append(model)
-
-    if not normalized:
-        raise ValueError(f"Unable to parse income statements for {symbol}")
-
-    return normalized[:years]
+    return _get_statements("income-statements", ticker, years, period)
 
 
 def get_balance_sheets(
@@ -372,151 +542,7 @@ def get_balance_sheets(
     Returns:
         List of BalanceSheet objects (newest first) with assets, liabilities, equity, and calculated risk metrics.
     """
-    if not ticker or not isinstance(ticker, str):
-        raise ValueError("Ticker must be a non-empty string")
-    if years <= 0:
-        raise ValueError("years must be a positive integer")
-
-    symbol = ticker.upper().strip()
-    headers = _get_headers()
-    url = f"{BASE_URL}/financials/balance-sheets"
-    params = {
-        "ticker": symbol,
-        "limit": years,
-        "period": period,
-    }
-
-    response = requests.get(url, headers=headers, params=params, timeout=10)
-    if response.status_code != 200:
-        error_msg = response.text or f"status {response.status_code}"
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("message") or error_data.get("error") or error_msg
-        except Exception:
-            pass
-        raise requests.exceptions.RequestException(
-            f"Failed to fetch balance sheets for {symbol}: {error_msg}"
-        )
-
-    payload = response.json()
-    # FinancialDatasets.ai returns balance_sheets array directly in response
-    # See: https://docs.financialdatasets.ai/api-reference/endpoint/financials/balance-sheets
-    if isinstance(payload, dict):
-        statements = payload.get("balance_sheets") or payload.get("financials") or payload.get("data") or payload.get("items")
-        if statements is None and "results" in payload:
-            statements = payload["results"]
-        if statements is None:
-            for value in payload.values():
-                if isinstance(value, list) and value:
-                    statements = value
-                    break
-    elif isinstance(payload, list):
-        statements = payload
-    else:
-        statements = None
-
-    if not statements:
-        raise ValueError(f"No balance sheets returned for {symbol}")
-
-    normalized: List[BalanceSheet] = []
-    for entry in statements:
-        if not isinstance(entry, dict):
-            continue
-        
-        # Helper function to try multiple field name variations (case-insensitive)
-        # If fields are still null, check entry.keys() or entry.get("raw") to see actual API field names
-        def get_field(*field_names):
-            for name in field_names:
-                # Try exact match first
-                value = entry.get(name)
-                if value is not None:
-                    return value
-                # Try case-insensitive match
-                for key in entry.keys():
-                    if isinstance(key, str) and key.lower() == name.lower():
-                        return entry[key]
-            return None
-        
-        # FinancialDatasets.ai API uses snake_case field names
-        # Documentation: https://docs.financialdatasets.ai/api-reference/endpoint/financials/balance-sheets
-        
-        # Extract year from report_period (format: "2023-12-25")
-        fiscal_year = None
-        report_period = entry.get("report_period")
-        if report_period and isinstance(report_period, str):
-            try:
-                fiscal_year = int(report_period.split("-")[0])
-            except (ValueError, AttributeError):
-                pass
-        
-        # Use exact API field names (snake_case) as primary, with fallbacks
-        current_assets = get_field("current_assets", "currentAssets", "totalCurrentAssets")
-        current_liabilities = get_field("current_liabilities", "currentLiabilities", "totalCurrentLiabilities")
-        
-        # API uses: current_debt (not shortTermDebt) and non_current_debt (not longTermDebt)
-        current_debt = get_field("current_debt", "currentDebt", "shortTermDebt", "short_term_debt")
-        non_current_debt = get_field("non_current_debt", "nonCurrentDebt", "longTermDebt", "long_term_debt")
-        
-        # API provides total_debt directly
-        total_debt = get_field("total_debt", "totalDebt")
-        if total_debt is None:
-            # Calculate from components if not provided
-            lt_debt = non_current_debt or 0
-            st_debt = current_debt or 0
-            if lt_debt != 0 or st_debt != 0:
-                total_debt = lt_debt + st_debt
-        
-        # API uses: shareholders_equity (snake_case)
-        shareholders_equity = get_field("shareholders_equity", "shareholdersEquity", "totalStockholdersEquity", "total_stockholders_equity")
-        total_equity = shareholders_equity  # Use shareholders_equity as total_equity
-        
-        # API uses: cash_and_equivalents (not cashAndCashEquivalents)
-        cash_and_cash_equivalents = get_field(
-            "cash_and_equivalents",  # Primary: exact API field name
-            "cashAndCashEquivalents", "cash_and_cash_equivalents",
-            "cashAndShortTermInvestments", "cash_and_short_term_investments"
-        )
-        
-        # Calculate risk metrics
-        current_ratio = None
-        if current_assets is not None and current_liabilities is not None and current_liabilities != 0:
-            current_ratio = current_assets / current_liabilities
-        
-        debt_to_equity = None
-        if total_debt is not None and total_equity is not None and total_equity != 0:
-            debt_to_equity = total_debt / total_equity
-        
-        working_capital = None
-        if current_assets is not None and current_liabilities is not None:
-            working_capital = current_assets - current_liabilities
-        
-        model = BalanceSheet(
-            ticker=entry.get("ticker") or entry.get("symbol") or symbol,
-            period=str(entry.get("period") or period),  # API uses: "annual", "quarterly", or "ttm"
-            fiscal_year=int(fiscal_year) if fiscal_year is not None else None,
-            fiscal_period=entry.get("fiscal_period"),  # API field: fiscal_period
-            total_assets=entry.get("total_assets"),  # API field: total_assets
-            current_assets=current_assets,
-            cash_and_cash_equivalents=cash_and_cash_equivalents,
-            total_liabilities=entry.get("total_liabilities"),  # API field: total_liabilities
-            current_liabilities=current_liabilities,
-            total_debt=total_debt if total_debt != 0 else None,  # API field: total_debt
-            long_term_debt=non_current_debt,  # Map non_current_debt to long_term_debt
-            short_term_debt=current_debt,  # Map current_debt to short_term_debt
-            total_equity=total_equity,
-            shareholders_equity=shareholders_equity,
-            current_ratio=current_ratio,
-            debt_to_equity=debt_to_equity,
-            working_capital=working_capital,
-            currency=entry.get("currency"),  # API field: currency
-            raw=entry,
-        )
-        normalized.append(model)
-
-    if not normalized:
-        raise ValueError(f"Unable to parse balance sheets for {symbol}")
-
-    return normalized[:years]
+    return _get_statements("balance-sheets", ticker, years, period)
 
 
 def get_cash_flow_statements(
@@ -540,156 +566,143 @@ def get_cash_flow_statements(
     Returns:
         List of CashFlowStatement objects (newest first) with cash flow metrics.
     """
-    if not ticker or not isinstance(ticker, str):
-        raise ValueError("Ticker must be a non-empty string")
-    if years <= 0:
-        raise ValueError("years must be a positive integer")
-
-    symbol = ticker.upper().strip()
-    headers = _get_headers()
-    url = f"{BASE_URL}/financials/cash-flow-statements"
-    params = {
-        "ticker": symbol,
-        "limit": years,
-        "period": period,
-    }
-
-    response = requests.get(url, headers=headers, params=params, timeout=10)
-    if response.status_code != 200:
-        error_msg = response.text or f"status {response.status_code}"
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("message") or error_data.get("error") or error_msg
-        except Exception:
-            pass
-        raise requests.exceptions.RequestException(
-            f"Failed to fetch cash flow statements for {symbol}: {error_msg}"
-        )
-
-    payload = response.json()
-    # FinancialDatasets.ai returns cash_flow_statements array directly in response
-    # See: https://docs.financialdatasets.ai/api-reference/endpoint/financials/cash-flow-statements
-    if isinstance(payload, dict):
-        statements = payload.get("cash_flow_statements") or payload.get("financials") or payload.get("data") or payload.get("items")
-        if statements is None and "results" in payload:
-            statements = payload["results"]
-        if statements is None:
-            for value in payload.values():
-                if isinstance(value, list) and value:
-                    statements = value
-                    break
-    elif isinstance(payload, list):
-        statements = payload
-    else:
-        statements = None
+    return _get_statements("cash-flow-statements", ticker, years, period)
+
+
+# endpoint -> (label for messages, payload list keys, normalizer)
+_STATEMENT_ENDPOINTS = {
+    "income-statements": ("income statements", ("financials", "data", "items"), parse_income_statements),
+    "balance-sheets": (
+        "balance sheets",
+        ("balance_sheets", "financials", "data", "items"),
+        parse_balance_sheets,
+    ),
+    "cash-flow-statements": (
+        "cash flow statements",
+        ("cash_flow_statements", "financials", "data", "items"),
+        parse_cash_flow_statements,
+    ),
+}
+
+
+def _plan_statements(
+    endpoint: str, ticker: str, years: int, period: str
+) -> Tuple[str, str, Dict, Optional[FundamentalsStore], Optional[List[Dict]], bool]:
+    """
+    Validate arguments and decide how much to fetch.
 
-    if not statements:
-        raise ValueError(f"No cash flow statements returned for {symbol}")
+    Returns (symbol, url, params, store, stored, incremental). ``stored`` is set
+    when the warehouse can answer without a request; ``incremental`` means
+    params already ask only for statements newer than the latest stored one.
+    """
+    symbol, url, params = _statement_request(endpoint, ticker, years, period)
+    store = get_fundamentals_store()
+    if store is None:
+        return symbol, url, params, None, None, False
+    sync = store.sync_state(endpoint, symbol, period)
+    if sync is None or sync[0] < years:
+        return symbol, url, params, store, None, False
+    stored = store.get(endpoint, symbol, period, years)
+    if not stored:
+        return symbol, url, params, store, None, False
+    if time.time() - sync[1] < load_cache_config()["fundamentals_refresh_s"]:
+        return symbol, url, params, store, stored, False
+    params = {**params, "report_period_gt": stored[0]["report_period"]}
+    return symbol, url, params, store, None, True
+
+
+def _finish_statements(
+    endpoint: str,
+    response,
+    symbol: str,
+    years: int,
+    period: str,
+    store: Optional[FundamentalsStore],
+    incremental: bool,
+) -> List:
+    """Check the response, persist statements to the warehouse and normalize the newest ``years``."""
+    label, keys, normalize = _STATEMENT_ENDPOINTS[endpoint]
+    _raise_for_status(response, f"Failed to fetch {label} for {symbol}")
+    statements = _statement_entries(response.json(), keys) or []
+    if not statements and not incremental:
+        raise ValueError(f"No {label} returned for {symbol}")
+
+    # Rows without a report_period cannot be keyed, so such responses bypass the warehouse.
+    if store is not None and all(isinstance(e, dict) and e.get("report_period") for e in statements):
+        store.save(endpoint, symbol, period, statements, depth=None if incremental else years)
+        statements = store.get(endpoint, symbol, period, years)
+    return normalize(statements, symbol, years, period)
+
+
+def _stream_statements(
+    endpoint: str, url: str, params: Dict, symbol: str, years: int, period: str, store: Optional[FundamentalsStore]
+) -> List:
+    """Full fetch decoded entry-by-entry from the response stream; each entry is normalized as it arrives."""
+    label, _, normalize = _STATEMENT_ENDPOINTS[endpoint]
+    raw: List[Dict] = []
+
+    def entries() -> Iterator[Any]:
+        for entry in _http_stream(url, f"Failed to fetch {label} for {symbol}", headers=_get_headers(), params=params):
+            raw.append(entry)
+            yield entry
 
-    normalized: List[CashFlowStatement] = []
-    for entry in statements:
-        if not isinstance(entry, dict):
-            continue
-        
-        # FinancialDatasets.ai API uses snake_case field names
-        # Documentation: https://docs.financialdatasets.ai/api-reference/endpoint/financials/cash-flow-statements
-        
-        # Extract year from report_period (format: "2023-12-25")
-        fiscal_year = None
-        report_period = entry.get("report_period")
-        if report_period and isinstance(report_period, str):
-            try:
-                fiscal_year = int(report_period.split("-")[0])
-            except (ValueError, AttributeError):
-                pass
-        
-        # API provides these fields directly (snake_case):
-        # - net_cash_flow_from_operations (maps to operating_cash_flow)
-        # - capital_expenditure (singular, not plural)
-        # - free_cash_flow (provided directly by API!)
-        # - net_cash_flow_from_investing (maps to investing_cash_flow)
-        # - net_cash_flow_from_financing (maps to financing_cash_flow)
-        # - change_in_cash_and_equivalents (maps to net_change_in_cash)
-        
-        operating_cash_flow = entry.get("net_cash_flow_from_operations")  # Primary: exact API field name
-        if operating_cash_flow is None:
-            # Fallback to camelCase variations
-            operating_cash_flow = entry.get("operatingCashFlow") or entry.get("cashFromOperatingActivities")
-        
-        capital_expenditures = entry.get("capital_expenditure")  # API uses singular
-        if capital_expenditures is None:
-            capital_expenditures = entry.get("capital_expenditures") or entry.get("capitalExpenditure")
-        # CapEx is often negative in cash flow statements, but we'll use as-is for calculation
-        
-        # API provides free_cash_flow directly!
-        free_cash_flow = entry.get("free_cash_flow")
-        # If not provided, calculate from operating_cash_flow - capital_expenditure
-        if free_cash_flow is None and operating_cash_flow is not None:
-            if capital_expenditures is not None:
-                # CapEx is typically negative in cash flow, so add it (subtract negative = add)
-                free_cash_flow = operating_cash_flow - abs(capital_expenditures) if capital_expenditures < 0 else operating_cash_flow - capital_expenditures
-            else:
-                free_cash_flow = operating_cash_flow
-        
-        investing_cash_flow = entry.get("net_cash_flow_from_investing")  # Primary: exact API field name
-        if investing_cash_flow is None:
-            investing_cash_flow = entry.get("cashFromInvestingActivities") or entry.get("investingCashFlow")
-        
-        financing_cash_flow = entry.get("net_cash_flow_from_financing")  # Primary: exact API field name
-        if financing_cash_flow is None:
-            financing_cash_flow = entry.get("cashFromFinancingActivities") or entry.get("financingCashFlow")
-        
-        net_change_in_cash = entry.get("change_in_cash_and_equivalents")  # Primary: exact API field name
-        if net_change_in_cash is None:
-            net_change_in_cash = entry.get("netChangeInCash") or entry.get("netChangeInCashAndCashEquivalents")
-        
-        model = CashFlowStatement(
-            ticker=entry.get("ticker") or entry.get("symbol") or symbol,
-            period=str(entry.get("period") or period),  # API uses: "annual", "quarterly", or "ttm"
-            fiscal_year=int(fiscal_year) if fiscal_year is not None else None,
-            fiscal_period=entry.get("fiscal_period"),  # API field: fiscal_period
-            operating_cash_flow=operating_cash_flow,
-            capital_expenditures=capital_expenditures,
-            investing_cash_flow=investing_cash_flow,
-            financing_cash_flow=financing_cash_flow,
-            net_change_in_cash=net_change_in_cash,
-            free_cash_flow=free_cash_flow,
-            currency=entry.get("currency"),  # API field: currency
-            raw=entry,
-        )
-        normalized.append(model)
+    try:
+        statements = normalize(entries(), symbol, years, period)
+    except ValueError:
+        if not raw:
+            raise ValueError(f"No {label} returned for {symbol}")
+        raise
+    if store is not None and all(isinstance(e, dict) and e.get("report_period") for e in raw):
+        store.save(endpoint, symbol, period, raw, depth=years)
+    return statements
+
+
+def _get_statements(endpoint: str, ticker: str, years: int, period: str) -> List:
+    symbol, url, params, store, stored, incremental = _plan_statements(endpoint, ticker, years, period)
+    if stored is not None:
+        return _STATEMENT_ENDPOINTS[endpoint][2](stored, symbol, years, period)
+    if not incremental and years >= int(load_http_config()["stream_min_items"]):
+        return _stream_statements(endpoint, url, params, symbol, years, period, store)
+    response = _http_get(url, headers=_get_headers(), params=params)
+    return _finish_statements(endpoint, response, symbol, years, period, store, incremental)
+
+
+async def _aget_statements(endpoint: str, ticker: str, years: int, period: str) -> List:
+    # Warehouse reads/writes are blocking SQLite calls, so they run off the event loop.
+    symbol, url, params, store, stored, incremental = await asyncio.to_thread(
+        _plan_statements, endpoint, ticker, years, period
+    )
+    if stored is not None:
+        return _STATEMENT_ENDPOINTS[endpoint][2](stored, symbol, years, period)
+    response = await _ahttp_get(url, headers=_get_headers(), params=params)
+    return await asyncio.to_thread(
+        _finish_statements, endpoint, response, symbol, years, period, store, incremental
+    )
 
-    if not normalized:
-        raise ValueError(f"Unable to parse cash flow statements for {symbol}")
 
-    return normalized[:years]
+def _get_previous_session(target_date: Optional[date] = None) -> date:
+    """
+    Get the most recent exchange session on or before the given date.
 
+    Weekends and NYSE holidays are skipped using the trading calendar.
 
-def _get_previous_weekday(target_date: Optional[date] = None) -> date:
-    """
-    Get the previous weekday (Monday-Friday) from the given date.
-    
-    If target_date is None, uses today's date.
-    If target_date is already a weekday, returns target_date.
-    Otherwise, goes back until finding a weekday (Monday=0, Sunday=6).
-    
     Args:
         target_date: Date to start from (defaults to today if None)
-        
+
     Returns:
-        The most recent weekday (Monday-Friday) on or before target_date
+        target_date if it is a trading session, otherwise the previous session
     """
     if target_date is None:
         target_date = date.today()
-    
-    # Keep going back until we hit a weekday (Monday=0 through Friday=4)
-    while target_date.weekday() >= 5:  # Saturday=5, Sunday=6
-        target_date -= timedelta(days=1)
-    
-    return target_date
+    return get_calendar().session_on_or_before(target_date)
 
 
 def get_equity_snapshot(ticker: str, end_date: Optional[date] = None) -> EquitySnapshot:
+    """Validated-model variant of get_equity_record."""
+    return get_equity_record(ticker, end_date).to_model()
+
+
+def get_equity_record(ticker: str, end_date: Optional[date] = None) -> EquityRecord:
     """
     Get a complete snapshot of equity market data for a given ticker.
     
@@ -697,9 +710,12 @@ def get_equity_snapshot(ticker: str, end_date: Optional[date] = None) -> EquityS
     - get_price_snapshot() - price and returns data for a specific date
     - get_company_facts() - market cap, sector, industry (current data)
     
-    IMPORTANT ASSUMPTION: This function is "all or none" - it goes directly to the
-    data source (FinancialDatasets.ai API) with no caching, no intermediate layers,
-    and no data transformation beyond basic parsing. The data quality, completeness,
+    IMPORTANT ASSUMPTION: This function is "all or none" - if either part fails, the
+    whole call fails. Data may be served from local caches rather than a fresh API
+    call: prices come from the memory-mapped price history or the daily-bar store
+    (see get_price_record), and company facts from a TTL cache that can return a
+    stale entry while it refreshes in the background (see get_company_facts). There
+    is no data transformation beyond basic parsing. The data quality, completeness,
     and availability are entirely dependent on what the data source provides. If the
     source has missing, incorrect, or stale data, this function will return that data
     as-is. There is no validation, cleaning, or fallback mechanism beyond what the
@@ -708,27 +724,32 @@ def get_equity_snapshot(ticker: str, end_date: Optional[date] = None) -> EquityS
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL", "MSFT")
         end_date: End date for historical price data as a date object.
-                 If None, uses the previous weekday (most recent Monday-Friday).
+                 If None, uses the most recent trading session.
         
     Returns:
-        EquitySnapshot model combining price/return data with company facts.
+        EquityRecord combining price/return data with company facts.
         
     Raises:
         ValueError: If API key is missing or ticker is invalid
         requests.RequestException: If API request fails
     """
-    # If no date provided, use the previous weekday
+    # If no date provided, use the most recent trading session
     if end_date is None:
-        end_date = _get_previous_weekday()
+        end_date = _get_previous_session()
     
     # Get price snapshot (with dates)
-    price_data = get_price_snapshot(ticker, end_date)
+    price_data = get_price_record(ticker, end_date)
     
     # Get company facts (without dates, current data)
     company_data = get_company_facts(ticker)
     
-    # Combine the results
-    combined = EquitySnapshot(
+    return _combine_equity_record(price_data, company_data)
+
+
+def _combine_equity_record(price_data: PriceRecord, company_data: CompanyFacts) -> EquityRecord:
+    """Merge price/return data with company facts and, when the price history covers the date, risk metrics."""
+    risk = snapshot_metrics(price_data.ticker, date.fromisoformat(price_data.date[:10]))
+    return EquityRecord(
         ticker=price_data.ticker,
         price=price_data.price,
         return_1d=price_data.return_1d,
@@ -738,6 +759,171 @@ def get_equity_snapshot(ticker: str, end_date: Optional[date] = None) -> EquityS
         industry=company_data.industry,
         date=price_data.date,
         source=price_data.source,
+        volatility_20d=risk.get("volatility_20d"),
+        drawdown=risk.get("drawdown"),
+        max_drawdown=risk.get("max_drawdown"),
     )
-    
-    return combined
+
+
+# ---------------------------------------------------------------------------
+# Async variants
+#
+# Same validation, parsing and error messages as the sync functions above, but
+# requests go through a pooled httpx.AsyncClient so one event loop can keep many
+# vendor calls in flight without tying up executor threads.
+# ---------------------------------------------------------------------------
+
+
+async def _ahttp_get(url: str, **kwargs):
+    """Async GET through the shared httpx client (coalesced like _http_get); transport errors surface as RequestException."""
+    return await get_singleflight(VENDOR).ado(
+        request_key(url, kwargs.get("params")),
+        lambda: get_async_client_manager(VENDOR).get(url, **kwargs),
+    )
+
+
+async def aget_price_snapshot(ticker: str, end_date: date) -> PriceSnapshot:
+    """Async variant of get_price_snapshot (shares the daily-bar store)."""
+    return (await aget_price_record(ticker, end_date)).to_model()
+
+
+async def aget_price_record(ticker: str, end_date: date) -> PriceRecord:
+    """Async variant of get_price_record; bar-store and price-history I/O runs in worker threads."""
+    ticker, window_start, store, fetch_start = await asyncio.to_thread(_plan_price_snapshot, ticker, end_date)
+    date_str = end_date.strftime("%Y-%m-%d")
+    history_bars = await asyncio.to_thread(_history_bars, ticker, window_start, end_date)
+    if history_bars is not None:
+        store, fetch_start = None, None
+    headers = _get_headers() if fetch_start is not None else {}
+
+    try:
+        bars: List[Dict] = history_bars or []
+        if fetch_start is not None:
+            url, params = _price_request(ticker, fetch_start, end_date)
+            bars = _parse_price_bars(await _ahttp_get(url, headers=headers, params=params), ticker, end_date)
+        return await asyncio.to_thread(_build_price_record, ticker, end_date, window_start, store, fetch_start, bars)
+
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(
+            f"Failed to fetch price snapshot from FinancialDatasets.ai API for {ticker} "
+            f"on date {date_str}: {e}"
+        ) from e
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(
+            f"Error parsing price snapshot data for ticker {ticker} on date {date_str}: {e}"
+        ) from e
+
+
+async def aget_price_snapshots(
+    tickers: Iterable[str],
+    end_date: date,
+    max_concurrency: Optional[int] = None,
+) -> Tuple[Dict[str, PriceSnapshot], Dict[str, Exception]]:
+    """
+    Async variant of get_price_snapshots.
+
+    At most ``max_concurrency`` requests are in flight (default
+    ``DATA_TOOLS_MAX_CONCURRENCY``); failures are returned per ticker.
+    """
+    if not isinstance(end_date, date):
+        raise ValueError("end_date must be a date object")
+
+    symbols: List[str] = []
+    errors: Dict[str, Exception] = {}
+    for ticker in tickers:
+        if not ticker or not isinstance(ticker, str) or not ticker.strip():
+            errors[str(ticker)] = ValueError("Ticker must be a non-empty string")
+            continue
+        symbol = ticker.upper().strip()
+        if symbol not in symbols:
+            symbols.append(symbol)
+
+    limit = max_concurrency or int(load_http_config()["max_concurrency"])
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _one(symbol: str) -> PriceRecord:
+        async with semaphore:
+            return await aget_price_record(symbol, end_date)
+
+    results = await asyncio.gather(*(_one(s) for s in symbols), return_exceptions=True)
+    snapshots: Dict[str, PriceSnapshot] = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            errors[symbol] = result
+        else:
+            snapshots[symbol] = result.to_model()
+    return snapshots, errors
+
+
+async def aget_company_facts(ticker: str) -> CompanyFacts:
+    """Async variant of get_company_facts; shares its TTL cache."""
+    if not ticker or not isinstance(ticker, str):
+        raise ValueError("Ticker must be a non-empty string")
+
+    ticker = ticker.upper().strip()
+    return await _company_facts_cache().aget_or_load(ticker, lambda: _afetch_company_facts(ticker))
+
+
+async def _afetch_company_facts(ticker: str) -> CompanyFacts:
+    headers = _get_headers()
+
+    try:
+        company_response = await _ahttp_get(
+            f"{BASE_URL}/company/facts",
+            headers=headers,
+            params={"ticker": ticker},
+        )
+        return _parse_company_facts(company_response, ticker)
+
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.RequestException(
+            f"Failed to fetch company facts from FinancialDatasets.ai API for {ticker}: {e}"
+        ) from e
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(
+            f"Error parsing company facts data for ticker {ticker}: {e}"
+        ) from e
+
+
+async def aget_equity_snapshot(ticker: str, end_date: Optional[date] = None) -> EquitySnapshot:
+    """Async variant of get_equity_snapshot; the price and company-facts calls run concurrently."""
+    return (await aget_equity_record(ticker, end_date)).to_model()
+
+
+async def aget_equity_record(ticker: str, end_date: Optional[date] = None) -> EquityRecord:
+    """Async variant of get_equity_record."""
+    if end_date is None:
+        end_date = _get_previous_session()
+
+    price_data, company_data = await asyncio.gather(
+        aget_price_record(ticker, end_date),
+        aget_company_facts(ticker),
+    )
+    return await asyncio.to_thread(_combine_equity_record, price_data, company_data)
+
+
+async def aget_income_statements(
+    ticker: str,
+    years: int = 4,
+    period: str = "annual"
+) -> List[IncomeStatement]:
+    """Async variant of get_income_statements."""
+    return await _aget_statements("income-statements", ticker, years, period)
+
+
+async def aget_balance_sheets(
+    ticker: str,
+    years: int = 4,
+    period: str = "annual"
+) -> List[BalanceSheet]:
+    """Async variant of get_balance_sheets."""
+    return await _aget_statements("balance-sheets", ticker, years, period)
+
+
+async def aget_cash_flow_statements(
+    ticker: str,
+    years: int = 4,
+    period: str = "annual"
+) -> List[CashFlowStatement]:
+    """Async variant of get_cash_flow_statements."""
+    return await _aget_statements("cash-flow-statements", ticker, years, period)
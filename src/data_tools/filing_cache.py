@@ -0,0 +1,106 @@
+"""Content-addressed on-disk cache of parsed 10-K items and values derived from them."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.data_tools.config import load_cache_config
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _selection(item_names: Sequence[str]) -> str:
+    """File-safe name for a FilingParser item selection; "all" for the full filing."""
+    return "+".join(name.replace(" ", "_") for name in item_names) or "all"
+
+
+class FilingCache:
+    """
+    Parsed filing items shared by every process on the host.
+
+    Layout under ``root``:
+
+    - ``objects/<2>/<sha256>.txt``: one item's text, named by its content hash,
+      so an item fetched by several selections (Item 7 alone and inside the
+      full filing) or unchanged across refetches is stored once.
+    - ``refs/<TICKER>/<year>/<selection>.json``: the item digests a
+      FilingParser request returned, plus a digest over them.
+    - ``derived/<filing digest>/<name>.json``: values computed from a
+      filing's items (e.g. a revenue series). They are keyed by content, so
+      a refetched filing with new text never serves a stale value.
+
+    Writes are atomic renames; concurrent writers of the same key produce
+    identical files.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.txt"
+
+    def _ref_path(self, ticker: str, year: int, item_names: Sequence[str]) -> Path:
+        return self.root / "refs" / ticker.upper() / str(year) / f"{_selection(item_names)}.json"
+
+    def _read_ref(self, ticker: str, year: int, item_names: Sequence[str]) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._ref_path(ticker, year, item_names).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def filing_digest(self, ticker: str, year: int, item_names: Sequence[str] = ()) -> Optional[str]:
+        """Content digest of a cached selection, or None if it was never stored."""
+        ref = self._read_ref(ticker, year, item_names)
+        return ref["digest"] if ref else None
+
+    def get_items(self, ticker: str, year: int, item_names: Sequence[str] = ()) -> Optional[List[str]]:
+        """Cached items for a selection in FilingParser order, or None on a miss."""
+        ref = self._read_ref(ticker, year, item_names)
+        if ref is None:
+            return None
+        try:
+            return [self._object_path(d).read_text(encoding="utf-8") for d in ref["items"]]
+        except FileNotFoundError:
+            return None
+
+    def put_items(self, ticker: str, year: int, item_names: Sequence[str], items: Sequence[str]) -> str:
+        """Store a selection's items; returns the filing digest."""
+        digests = []
+        for text in items:
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            path = self._object_path(digest)
+            if not path.exists():
+                _atomic_write(path, text)
+            digests.append(digest)
+        filing = hashlib.sha256("\n".join(digests).encode("ascii")).hexdigest()
+        ref = {"items": digests, "digest": filing, "fetched_at": time.time()}
+        _atomic_write(self._ref_path(ticker, year, item_names), json.dumps(ref))
+        return filing
+
+    def get_derived(self, digest: str, name: str) -> Optional[Any]:
+        try:
+            return json.loads((self.root / "derived" / digest / f"{name}.json").read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put_derived(self, digest: str, name: str, value: Any) -> None:
+        _atomic_write(self.root / "derived" / digest / f"{name}.json", json.dumps(value))
+
+
+def get_filing_cache() -> Optional[FilingCache]:
+    """Return the configured filing cache, or None when it is disabled."""
+    cfg = load_cache_config()
+    if not cfg["filings_enabled"]:
+        return None
+    return FilingCache(Path(cfg["cache_dir"]) / "filings")
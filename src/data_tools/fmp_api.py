@@ -1,18 +1,29 @@
-"""FinancialModelingPrep.com client for reference data lookups (CUSIP/ISIN)."""
+"""FinancialModelingPrep.com client for reference data lookups (CUSIP/ISIN) and daily prices."""
 
 from __future__ import annotations
 
 import os
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
 
+from src.data_tools.batch import fetch_many
+from src.data_tools.config import load_cache_config
+from src.data_tools.fd_api import _price_window_start
+from src.data_tools.http_client import get_session_manager
+from src.data_tools.identifier_store import get_identifier_store
+from src.data_tools.records import PriceRecord
 from src.data_tools.schemas import Equity
 
 load_dotenv()
 
 BASE_URL = "https://financialmodelingprep.com/api/v3"
+VENDOR = "fmp"
+SOURCE = "financialmodelingprep.com"
+PROFILE_BATCH_SIZE = 50  # symbols per comma-joined /profile request
 
 
 def _get_api_key() -> str:
@@ -26,12 +37,12 @@ def _get_api_key() -> str:
 
 
 def _request_json(path: str, params: Optional[Dict] = None) -> Dict:
-    """Perform a GET request and return JSON, raising for non-200."""
+    """Perform a GET request (per-endpoint timeout from the session manager) and return JSON, raising for non-200."""
     api_key = _get_api_key()
     url = f"{BASE_URL}/{path.lstrip('/')}"
     query = params.copy() if params else {}
     query["apikey"] = api_key
-    resp = requests.get(url, params=query, timeout=10)
+    resp = get_session_manager(VENDOR).get(url, params=query)
     if resp.status_code != 200:
         raise requests.RequestException(
             f"FMP request failed with status {resp.status_code}: {resp.text}"
@@ -39,31 +50,19 @@ def _request_json(path: str, params: Optional[Dict] = None) -> Dict:
     return resp.json()
 
 
-def get_security_identifiers(ticker: str) -> Equity:
-    """
-    Map a ticker to identifiers using FMP profile endpoint.
-
-    Args:
-        ticker: Symbol to look up (e.g., AAPL).
+@dataclass
+class IdentifierLookup:
+    """Result of a bulk identifier lookup, with where each symbol's record came from."""
 
-    Returns:
-        Equity model populated with symbol, cusip, isin, and placeholders for other fields.
-    """
-    if not ticker or not isinstance(ticker, str):
-        raise ValueError("Ticker must be a non-empty string.")
-    symbol = ticker.strip().upper()
-    data = _request_json(f"profile/{symbol}")
+    equities: Dict[str, Equity] = field(default_factory=dict)
+    cached: List[str] = field(default_factory=list)
+    fetched: List[str] = field(default_factory=list)
+    # Symbols FMP returned no profile for, and symbols whose request failed.
+    missing: List[str] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)
 
-    # FMP returns a list of profiles; take the first valid entry.
-    profile = None
-    if isinstance(data, list) and data:
-        profile = data[0]
-    elif isinstance(data, dict):
-        profile = data
-
-    if not profile or not isinstance(profile, dict):
-        raise ValueError(f"No profile data returned for ticker {symbol}.")
 
+def _profile_to_equity(symbol: str, profile: Dict) -> Equity:
     cusip = profile.get("cusip", "") or ""
     isin = profile.get("isin", "") or ""
     cik = profile.get("cik", "") or ""
@@ -79,3 +78,124 @@ def get_security_identifiers(ticker: str) -> Equity:
         exchange=exchange,
         pricing_source="financialmodelingprep.com",
     )
+
+
+def _fetch_profiles(symbols: Tuple[str, ...]) -> Dict[str, Equity]:
+    """One /profile request for comma-joined symbols; symbols FMP does not know are absent."""
+    data = _request_json(f"profile/{','.join(symbols)}")
+    profiles = data if isinstance(data, list) else [data] if isinstance(data, dict) else []
+    wanted = set(symbols)
+    equities: Dict[str, Equity] = {}
+    for profile in profiles:
+        if not isinstance(profile, dict):
+            continue
+        symbol = str(profile.get("symbol") or (symbols[0] if len(symbols) == 1 else "")).upper()
+        if symbol in wanted and symbol not in equities:
+            equities[symbol] = _profile_to_equity(symbol, profile)
+    return equities
+
+
+def get_security_identifiers_batch(
+    tickers: Iterable[str],
+    batch_size: int = PROFILE_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+    refresh: bool = False,
+) -> IdentifierLookup:
+    """
+    Identifiers for many tickers: cached records first, then comma-joined /profile requests.
+
+    Records younger than DATA_TOOLS_IDENTIFIER_TTL_S come from the identifier
+    cache; the rest are fetched ``batch_size`` symbols per request, with
+    requests fanned out under the usual concurrency limit and FMP rate
+    limiter, and written back to the cache. A failed request only affects its
+    own symbols, which land in ``errors``.
+
+    Args:
+        tickers: Symbols to look up (case-insensitive; duplicates ignored).
+        batch_size: Symbols per /profile request.
+        max_workers: Concurrent requests (default DATA_TOOLS_MAX_CONCURRENCY).
+        refresh: Skip the cache and refetch every symbol.
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if isinstance(t, str) and t.strip()))
+    lookup = IdentifierLookup()
+    store = get_identifier_store()
+    if store is not None and not refresh:
+        cached = store.get_many(symbols, max_age_s=load_cache_config()["identifiers_ttl_s"])
+        for symbol in symbols:
+            if symbol in cached:
+                lookup.equities[symbol] = Equity(**cached[symbol])
+                lookup.cached.append(symbol)
+
+    pending = [s for s in symbols if s not in lookup.equities]
+    size = max(int(batch_size), 1)
+    chunks = [tuple(pending[i : i + size]) for i in range(0, len(pending), size)]
+    results, errors = fetch_many(_fetch_profiles, chunks, max_workers=max_workers)
+    fetched: Dict[str, Equity] = {}
+    for chunk_result in results.values():
+        fetched.update(chunk_result)
+    for chunk, exc in errors.items():
+        lookup.errors.update((symbol, exc) for symbol in chunk)
+    if store is not None and fetched:
+        store.save_many({symbol: equity.model_dump() for symbol, equity in fetched.items()})
+
+    for symbol in pending:
+        if symbol in fetched:
+            lookup.equities[symbol] = fetched[symbol]
+            lookup.fetched.append(symbol)
+        elif symbol not in lookup.errors:
+            lookup.missing.append(symbol)
+    lookup.equities = {s: lookup.equities[s] for s in symbols if s in lookup.equities}
+    return lookup
+
+
+def get_security_identifiers(ticker: str) -> Equity:
+    """
+    Map a ticker to identifiers using FMP profile endpoint (through the identifier cache).
+
+    Args:
+        ticker: Symbol to look up (e.g., AAPL).
+
+    Returns:
+        Equity model populated with symbol, cusip, isin, and placeholders for other fields.
+    """
+    if not ticker or not isinstance(ticker, str):
+        raise ValueError("Ticker must be a non-empty string.")
+    symbol = ticker.strip().upper()
+    lookup = get_security_identifiers_batch([symbol])
+    if symbol in lookup.errors:
+        raise lookup.errors[symbol]
+    if symbol not in lookup.equities:
+        raise ValueError(f"No profile data returned for ticker {symbol}.")
+    return lookup.equities[symbol]
+
+
+def get_price_record(ticker: str, end_date: date) -> PriceRecord:
+    """
+    Close and 1D/5D returns ending on end_date from FMP daily bars.
+
+    Same window (including its slack sessions) and return rules as
+    fd_api.get_price_record, so either vendor can serve a price lookup (see
+    routing.py). Bars are not written to the
+    bar store, which holds FinancialDatasets data only.
+    """
+    if not ticker or not isinstance(ticker, str):
+        raise ValueError("Ticker must be a non-empty string.")
+    if not isinstance(end_date, date):
+        raise ValueError("end_date must be a date object")
+    symbol = ticker.strip().upper()
+    start = _price_window_start(end_date)
+    data = _request_json(
+        f"historical-price-full/{symbol}",
+        {"from": start.isoformat(), "to": end_date.isoformat()},
+    )
+    rows = data.get("historical", []) if isinstance(data, dict) else []
+    bars = sorted(
+        (
+            {"date": str(row["date"])[:10], "close": float(row["close"]), "volume": row.get("volume", 0)}
+            for row in rows
+            if isinstance(row, dict) and row.get("date") and row.get("close") is not None
+        ),
+        key=lambda bar: bar["date"],
+    )
+    bars = [bar for bar in bars if bar["date"] <= end_date.isoformat()]
+    return PriceRecord.from_bars(symbol, bars, end_date.isoformat(), source=SOURCE)
@@ -0,0 +1,179 @@
+"""Persistent SQLite warehouse of vendor financial statements keyed by (statement, ticker, period, report_period)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.data_tools.config import load_cache_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    statement TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    period TEXT NOT NULL,
+    report_period TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (statement, ticker, period, report_period)
+);
+CREATE INDEX IF NOT EXISTS statements_cross_section
+    ON statements (statement, period, report_period);
+CREATE TABLE IF NOT EXISTS sync (
+    statement TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    period TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (statement, ticker, period)
+);
+"""
+
+
+class FundamentalsStore:
+    """
+    Local statement warehouse with per-(statement, ticker, period) sync state.
+
+    Each row holds the vendor's raw statement JSON, so models are rebuilt with
+    the same normalization as a live response. ``sync.depth`` is the largest
+    history length ever requested in a full fetch: once it covers a request,
+    only statements newer than the latest stored ``report_period`` need
+    fetching. ``sync.checked_at`` rate-limits those incremental checks.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, statement: str, ticker: str, period: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Stored raw statements, newest report_period first."""
+        rows = self._conn().execute(
+            "SELECT payload FROM statements WHERE statement = ? AND ticker = ? AND period = ? "
+            "ORDER BY report_period DESC LIMIT ?",
+            (statement, ticker, period, -1 if limit is None else limit),
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def sync_state(self, statement: str, ticker: str, period: str) -> Optional[Tuple[int, float]]:
+        """(depth, checked_at) of the last fetch, if any."""
+        row = self._conn().execute(
+            "SELECT depth, checked_at FROM sync WHERE statement = ? AND ticker = ? AND period = ?",
+            (statement, ticker, period),
+        ).fetchone()
+        return (int(row[0]), float(row[1])) if row else None
+
+    def save(
+        self,
+        statement: str,
+        ticker: str,
+        period: str,
+        entries: List[Dict[str, Any]],
+        depth: Optional[int] = None,
+    ) -> None:
+        """
+        Upsert raw statements (each must carry ``report_period``) and mark the key checked now.
+
+        ``depth`` is the limit of a full fetch; incremental fetches pass None and
+        keep the recorded depth.
+        """
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO statements (statement, ticker, period, report_period, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(statement, ticker, period, str(e["report_period"]), json.dumps(e), now) for e in entries],
+            )
+            existing = self.sync_state(statement, ticker, period)
+            new_depth = max(depth or 0, existing[0] if existing else 0)
+            conn.execute(
+                "INSERT OR REPLACE INTO sync (statement, ticker, period, depth, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (statement, ticker, period, new_depth, now),
+            )
+
+    def cross_section(
+        self,
+        statement: str,
+        field: str,
+        period: str = "annual",
+        as_of: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        ``field`` from each ticker's latest statement with report_period <= as_of.
+
+        One indexed query over the whole universe, e.g.
+        ``cross_section("income-statements", "revenue")``. Tickers whose latest
+        statement lacks the field are omitted.
+        """
+        cutoff = (as_of or date.max).isoformat()
+        rows = self._conn().execute(
+            """
+            SELECT s.ticker, json_extract(s.payload, ?)
+            FROM statements s
+            JOIN (
+                SELECT ticker, MAX(report_period) AS report_period
+                FROM statements
+                WHERE statement = ? AND period = ? AND report_period <= ?
+                GROUP BY ticker
+            ) latest ON latest.ticker = s.ticker AND latest.report_period = s.report_period
+            WHERE s.statement = ? AND s.period = ?
+            ORDER BY s.ticker
+            """,
+            (f'$."{field}"', statement, period, cutoff, statement, period),
+        ).fetchall()
+        return {ticker: value for ticker, value in rows if value is not None}
+
+    def tickers(self, statement: Optional[str] = None) -> List[str]:
+        """Tickers with any stored statements."""
+        if statement:
+            rows = self._conn().execute(
+                "SELECT DISTINCT ticker FROM statements WHERE statement = ? ORDER BY ticker", (statement,)
+            ).fetchall()
+        else:
+            rows = self._conn().execute("SELECT DISTINCT ticker FROM statements ORDER BY ticker").fetchall()
+        return [r[0] for r in rows]
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        """Drop stored statements and sync state for one ticker or the whole store."""
+        conn = self._conn()
+        with conn:
+            if ticker:
+                conn.execute("DELETE FROM statements WHERE ticker = ?", (ticker,))
+                conn.execute("DELETE FROM sync WHERE ticker = ?", (ticker,))
+            else:
+                conn.execute("DELETE FROM statements")
+                conn.execute("DELETE FROM sync")
+
+
+_stores: Dict[Path, FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store() -> Optional[FundamentalsStore]:
+    """Return the configured fundamentals store, or None when it is disabled."""
+    cfg = load_cache_config()
+    if not cfg["fundamentals_enabled"]:
+        return None
+    path = Path(cfg["cache_dir"]) / "fundamentals.sqlite"
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = FundamentalsStore(path)
+            _stores[path] = store
+    return store
@@ -0,0 +1,368 @@
+"""Shared keep-alive HTTP sessions for vendor API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.data_tools.cassette import get_cassette
+from src.data_tools.config import load_http_config
+from src.data_tools.rate_limit import RateLimitError, get_rate_limiter, retry_after_seconds
+from src.data_tools.resilience import CircuitOpenError, get_guard, resilience_stats
+
+
+def _throttled_error(vendor: str, url: str, response: Any) -> RateLimitError:
+    """RateLimitError for a 429 so callers can tell throttling from other failures."""
+    return RateLimitError(
+        f"{vendor} rate limit exceeded (429) for {urlparse(url).path or url}",
+        vendor=vendor,
+        retry_after=retry_after_seconds(response),
+        response=response if isinstance(response, requests.Response) else None,
+    )
+
+
+def _resolve_timeout(config: Dict[str, Any], url_or_path: str) -> float:
+    """Longest matching ``endpoint_timeouts`` prefix, else ``default_timeout_s``."""
+    path = urlparse(url_or_path).path or url_or_path
+    best_len = -1
+    timeout = float(config["default_timeout_s"])
+    for prefix, value in (config.get("endpoint_timeouts") or {}).items():
+        if path.startswith(prefix) and len(prefix) > best_len:
+            best_len = len(prefix)
+            timeout = float(value)
+    return timeout
+
+
+def _limiter_stats(vendor: str) -> Optional[Dict[str, Any]]:
+    limiter = get_rate_limiter(vendor)
+    return limiter.stats() if limiter is not None else None
+
+
+def _hedgeable(method: str, kwargs: Dict[str, Any]) -> bool:
+    """Only idempotent, fully-buffered requests may be sent twice."""
+    return method.upper() == "GET" and not kwargs.get("stream")
+
+
+class HttpSessionManager:
+    """
+    Thread-safe owner of one pooled ``requests.Session`` per vendor.
+
+    All threads share the same urllib3 connection pool, so repeated calls to the
+    same host reuse an open TCP/TLS connection instead of handshaking again.
+    """
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.config = config or load_http_config()
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._lock = threading.Lock()
+        self._requests_by_endpoint: Dict[str, int] = {}
+        self._errors = 0
+
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=int(self.config["pool_connections"]),
+                        pool_maxsize=int(self.config["pool_maxsize"]),
+                        pool_block=bool(self.config["pool_block"]),
+                        max_retries=0,
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers["Connection"] = "keep-alive" if self.config["keep_alive"] else "close"
+                    self._adapter = adapter
+                    self._session = session
+        return self._session
+
+    def timeout_for(self, url_or_path: str) -> float:
+        """Resolve the timeout for an endpoint by longest matching path prefix."""
+        return _resolve_timeout(self.config, url_or_path)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send over the pooled session, or through the record/replay cassette when enabled."""
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            return cassette.replay(self.name, method, url, kwargs.get("params"), kwargs.get("json"))
+        started = time.perf_counter()
+        response = getattr(self.session(), method.lower())(url, **kwargs)
+        if cassette is not None:
+            record = cassette.record_stream if kwargs.get("stream") else cassette.record
+            record(self.name, method, url, kwargs.get("params"), kwargs.get("json"), response, time.perf_counter() - started)
+        return response
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send through the pooled session, applying the per-endpoint timeout if none is given.
+
+        The call waits for the vendor's rate limiter (token bucket + adaptive
+        concurrency); a 429 response backs the limiter off and raises RateLimitError.
+        The endpoint's circuit breaker may reject the call up front with
+        CircuitOpenError, and GETs may be hedged (see resilience.py).
+        """
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        endpoint = urlparse(url).path or url
+        with self._lock:
+            self._requests_by_endpoint[endpoint] = self._requests_by_endpoint.get(endpoint, 0) + 1
+        guard = get_guard(self.name, url)
+        if guard is None:
+            return self._attempt(method, url, **kwargs)
+        try:
+            return guard.call(lambda: self._attempt(method, url, **kwargs), hedge=_hedgeable(method, kwargs))
+        except CircuitOpenError:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    def _attempt(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """One rate-limited send; a 429 raises RateLimitError."""
+        limiter = get_rate_limiter(self.name)
+        if limiter is not None:
+            limiter.acquire()
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self._send(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            if limiter is not None:
+                status = getattr(response, "status_code", None)
+                limiter.release(
+                    time.perf_counter() - started,
+                    status,
+                    retry_after_seconds(response) if status == 429 else None,
+                )
+        if getattr(response, "status_code", None) == 429:
+            with self._lock:
+                self._errors += 1
+            raise _throttled_error(self.name, url, response)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Request and connection-reuse counters for this vendor."""
+        opened = 0
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                opened += getattr(pool, "num_connections", 0) if pool is not None else 0
+        with self._lock:
+            by_endpoint = dict(self._requests_by_endpoint)
+            errors = self._errors
+        total = sum(by_endpoint.values())
+        return {
+            "vendor": self.name,
+            "requests": total,
+            "requests_by_endpoint": by_endpoint,
+            "errors": errors,
+            "connections_opened": opened,
+            "connections_reused": max(total - opened, 0),
+            "rate_limit": _limiter_stats(self.name),
+            "endpoints": resilience_stats().get(self.name, {}),
+        }
+
+    def close(self) -> None:
+        """Close pooled connections and reset counters; the next request opens a fresh session."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
+            self._requests_by_endpoint = {}
+            self._errors = 0
+
+
+class AsyncHttpClientManager:
+    """
+    Owner of one pooled ``httpx.AsyncClient`` per vendor and event loop.
+
+    httpx clients are bound to the loop that created them, so each running loop
+    gets its own client; within a loop every coroutine shares one connection
+    pool sized like the sync session (``pool_maxsize``). Transport errors are
+    re-raised as ``requests.exceptions.RequestException`` so callers handle
+    sync and async failures the same way.
+    """
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.config = config or load_http_config()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._requests_by_endpoint: Dict[str, int] = {}
+        self._errors = 0
+
+    def client(self) -> Any:
+        """Return the ``httpx.AsyncClient`` for the running loop, creating it on first use."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                maxsize = int(self.config["pool_maxsize"])
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=maxsize,
+                        max_keepalive_connections=maxsize if self.config["keep_alive"] else 0,
+                    ),
+                    headers={"Connection": "keep-alive" if self.config["keep_alive"] else "close"},
+                )
+                self._clients[loop] = client
+        return client
+
+    def timeout_for(self, url_or_path: str) -> float:
+        """Resolve the timeout for an endpoint by longest matching path prefix."""
+        return _resolve_timeout(self.config, url_or_path)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Any:
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            return await cassette.areplay(self.name, method, url, kwargs.get("params"), kwargs.get("json"))
+        started = time.perf_counter()
+        response = await getattr(self.client(), method.lower())(url, **kwargs)
+        if cassette is not None:
+            cassette.record(self.name, method, url, kwargs.get("params"), kwargs.get("json"), response, time.perf_counter() - started)
+        return response
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Async request through the loop's pooled client, applying the per-endpoint timeout if none is given."""
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        endpoint = urlparse(url).path or url
+        with self._lock:
+            self._requests_by_endpoint[endpoint] = self._requests_by_endpoint.get(endpoint, 0) + 1
+        guard = get_guard(self.name, url)
+        if guard is None:
+            return await self._attempt(method, url, **kwargs)
+        try:
+            return await guard.acall(lambda: self._attempt(method, url, **kwargs), hedge=_hedgeable(method, kwargs))
+        except CircuitOpenError:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    async def _attempt(self, method: str, url: str, **kwargs: Any) -> Any:
+        """One rate-limited send; transport errors become RequestException and a 429 raises RateLimitError."""
+        import httpx
+
+        limiter = get_rate_limiter(self.name)
+        if limiter is not None:
+            await limiter.aacquire()
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await self._send(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            with self._lock:
+                self._errors += 1
+            raise requests.exceptions.RequestException(f"{type(exc).__name__}: {exc}") from exc
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            if limiter is not None:
+                status = getattr(response, "status_code", None)
+                limiter.release(
+                    time.perf_counter() - started,
+                    status,
+                    retry_after_seconds(response) if status == 429 else None,
+                )
+        if getattr(response, "status_code", None) == 429:
+            with self._lock:
+                self._errors += 1
+            raise _throttled_error(self.name, url, response)
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counters for this vendor's async clients."""
+        with self._lock:
+            by_endpoint = dict(self._requests_by_endpoint)
+            errors = self._errors
+            clients = len(self._clients)
+        return {
+            "vendor": self.name,
+            "requests": sum(by_endpoint.values()),
+            "requests_by_endpoint": by_endpoint,
+            "errors": errors,
+            "clients": clients,
+            "rate_limit": _limiter_stats(self.name),
+            "endpoints": resilience_stats().get(self.name, {}),
+        }
+
+    async def aclose(self) -> None:
+        """Close the running loop's client; the next request opens a fresh one."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_managers: Dict[str, HttpSessionManager] = {}
+_async_managers: Dict[str, AsyncHttpClientManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_session_manager(name: str) -> HttpSessionManager:
+    """Return the process-wide session manager for a vendor, creating it on first use."""
+    manager = _managers.get(name)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.get(name)
+            if manager is None:
+                manager = HttpSessionManager(name)
+                _managers[name] = manager
+    return manager
+
+
+def get_async_client_manager(name: str) -> AsyncHttpClientManager:
+    """Return the process-wide async client manager for a vendor, creating it on first use."""
+    manager = _async_managers.get(name)
+    if manager is None:
+        with _managers_lock:
+            manager = _async_managers.get(name)
+            if manager is None:
+                manager = AsyncHttpClientManager(name)
+                _async_managers[name] = manager
+    return manager
+
+
+def session_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters for every vendor session created in this process."""
+    with _managers_lock:
+        managers = list(_managers.values())
+    return {m.name: m.stats() for m in managers}
+
+
+def close_all_sessions() -> None:
+    """Close every vendor session (e.g. after fork or at shutdown)."""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close()
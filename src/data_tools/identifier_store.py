@@ -0,0 +1,102 @@
+"""Persistent SQLite cache of security identifiers (CUSIP/ISIN/CIK) keyed by symbol."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.data_tools.config import load_cache_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS identifiers (
+    symbol TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class IdentifierStore:
+    """
+    Symbol -> identifier record (an ``Equity`` dump) with its fetch time.
+
+    Identifiers change rarely (corporate actions, relistings), so entries are
+    served until they are ``max_age_s`` old and then refetched by the caller.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, symbols: Iterable[str], max_age_s: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Stored records for symbols fetched within max_age_s (any age when None)."""
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        cutoff = time.time() - max_age_s if max_age_s is not None else float("-inf")
+        found: Dict[str, Dict[str, Any]] = {}
+        # Stay under SQLite's bound-parameter limit on large universes.
+        for start in range(0, len(symbols), 500):
+            chunk = symbols[start : start + 500]
+            rows = self._conn().execute(
+                f"SELECT symbol, payload FROM identifiers WHERE fetched_at >= ? "
+                f"AND symbol IN ({','.join('?' * len(chunk))})",
+                (cutoff, *chunk),
+            ).fetchall()
+            found.update((symbol, json.loads(payload)) for symbol, payload in rows)
+        return found
+
+    def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Upsert records by symbol, stamped with the current time."""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO identifiers (symbol, payload, fetched_at) VALUES (?, ?, ?)",
+                [(symbol, json.dumps(record), now) for symbol, record in records.items()],
+            )
+
+    def symbols(self) -> List[str]:
+        return [r[0] for r in self._conn().execute("SELECT symbol FROM identifiers ORDER BY symbol").fetchall()]
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """Drop one symbol's record or the whole cache."""
+        conn = self._conn()
+        with conn:
+            if symbol:
+                conn.execute("DELETE FROM identifiers WHERE symbol = ?", (symbol,))
+            else:
+                conn.execute("DELETE FROM identifiers")
+
+
+_stores: Dict[Path, IdentifierStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_identifier_store() -> Optional[IdentifierStore]:
+    """Return the configured identifier cache, or None when it is disabled."""
+    cfg = load_cache_config()
+    if not cfg["identifiers_enabled"]:
+        return None
+    path = Path(cfg["cache_dir"]) / "identifiers.sqlite"
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = IdentifierStore(path)
+            _stores[path] = store
+    return store
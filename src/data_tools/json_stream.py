@@ -0,0 +1,128 @@
+"""Incremental decoding of JSON array payloads from an HTTP byte stream."""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Collection, Iterable, Iterator, Optional, Union
+
+_WS = " \t\n\r"
+# Consumed text is dropped from the buffer once this many characters have been processed.
+_COMPACT_AT = 1 << 16
+
+
+class _Buffer:
+    """Text buffer fed from byte/str chunks with an incremental UTF-8 decoder."""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk; False once the stream is exhausted."""
+        if self.eof:
+            return False
+        if self.pos >= _COMPACT_AT:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            piece = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+            if piece:
+                self.text += piece
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> Optional[str]:
+        """Next non-whitespace character (advancing past whitespace), or None at end of stream."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if ch is None or ch not in chars:
+            raise ValueError(f"Malformed JSON stream: expected one of {chars!r}, got {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """
+        Decode one complete JSON value at the cursor.
+
+        A value is accepted only when a following delimiter is buffered (or the
+        stream ended), so a number split across chunks is never cut short.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            rest = end
+            while rest < len(self.text) and self.text[rest] in _WS:
+                rest += 1
+            if rest < len(self.text) or self.eof or not self.fill():
+                self.pos = end
+                return obj
+
+
+def iter_json_array(
+    chunks: Iterable[Union[bytes, str]],
+    keys: Optional[Collection[str]] = None,
+) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array as soon as each one is complete.
+
+    The payload may be a top-level array, or an object whose array lives under
+    a top-level key. With ``keys`` only those keys are considered; with None any
+    array-valued key is. The first such array with at least one element is
+    streamed; empty arrays and other top-level values are skipped. Only the
+    current element is held in memory, never the whole body.
+    """
+    buf = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+
+    def stream_array() -> Iterator[Any]:
+        buf.expect("[")
+        if buf.peek() == "]":
+            buf.pos += 1
+            return
+        while True:
+            yield buf.value(decoder)
+            if buf.expect(",]") == "]":
+                return
+
+    first = buf.peek()
+    if first == "[":
+        yield from stream_array()
+        return
+    if first != "{":
+        return
+    buf.pos += 1
+    if buf.peek() == "}":
+        return
+    while True:
+        key = buf.value(decoder)
+        buf.expect(":")
+        if buf.peek() == "[" and (keys is None or key in keys):
+            yielded = False
+            for item in stream_array():
+                yielded = True
+                yield item
+            if yielded:
+                return
+        else:
+            buf.value(decoder)
+        if buf.expect(",}") == "}":
+            return
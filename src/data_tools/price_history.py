@@ -0,0 +1,259 @@
+"""Memory-mapped (symbols x trading days) close/volume matrices for the whole universe."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data_tools.bar_store import DailyBarStore, get_bar_store
+from src.data_tools.config import load_cache_config
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+
+class PriceHistoryStore:
+    """
+    Read-only view of a built price history.
+
+    ``closes`` and ``volumes`` are ``np.load(..., mmap_mode="r")`` arrays of shape
+    (len(symbols), len(dates)); a missing bar is NaN close / 0 volume. Row and
+    column slices are views onto the mapped file, so worker processes opening
+    the same generation share page-cache pages instead of holding copies.
+
+    Each symbol carries the calendar range that was fully fetched when the
+    history was built; reads outside it return None so callers fall back to
+    the bar store.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        index = json.loads((self.root / INDEX_FILE).read_text(encoding="utf-8"))
+        generation = self.root / index["generation"]
+        self.symbols: List[str] = list(index["symbols"])
+        self.dates = np.array(index["dates"], dtype="datetime64[D]")
+        self.built_at: float = float(index.get("built_at", 0.0))
+        self.closes: np.ndarray = np.load(generation / "closes.npy", mmap_mode="r")
+        self.volumes: np.ndarray = np.load(generation / "volumes.npy", mmap_mode="r")
+        self._rows: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        self._coverage: Dict[str, Tuple[np.datetime64, np.datetime64]] = {
+            s: (np.datetime64(c[0], "D"), np.datetime64(c[1], "D"))
+            for s, c in (index.get("coverage") or {}).items()
+            if c
+        }
+        if self.closes.shape != (len(self.symbols), len(self.dates)):
+            raise ValueError(f"Price history at {generation} does not match its index")
+
+    def row(self, symbol: str) -> Optional[int]:
+        return self._rows.get(symbol.upper())
+
+    def columns(self, start: Optional[date] = None, end: Optional[date] = None) -> slice:
+        """Column slice for trading days within [start, end]."""
+        lo = int(np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")) if start else 0
+        hi = int(np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")) if end else len(self.dates)
+        return slice(lo, hi)
+
+    def covers(self, symbol: str, start: date, end: date) -> bool:
+        coverage = self._coverage.get(symbol.upper())
+        if coverage is None:
+            return False
+        return coverage[0] <= np.datetime64(start, "D") and coverage[1] >= np.datetime64(end, "D")
+
+    def history(self, symbol: str, start: Optional[date] = None, end: Optional[date] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(dates, closes, volumes) views for one symbol; raises KeyError if unknown."""
+        row = self.row(symbol)
+        if row is None:
+            raise KeyError(symbol)
+        cols = self.columns(start, end)
+        return self.dates[cols], self.closes[row, cols], self.volumes[row, cols]
+
+    def bars(self, symbol: str, start: date, end: date) -> Optional[List[Dict]]:
+        """Bars for [start, end] in bar-store format, or None if the history does not cover the window."""
+        if self.row(symbol) is None or not self.covers(symbol, start, end):
+            return None
+        dates, closes, volumes = self.history(symbol, start, end)
+        return [
+            {"date": str(d), "close": float(c), "volume": float(v)}
+            for d, c, v in zip(dates, closes, volumes)
+            if not np.isnan(c)
+        ]
+
+
+def write_price_history(
+    root: str | Path,
+    symbols: Sequence[str],
+    dates: Sequence[str],
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    coverage: Optional[Dict[str, Tuple[str, str]]] = None,
+) -> PriceHistoryStore:
+    """
+    Write a new generation and atomically point the index at it.
+
+    Readers holding the previous generation keep their mapping; older
+    generations are removed.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    generation = f"gen-{time.time_ns()}"
+    gen_dir = root / generation
+    gen_dir.mkdir()
+    np.save(gen_dir / "closes.npy", np.asarray(closes, dtype=np.float64))
+    np.save(gen_dir / "volumes.npy", np.asarray(volumes, dtype=np.float64))
+    index = {
+        "generation": generation,
+        "symbols": list(symbols),
+        "dates": list(dates),
+        "coverage": coverage or {},
+        "built_at": time.time(),
+    }
+    tmp = root / f"{INDEX_FILE}.tmp"
+    tmp.write_text(json.dumps(index), encoding="utf-8")
+    previous = None
+    if (root / INDEX_FILE).exists():
+        previous = json.loads((root / INDEX_FILE).read_text(encoding="utf-8")).get("generation")
+    os.replace(tmp, root / INDEX_FILE)
+    for old in root.glob("gen-*"):
+        if old.name not in (generation, previous):
+            shutil.rmtree(old, ignore_errors=True)
+    return PriceHistoryStore(root)
+
+
+def _universe_symbols(bar_store: DailyBarStore) -> List[str]:
+    """Refmaster symbols plus anything already in the bar store."""
+    symbols = set(bar_store.tickers())
+    try:
+        from src.refmaster.normalizer_agent import load_equities
+
+        symbols.update(eq.symbol for eq in load_equities())
+    except (FileNotFoundError, ValueError) as exc:
+        logger.info("refmaster unavailable, using bar store tickers only: %s", exc)
+    return sorted(symbols)
+
+
+def build_price_history(
+    symbols: Optional[Iterable[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    bar_store: Optional[DailyBarStore] = None,
+    root: Optional[str | Path] = None,
+) -> PriceHistoryStore:
+    """
+    Build the matrices from the daily bar store.
+
+    Args:
+        symbols: Rows to include; defaults to refmaster symbols plus bar-store tickers.
+        start: First day to include (default: earliest stored bar).
+        end: Last day to include (default: latest stored bar).
+        bar_store: Source store; defaults to the configured bar store.
+        root: Output directory; defaults to ``<DATA_TOOLS_CACHE_DIR>/price_history``.
+    """
+    bar_store = bar_store or get_bar_store()
+    if bar_store is None:
+        raise ValueError("Bar cache is disabled (DATA_TOOLS_BAR_CACHE=0); nothing to build from")
+    symbols = [s.upper().strip() for s in symbols] if symbols is not None else _universe_symbols(bar_store)
+    lo, hi = start or date.min, end or date.max
+
+    bars_by_symbol = {s: bar_store.get_bars(s, lo, hi) for s in symbols}
+    dates = sorted({b["date"] for bars in bars_by_symbol.values() for b in bars})
+    column = {d: i for i, d in enumerate(dates)}
+    closes = np.full((len(symbols), len(dates)), np.nan)
+    volumes = np.zeros((len(symbols), len(dates)))
+    coverage: Dict[str, Tuple[str, str]] = {}
+    for row, symbol in enumerate(symbols):
+        for bar in bars_by_symbol[symbol]:
+            col = column[bar["date"]]
+            closes[row, col] = bar["close"]
+            volumes[row, col] = bar.get("volume") or 0.0
+        covered = bar_store.coverage(symbol)
+        if covered:
+            covered_start, covered_end = max(covered[0], lo), min(covered[1], hi)
+            if covered_start <= covered_end:
+                coverage[symbol] = (covered_start.isoformat(), covered_end.isoformat())
+
+    root = Path(root) if root else _default_root()
+    store = write_price_history(root, symbols, dates, closes, volumes, coverage)
+    logger.info("price history built symbols=%d days=%d path=%s", len(symbols), len(dates), root)
+    return store
+
+
+def _default_root() -> Path:
+    return Path(load_cache_config()["cache_dir"]) / "price_history"
+
+
+_loaded: Dict[Path, Tuple[Tuple[int, int], PriceHistoryStore]] = {}
+_loaded_lock = threading.Lock()
+
+
+def get_price_history() -> Optional[PriceHistoryStore]:
+    """
+    Return the built history for the configured cache dir, or None if absent/disabled.
+
+    The store is re-opened when index.json changes, so long-running workers
+    pick up a rebuild without restarting.
+    """
+    cfg = load_cache_config()
+    if not cfg["price_history_enabled"]:
+        return None
+    root = Path(cfg["cache_dir"]) / "price_history"
+    try:
+        stat = (root / INDEX_FILE).stat()
+    except FileNotFoundError:
+        return None
+    # index.json is replaced atomically on rebuild, so its inode identifies the generation.
+    version = (stat.st_ino, stat.st_mtime_ns)
+    with _loaded_lock:
+        cached = _loaded.get(root)
+        if cached and cached[0] == version:
+            return cached[1]
+        try:
+            store = PriceHistoryStore(root)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("price history at %s unreadable: %s", root, exc)
+            return None
+        _loaded[root] = (version, store)
+        return store
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the memory-mapped price history from the daily bar cache")
+    parser.add_argument("--symbols", nargs="*", help="Symbols to include (default: refmaster + cached tickers)")
+    parser.add_argument("--start", type=date.fromisoformat, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Stream [start, end] bars from the vendor into the bar cache before building (requires --start)",
+    )
+    args = parser.parse_args(argv)
+    if args.backfill:
+        if not args.start:
+            parser.error("--backfill requires --start")
+        from src.data_tools.fd_api import backfill_price_bars
+
+        bar_store = get_bar_store()
+        if bar_store is None:
+            parser.error("--backfill needs the bar cache (DATA_TOOLS_BAR_CACHE=1)")
+        symbols = args.symbols or _universe_symbols(bar_store)
+        stored, failures = backfill_price_bars(symbols, args.start, args.end or date.today())
+        print(f"Backfilled {sum(stored.values())} bars for {len(stored)} symbols; {len(failures)} failed")
+        for symbol, exc in failures.items():
+            logger.warning("backfill failed for %s: %s", symbol, exc)
+    store = build_price_history(symbols=args.symbols or None, start=args.start, end=args.end)
+    print(f"Built price history: {len(store.symbols)} symbols x {len(store.dates)} days at {store.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,32 +1,52 @@
 """Extract Q&A pairs and structured fundamentals from 10-K filings."""
 
-import json
+import hashlib
 import os
-import re
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import pandas as pd
 from dotenv import load_dotenv
 from financial_datasets.generator import DatasetGenerator
 from financial_datasets.parser import FilingItem, FilingParser
+from langchain_text_splitters import TokenTextSplitter
 
+from src.data_tools.batch import fetch_many
+from src.data_tools.filing_cache import get_filing_cache
+from src.data_tools.qa_checkpoint import QACheckpoint
+from src.data_tools.revenue_scanner import scan_revenue_table
 from src.data_tools.schemas import QAPair
 
 # Load environment variables
 load_dotenv()
 
+# Token chunking for Q&A generation (DatasetGenerator.generate_from_10K defaults).
+QA_CHUNK_SIZE = 1024
+QA_CHUNK_OVERLAP = 100
+
+
+def _fetch_items(ticker: str, year: int, item_names: List[str]) -> Tuple[List[str], Optional[str]]:
+    """
+    (items, filing digest) for a FilingParser selection, from the filing cache when present.
+
+    The digest keys values derived from the items (see FilingCache); it is
+    None when the cache is disabled.
+    """
+    cache = get_filing_cache()
+    if cache is not None:
+        items = cache.get_items(ticker, year, item_names)
+        if items is not None:
+            return items, cache.filing_digest(ticker, year, item_names)
+    items = FilingParser().get_10K_items(ticker=ticker, year=year, item_names=item_names)
+    if cache is None or not items:
+        return items, None
+    return items, cache.put_items(ticker, year, item_names, items)
+
 
 def extract_mda_section(ticker: str, year: int) -> Optional[str]:
     """Return Item 7 (MD&A) text; raise with context on parser/network failures."""
-    parser = FilingParser()
     try:
-        items = parser.get_10K_items(
-            ticker=ticker,
-            year=year,
-            item_names=[FilingItem.ITEM_7]
-        )
+        items, _ = _fetch_items(ticker, year, [FilingItem.ITEM_7.value])
         if items and len(items) > 0:
             return items[0]
         return None
@@ -36,13 +56,8 @@ def extract_mda_section(ticker: str, year: int) -> Optional[str]:
 
 def extract_full_10k(ticker: str, year: int) -> Optional[str]:
     """Return concatenated 10-K text; raise with context on parser/network failures."""
-    parser = FilingParser()
     try:
-        items = parser.get_10K_items(
-            ticker=ticker,
-            year=year,
-            item_names=[]
-        )
+        items, _ = _fetch_items(ticker, year, [])
         if items:
             return "\n\n".join(items)
         return None
@@ -62,13 +77,8 @@ def get_10k_items(ticker: str, year: int, item_names: Optional[List[str]] = None
     Returns:
         List of HTML strings for the requested sections.
     """
-    parser = FilingParser()
     try:
-        return parser.get_10K_items(
-            ticker=ticker,
-            year=year,
-            item_names=item_names or []
-        )
+        return _fetch_items(ticker, year, item_names or [])[0]
     except Exception as exc:
         raise RuntimeError(f"Failed to fetch 10-K items for {ticker} {year}") from exc
 
@@ -119,64 +129,9 @@ def _flatten_dataset(dataset) -> List[QAPair]:
     return qa_pairs
 
 
-def _parse_numeric(value) -> Optional[float]:
-    """Convert textual cell values to floats."""
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text or text in {"-", "—", "N/A"}:
-        return None
-    text = text.replace(",", "").replace("$", "")
-    if text.startswith("(") and text.endswith(")"):
-        text = f"-{text[1:-1]}"
-    try:
-        return float(text)
-    except ValueError:
-        return None
-
-
-YEAR_PATTERN = re.compile(r"(20\d{2})")
-
-
 def _extract_revenue_from_html(html: str, max_years: int = 4) -> List[dict]:
-    """Parse HTML tables for revenue rows and return [{year, value}]."""
-    try:
-        tables = pd.read_html(StringIO(html))
-    except ValueError:
-        return []
-
-    for table in tables:
-        if table.empty or table.shape[1] < 2:
-            continue
-        table = table.dropna(how="all", axis=1)
-        if table.empty or table.shape[1] < 2:
-            continue
-
-        first_col = table.columns[0]
-        for _, row in table.iterrows():
-            label = str(row.get(first_col, "")).lower()
-            if "revenue" not in label:
-                continue
-            if "total" not in label and "net" not in label and not label.startswith("revenue"):
-                continue
-
-            entries: List[dict] = []
-            for col in table.columns[1:]:
-                year_match = YEAR_PATTERN.search(str(col))
-                if not year_match:
-                    continue
-                value = _parse_numeric(row.get(col))
-                if value is None:
-                    continue
-                entries.append({"year": int(year_match.group(1)), "value": value})
-
-            if entries:
-                entries.sort(key=lambda item: item["year"], reverse=True)
-                return entries[:max_years]
-
-    return []
+    """Find the first revenue row in the HTML's tables and return [{year, value}]."""
+    return scan_revenue_table(html, max_years=max_years)
 
 
 def extract_revenue_history(
@@ -187,30 +142,118 @@ def extract_revenue_history(
     """
     Extract a normalized revenue series from a 10-K filing.
 
+    The series is cached by filing content, so repeat calls on the same
+    filing neither refetch nor reparse it.
+
     Returns:
         List of dicts [{"year": 2024, "value": ...}, ...] sorted by year desc.
     """
-    items = get_10k_items(ticker=ticker, year=year, item_names=[])
+    try:
+        items, digest = _fetch_items(ticker, year, [])
+    except Exception as exc:
+        raise RuntimeError(f"Failed to fetch 10-K items for {ticker} {year}") from exc
     if not items:
         raise RuntimeError(f"No 10-K content available for {ticker} {year}")
 
+    cache = get_filing_cache() if digest else None
+    derived = f"revenue-scan-{max_years}"
+    if cache is not None:
+        cached = cache.get_derived(digest, derived)
+        if cached is not None:
+            return cached
+
     for html in items:
         entries = _extract_revenue_from_html(html, max_years=max_years)
         if entries:
+            if cache is not None:
+                cache.put_derived(digest, derived, entries)
             return entries
 
     raise RuntimeError(f"Unable to locate revenue table for {ticker} {year}")
 
 
+def _extract_filing(job: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Process-pool worker: warm the cache for one filing and summarize it."""
+    ticker, year, max_years = job
+    full = get_10k_items(ticker, year, [])
+    mda = extract_mda_section(ticker, year)
+    summary: Dict[str, Any] = {
+        "ticker": ticker,
+        "year": year,
+        "items": len(full),
+        "mda_chars": len(mda or ""),
+    }
+    try:
+        summary["revenue"] = extract_revenue_history(ticker, year, max_years=max_years)
+    except RuntimeError as exc:
+        summary["revenue_error"] = str(exc)
+    return summary
+
+
+def extract_filings(
+    pairs: Iterable[Tuple[str, int]],
+    max_workers: Optional[int] = None,
+    max_years: int = 4,
+) -> Tuple[Dict[Tuple[str, int], Dict[str, Any]], Dict[Tuple[str, int], Exception]]:
+    """
+    Fetch, parse and extract many 10-K filings concurrently across processes.
+
+    Each (ticker, year) is handled by one worker process, which stores the full
+    filing, its MD&A and the revenue series in the filing cache. Later
+    get_10k_items, extract_revenue_history or generate_qa calls on those
+    filings are served from the cache.
+
+    Args:
+        pairs: (ticker, year) filings; duplicates are processed once.
+        max_workers: Worker processes (default: CPU count); 1 runs inline.
+        max_years: Revenue history length.
+
+    Returns:
+        Tuple of (summary by filing, exception by filing). A failing filing
+        never aborts the rest of the batch.
+    """
+    jobs = list(dict.fromkeys((ticker.strip().upper(), int(year)) for ticker, year in pairs))
+    results: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    errors: Dict[Tuple[str, int], Exception] = {}
+    if not jobs:
+        return results, errors
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1:
+        for key in jobs:
+            try:
+                results[key] = _extract_filing((*key, max_years))
+            except Exception as exc:
+                errors[key] = exc
+        return results, errors
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_extract_filing, (*key, max_years)): key for key in jobs}
+        for fut in as_completed(futures):
+            key = futures[fut]
+            try:
+                results[key] = fut.result()
+            except Exception as exc:
+                errors[key] = exc
+    ordered = {key: results[key] for key in jobs if key in results}
+    return ordered, errors
+
+
 def generate_qa(
     ticker: str,
     year: int,
     max_questions: int = 100,
     use_mda_only: bool = True,
     model: str = "gpt-4-turbo",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    checkpoint: Optional[QACheckpoint] = None
 ) -> List[QAPair]:
-    """Generate Q&A pairs from a 10-K using DatasetGenerator; surfaces errors instead of printing."""
+    """
+    Generate Q&A pairs from a 10-K using DatasetGenerator; surfaces errors instead of printing.
+
+    With a checkpoint, text chunks are generated one at a time and each
+    chunk's pairs are committed as soon as they exist; chunks the checkpoint
+    already holds are skipped and count toward max_questions. Returns the
+    pairs generated by this call.
+    """
     openai_key = api_key or _get_openai_api_key()
     generator = DatasetGenerator(
         model=model,
@@ -218,15 +261,45 @@ def generate_qa(
     )
     
     item_names = ["Item 7"] if use_mda_only else []
+    items = get_10k_items(ticker=ticker, year=year, item_names=item_names)
     
-    dataset = generator.generate_from_10K(
-        ticker=ticker,
-        year=year,
-        max_questions=max_questions,
-        item_names=item_names
-    )
+    # Same chunking as DatasetGenerator.generate_from_10K, on cached items.
+    splitter = TokenTextSplitter(chunk_size=QA_CHUNK_SIZE, chunk_overlap=QA_CHUNK_OVERLAP)
+    texts = [chunk for item in items for chunk in splitter.split_text(item)]
+    if not texts:
+        return []
     
-    return _flatten_dataset(dataset)
+    if checkpoint is None:
+        dataset = generator.generate_from_texts(
+            texts=texts,
+            max_questions=max_questions
+        )
+        return _flatten_dataset(dataset)
+    
+    # Per-chunk budget as in DatasetGenerator.generate_from_texts.
+    per_text, remainder = divmod(max_questions, len(texts))
+    generated: List[QAPair] = []
+    pending = 0
+    for index, text in enumerate(texts):
+        if checkpoint.pairs >= max_questions:
+            break
+        if checkpoint.is_done(index):
+            continue
+        budget = per_text + (1 if index < remainder else 0)
+        if budget <= 0:
+            checkpoint.commit(index, [])
+            continue
+        dataset = generator.generate_from_texts(texts=[text], max_questions=budget)
+        qa_pairs = _flatten_dataset(dataset)[: max_questions - checkpoint.pairs]
+        if not qa_pairs:
+            # The generator logs and swallows per-chunk failures; leave the chunk for a rerun.
+            pending += 1
+            continue
+        checkpoint.commit(index, qa_pairs)
+        generated.extend(qa_pairs)
+    if not pending:
+        checkpoint.finish()
+    return generated
 
 
 def extract_qa_from_10k(
@@ -236,11 +309,16 @@ def extract_qa_from_10k(
     use_mda_only: bool = True,
     max_questions: int = 100,
     model: str = "gpt-4-turbo",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    resume: bool = True
 ) -> int:
     """
     Extract Q&A pairs from a 10-K filing and save to JSONL file.
     
+    Pairs are appended and flushed chunk by chunk, with progress recorded in
+    ``<output_file>.manifest.json``; rerunning with the same arguments
+    resumes after the last committed chunk.
+    
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL", "MSFT")
         year: Year of the 10-K filing
@@ -249,37 +327,51 @@ def extract_qa_from_10k(
         max_questions: Maximum number of Q&A pairs to generate
         model: OpenAI model to use (default: "gpt-4-turbo")
         api_key: OpenAI API key. If None, uses OPENAI_API_KEY from .env file.
+        resume: Continue from an existing checkpoint; False starts the output over.
         
     Returns:
-        Number of Q&A pairs extracted
+        Number of Q&A pairs in the output file
         
     Raises:
         ValueError: If OPENAI_API_KEY is not set and api_key is not provided
     """
-    # Generate Q&A pairs directly from 10-K using DatasetGenerator
-    qa_pairs = generate_qa(
+    # Generate Q&A pairs chunk by chunk, committing each chunk to the JSONL as it completes
+    checkpoint = QACheckpoint(
+        output_file,
+        {
+            "ticker": ticker.strip().upper(),
+            "year": year,
+            "use_mda_only": use_mda_only,
+            "max_questions": max_questions,
+            "model": model,
+            "chunking": [QA_CHUNK_SIZE, QA_CHUNK_OVERLAP],
+        },
+        resume=resume,
+    )
+    if checkpoint.complete:
+        print(f"{output_file} already complete with {checkpoint.pairs} Q&A pairs")
+        return checkpoint.pairs
+    if checkpoint.resumed:
+        print(f"Resuming {output_file}: {checkpoint.pairs} Q&A pairs from {len(checkpoint.done)} chunks")
+    
+    generate_qa(
         ticker=ticker,
         year=year,
         max_questions=max_questions,
         use_mda_only=use_mda_only,
         model=model,
-        api_key=api_key
+        api_key=api_key,
+        checkpoint=checkpoint
     )
     
-    if not qa_pairs:
+    if not checkpoint.pairs:
+        checkpoint.discard()
         raise RuntimeError(f"No Q&A pairs generated for {ticker} {year}; check filings or generator output.")
     
-    # Write to JSONL file
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        for qa_pair in qa_pairs:
-            json_line = json.dumps(qa_pair.model_dump(), ensure_ascii=False)
-            f.write(json_line + "\n")
-    
-    print(f"Extracted {len(qa_pairs)} Q&A pairs to {output_file}")
-    return len(qa_pairs)
+    if not checkpoint.complete:
+        print(f"Some chunks of {ticker} {year} produced no Q&A pairs; rerun to retry them")
+    print(f"Extracted {checkpoint.pairs} Q&A pairs to {output_file}")
+    return checkpoint.pairs
 
 
 def generate_qa_from_file(
@@ -328,7 +420,8 @@ def extract_qa_from_file(
     output_file: str,
     max_questions: int = 100,
     model: str = "gpt-4-turbo",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    resume: bool = True
 ) -> int:
     """
     Extract Q&A pairs from a 10-K HTML file URL or local file and save to JSONL file.
@@ -347,15 +440,25 @@ def extract_qa_from_file(
         max_questions: Maximum number of Q&A pairs to generate
         model: OpenAI model to use (default: "gpt-4-turbo")
         api_key: OpenAI API key. If None, uses OPENAI_API_KEY from .env file.
+        resume: Skip generation if a previous run already completed this output.
         
     Returns:
-        Number of Q&A pairs extracted
+        Number of Q&A pairs in the output file
         
     Raises:
         ValueError: If OPENAI_API_KEY is not set and api_key is not provided
         FileNotFoundError: If local file path doesn't exist
     """
-    # Generate Q&A pairs from HTML file
+    # The generator handles the whole file in one call, so the file is the checkpoint unit
+    checkpoint = QACheckpoint(
+        output_file,
+        {"file_url": file_url, "max_questions": max_questions, "model": model},
+        resume=resume,
+    )
+    if checkpoint.complete:
+        print(f"{output_file} already complete with {checkpoint.pairs} Q&A pairs")
+        return checkpoint.pairs
+    
     qa_pairs = generate_qa_from_file(
         file_url=file_url,
         max_questions=max_questions,
@@ -364,16 +467,61 @@ def extract_qa_from_file(
     )
     
     if not qa_pairs:
+        checkpoint.discard()
         raise RuntimeError(f"No Q&A pairs generated from file: {file_url}")
     
-    # Write to JSONL file
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint.commit(0, qa_pairs)
+    checkpoint.finish()
+    print(f"Extracted {checkpoint.pairs} Q&A pairs to {output_file}")
+    return checkpoint.pairs
+
+
+def _batch_output_name(job: Union[Tuple[str, int], str]) -> str:
+    """Output file for a batch job; file jobs carry a hash of the full URL/path so equal stems do not collide."""
+    if isinstance(job, str):
+        from urllib.parse import urlparse
+        
+        digest = hashlib.sha256(job.encode("utf-8")).hexdigest()[:8]
+        return f"{Path(urlparse(job).path or job).stem}_{digest}_qa.jsonl"
+    ticker, year = job
+    return f"{ticker.strip().upper()}_{year}_qa.jsonl"
+
+
+def extract_qa_batch(
+    jobs: Iterable[Union[Tuple[str, int], str]],
+    output_dir: str,
+    max_workers: Optional[int] = None,
+    resume: bool = True,
+    **kwargs: Any
+) -> Tuple[Dict[Union[Tuple[str, int], str], int], Dict[Union[Tuple[str, int], str], Exception]]:
+    """
+    Extract Q&A pairs for many filings into one JSONL per filing under output_dir.
+    
+    Jobs are (ticker, year) 10-K filings or file URLs/paths. They share one
+    thread pool bounded by max_workers (default DATA_TOOLS_MAX_CONCURRENCY);
+    each output checkpoints on its own, so rerunning the batch skips finished
+    filings and resumes partial ones.
+    
+    Args:
+        jobs: Filings to process.
+        output_dir: Directory for ``<TICKER>_<year>_qa.jsonl`` /
+            ``<file stem>_<url hash>_qa.jsonl``.
+        max_workers: Concurrent filings.
+        resume: Continue from existing checkpoints.
+        **kwargs: Passed to extract_qa_from_10k / extract_qa_from_file
+            (max_questions, model, api_key; use_mda_only for 10-K jobs).
+        
+    Returns:
+        Tuple of (pair count by job, exception by job).
+    """
+    out = Path(output_dir)
+    file_kwargs = {k: v for k, v in kwargs.items() if k != "use_mda_only"}
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        for qa_pair in qa_pairs:
-            json_line = json.dumps(qa_pair.model_dump(), ensure_ascii=False)
-            f.write(json_line + "\n")
+    def run(job: Union[Tuple[str, int], str]) -> int:
+        output_file = str(out / _batch_output_name(job))
+        if isinstance(job, str):
+            return extract_qa_from_file(job, output_file, resume=resume, **file_kwargs)
+        ticker, year = job
+        return extract_qa_from_10k(ticker, year, output_file, resume=resume, **kwargs)
     
-    print(f"Extracted {len(qa_pairs)} Q&A pairs to {output_file}")
-    return len(qa_pairs)
+    return fetch_many(run, jobs, max_workers=max_workers)
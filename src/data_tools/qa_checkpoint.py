@@ -0,0 +1,102 @@
+"""Append-only JSONL output for Q&A generation with a resumable checkpoint manifest."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.data_tools.schemas import QAPair
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class QACheckpoint:
+    """
+    JSONL writer that commits Q&A pairs per unit of work (a text chunk or a whole file).
+
+    ``commit`` appends the unit's pairs, flushes and fsyncs the JSONL, then
+    atomically rewrites ``<output>.manifest.json`` with the committed units,
+    pair count and file size. On reopen with the same ``source`` the file is
+    truncated to the last committed size (dropping a half-written unit) and
+    committed units are skipped; a different ``source`` (other filing,
+    model, question budget...) starts the output over.
+    """
+
+    def __init__(self, output_file: str | Path, source: Dict[str, Any], resume: bool = True) -> None:
+        self.path = Path(output_file)
+        self.manifest_path = self.path.with_name(f"{self.path.name}.manifest.json")
+        self.source = source
+        self.key = hashlib.sha256(json.dumps(source, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        manifest = self._read_manifest() if resume else None
+        if manifest is None or manifest.get("key") != self.key:
+            manifest = {"key": self.key, "source": source, "done": [], "pairs": 0, "bytes": 0, "complete": False}
+        self.done: Set[int] = set(manifest["done"])
+        self.pairs = int(manifest["pairs"])
+        self.complete = bool(manifest["complete"])
+        self.resumed = bool(self.done)
+        self._bytes = int(manifest["bytes"])
+        # Drop anything written after the last commit (or everything, when starting over).
+        with open(self.path, "a+b") as fh:
+            fh.truncate(self._bytes)
+        self._write_manifest()
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not self.path.exists() or self.path.stat().st_size < int(manifest.get("bytes", 0)):
+            return None  # output removed or cut short behind our back
+        return manifest
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "key": self.key,
+            "source": self.source,
+            "done": sorted(self.done),
+            "pairs": self.pairs,
+            "bytes": self._bytes,
+            "complete": self.complete,
+        }
+        _atomic_write(self.manifest_path, json.dumps(manifest, indent=2, default=str))
+
+    def is_done(self, unit: int) -> bool:
+        return unit in self.done
+
+    def commit(self, unit: int, qa_pairs: Iterable[QAPair]) -> int:
+        """Durably append a unit's pairs and mark it done; returns the number written."""
+        lines = [json.dumps(qa.model_dump(), ensure_ascii=False) + "\n" for qa in qa_pairs]
+        with open(self.path, "ab") as fh:
+            fh.write("".join(lines).encode("utf-8"))
+            fh.flush()
+            os.fsync(fh.fileno())
+            self._bytes = fh.tell()
+        self.done.add(unit)
+        self.pairs += len(lines)
+        self._write_manifest()
+        return len(lines)
+
+    def finish(self) -> None:
+        """Mark the output complete so a rerun returns it without generating."""
+        self.complete = True
+        self._write_manifest()
+
+    def discard(self) -> None:
+        """Remove the output and manifest (nothing worth keeping was produced)."""
+        self.path.unlink(missing_ok=True)
+        self.manifest_path.unlink(missing_ok=True)
+
+    def read(self) -> List[QAPair]:
+        """All committed pairs."""
+        with open(self.path, "r", encoding="utf-8") as fh:
+            return [QAPair(**json.loads(line)) for line in fh if line.strip()]
@@ -0,0 +1,329 @@
+"""Per-vendor token buckets and adaptive (AIMD) concurrency for outbound API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from src.data_tools.config import load_cache_config, load_http_config, load_rate_limit_config
+
+try:  # POSIX only; the file backend falls back to per-process buckets elsewhere.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class RateLimitError(requests.exceptions.RequestException):
+    """Vendor answered 429; ``retry_after`` is the pause (seconds) it asked for, if any."""
+
+    def __init__(self, message: str, vendor: str = "", retry_after: Optional[float] = None, **kwargs: Any) -> None:
+        super().__init__(message, **kwargs)
+        self.vendor = vendor
+        self.retry_after = retry_after
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """True if exc, or any exception it wraps, is a RateLimitError."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        if isinstance(current, RateLimitError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def retry_after_seconds(response: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) from a response."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` tokens per second up to ``capacity``.
+
+    ``try_acquire`` never blocks; it either takes a token (returns 0.0) or
+    returns how long to wait before one is available, so sync and async
+    callers can sleep in their own way.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _take(self, tokens: float, updated: float, paused_until: float, now: float):
+        """Refill and try to take one token; return (wait, tokens, updated, paused_until)."""
+        if now < paused_until:
+            return paused_until - now, tokens, updated, paused_until
+        tokens = min(self.capacity, tokens + max(now - updated, 0.0) * self.rate)
+        if tokens >= 1.0:
+            return 0.0, tokens - 1.0, now, paused_until
+        return (1.0 - tokens) / self.rate, tokens, now, paused_until
+
+    def try_acquire(self) -> float:
+        with self._lock:
+            wait, self._tokens, self._updated, self._paused_until = self._take(
+                self._tokens, self._updated, self._paused_until, self._clock()
+            )
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and refuse tokens for ``seconds`` (vendor asked us to back off)."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = 0.0
+            self._updated = now
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    def acquire(self) -> float:
+        """Block until a token is taken; return seconds waited."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a lock-protected file, so every worker
+    process on the host draws from the same budget. Uses wall-clock time.
+    """
+
+    def __init__(self, path: str | Path, rate: float, capacity: float) -> None:
+        super().__init__(rate, capacity, clock=time.time)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def _update(self, fn):
+        with self._lock, open(self.path, "r+") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                parts = fh.read().split()
+                now = self._clock()
+                if len(parts) == 3:
+                    tokens, updated, paused_until = (float(p) for p in parts)
+                else:
+                    tokens, updated, paused_until = self.capacity, now, 0.0
+                result, tokens, updated, paused_until = fn(tokens, updated, paused_until, now)
+                fh.seek(0)
+                fh.truncate()
+                fh.write(f"{tokens!r} {updated!r} {paused_until!r}")
+                fh.flush()
+                return result
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    def try_acquire(self) -> float:
+        return self._update(lambda tokens, updated, paused_until, now: self._take(tokens, updated, paused_until, now))
+
+    def pause(self, seconds: float) -> None:
+        self._update(lambda tokens, updated, paused_until, now: (None, 0.0, now, max(paused_until, now + seconds)))
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on in-flight requests.
+
+    Each success adds ``1/limit`` (about +1 per round of requests); a 429 or a
+    latency spike (slower than ``latency_spike_factor`` x the EWMA latency)
+    multiplies the limit by ``decrease_factor``. Shared by all threads.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        latency_spike_factor: float = 3.0,
+        decrease_factor: float = 0.5,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        self.minimum = max(int(minimum), 1)
+        self.maximum = max(int(maximum or initial), self.minimum)
+        self.limit = float(min(max(int(initial), self.minimum), self.maximum))
+        self.latency_spike_factor = float(latency_spike_factor)
+        self.decrease_factor = float(decrease_factor)
+        self.ewma_alpha = float(ewma_alpha)
+        self.latency_ewma: Optional[float] = None
+        self.in_flight = 0
+        self.decreases = 0
+        self._cond = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency_s: Optional[float], throttled: bool = False) -> None:
+        with self._cond:
+            self.in_flight = max(self.in_flight - 1, 0)
+            spike = (
+                latency_s is not None
+                and self.latency_ewma is not None
+                and latency_s > self.latency_ewma * self.latency_spike_factor
+            )
+            if throttled or spike:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                self.decreases += 1
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / max(self.limit, 1.0))
+            if latency_s is not None and not throttled:
+                if self.latency_ewma is None:
+                    self.latency_ewma = latency_s
+                else:
+                    self.latency_ewma += self.ewma_alpha * (latency_s - self.latency_ewma)
+            self._cond.notify_all()
+
+
+class VendorRateLimiter:
+    """Token bucket (optional) plus adaptive concurrency for one vendor."""
+
+    def __init__(
+        self,
+        vendor: str,
+        concurrency: AdaptiveConcurrency,
+        bucket: Optional[TokenBucket] = None,
+        default_retry_after_s: float = 1.0,
+    ) -> None:
+        self.vendor = vendor
+        self.concurrency = concurrency
+        self.bucket = bucket
+        self.default_retry_after_s = float(default_retry_after_s)
+        self._lock = threading.Lock()
+        self._waited_s = 0.0
+        self._throttled = 0
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot and a token are available."""
+        self.concurrency.acquire()
+        if self.bucket is not None:
+            try:
+                waited = self.bucket.acquire()
+            except BaseException:
+                self.concurrency.release(None)
+                raise
+            if waited:
+                with self._lock:
+                    self._waited_s += waited
+
+    async def aacquire(self) -> None:
+        """Async acquire: sleeps on the event loop instead of blocking a thread."""
+        while not self.concurrency.try_acquire():
+            await asyncio.sleep(0.005)
+        if self.bucket is None:
+            return
+        try:
+            while True:
+                wait = self.bucket.try_acquire()
+                if wait <= 0:
+                    return
+                with self._lock:
+                    self._waited_s += wait
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.concurrency.release(None)
+            raise
+
+    def release(self, latency_s: Optional[float], status_code: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """Return the slot; a 429 halves concurrency and pauses the bucket for Retry-After."""
+        throttled = status_code == 429
+        self.concurrency.release(latency_s, throttled=throttled)
+        if throttled:
+            with self._lock:
+                self._throttled += 1
+            if self.bucket is not None:
+                self.bucket.pause(retry_after if retry_after is not None else self.default_retry_after_s)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waited, throttled = self._waited_s, self._throttled
+        return {
+            "rate_per_s": self.bucket.rate if self.bucket is not None else None,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+            "latency_ewma_s": self.concurrency.latency_ewma,
+            "backoffs": self.concurrency.decreases,
+            "throttled": throttled,
+            "waited_s": round(waited, 3),
+        }
+
+
+_limiters: Dict[str, VendorRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _build_limiter(vendor: str, cfg: Dict[str, Any]) -> VendorRateLimiter:
+    http_cfg = load_http_config()
+    concurrency = AdaptiveConcurrency(
+        initial=int(http_cfg["max_concurrency"]),
+        minimum=int(cfg["min_concurrency"]),
+        maximum=max(int(http_cfg["pool_maxsize"]), int(http_cfg["max_concurrency"])),
+        latency_spike_factor=float(cfg["latency_spike_factor"]),
+        decrease_factor=float(cfg["decrease_factor"]),
+    )
+    bucket: Optional[TokenBucket] = None
+    rps = cfg["vendor_rps"].get(vendor)
+    if rps:
+        capacity = float(rps) * float(cfg["burst_s"])
+        if cfg["backend"] == "file" and fcntl is not None:
+            path = Path(load_cache_config()["cache_dir"]) / "rate_limits" / f"{vendor}.bucket"
+            bucket = FileTokenBucket(path, float(rps), capacity)
+        else:
+            bucket = TokenBucket(float(rps), capacity)
+    return VendorRateLimiter(vendor, concurrency, bucket, float(cfg["default_retry_after_s"]))
+
+
+def get_rate_limiter(vendor: str) -> Optional[VendorRateLimiter]:
+    """Return the process-wide limiter for a vendor, or None when rate limiting is disabled."""
+    cfg = load_rate_limit_config()
+    if not cfg["enabled"]:
+        return None
+    limiter = _limiters.get(vendor)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(vendor)
+            if limiter is None:
+                limiter = _build_limiter(vendor, cfg)
+                _limiters[vendor] = limiter
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiters so the next call rebuilds them from current config."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,100 @@
+"""
+Slotted internal records for market data passed between data_tools, pricing, OMS and the orchestrator.
+
+Records mirror the fields of their pydantic schemas but skip validation and
+per-instance ``__dict__``s, so a 10k-ticker run allocates one small object
+per snapshot. Callers that hand data across the service boundary convert
+with ``to_model()``; everything else reads attributes or ``to_dict()``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from src.data_tools.schemas import EquitySnapshot, PriceSnapshot
+
+
+@dataclass(slots=True)
+class PriceRecord:
+    """Close and 1D/5D return multipliers for one ticker and date (see PriceSnapshot)."""
+
+    ticker: str
+    price: float
+    return_1d: float
+    return_5d: float
+    date: str
+    source: str = "financialdatasets.ai"
+
+    @classmethod
+    def from_bars(
+        cls,
+        ticker: str,
+        bars: Iterable[Dict[str, Any]],
+        date_str: str,
+        source: str = "financialdatasets.ai",
+    ) -> "PriceRecord":
+        """
+        Close and 1D/5D returns from ascending {date, close, volume} bars ending on date_str.
+
+        Zero-volume bars are treated as non-trading days and skipped.
+        """
+        price_points = []
+        for bar in bars:
+            volume = bar.get("volume", 0)
+            if volume and volume > 0:
+                price_points.append({"close": float(bar["close"]), "date": bar["date"]})
+
+        if not price_points:
+            raise ValueError(
+                f"Could not retrieve price data for ticker {ticker} on date {date_str}. "
+                f"API may not have data for this ticker/date."
+            )
+
+        closes = [p["close"] for p in price_points]
+        price = closes[-1]
+        as_of = str(price_points[-1]["date"] or date_str)
+
+        if len(closes) < 2:
+            raise ValueError(f"Insufficient data to compute 1D return for {ticker} ending {as_of}")
+        prev_price = closes[-2]
+        if prev_price <= 0:
+            raise ValueError(f"Invalid previous price for 1D return for {ticker} ending {as_of}")
+
+        if len(closes) < 6:
+            raise ValueError(f"Insufficient data to compute 5D return for {ticker} ending {as_of}")
+        price_5d_ago = closes[-6]
+        if price_5d_ago <= 0:
+            raise ValueError(f"Invalid historical price for 5D return for {ticker} ending {as_of}")
+
+        return cls(ticker, price, price / prev_price, price / price_5d_ago, as_of, source)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self) -> PriceSnapshot:
+        return PriceSnapshot(**self.to_dict())
+
+
+@dataclass(slots=True)
+class EquityRecord:
+    """Price action, company facts and optional risk metrics for one ticker (see EquitySnapshot)."""
+
+    ticker: str
+    price: float
+    market_cap: float
+    sector: str
+    date: str
+    return_1d: float = 1.0
+    return_5d: float = 1.0
+    industry: Optional[str] = None
+    source: str = "financialdatasets.ai"
+    volatility_20d: Optional[float] = None
+    drawdown: Optional[float] = None
+    max_drawdown: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self) -> EquitySnapshot:
+        return EquitySnapshot(**self.to_dict())
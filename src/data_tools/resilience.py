@@ -0,0 +1,394 @@
+"""Per-endpoint circuit breakers and hedged requests for vendor calls."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from src.data_tools.config import load_http_config, load_resilience_config
+from src.data_tools.rate_limit import RateLimitError
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """The endpoint's breaker is open; the call was rejected without reaching the vendor."""
+
+    def __init__(
+        self,
+        message: str,
+        vendor: str = "",
+        endpoint: str = "",
+        retry_in: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message, **kwargs)
+        self.vendor = vendor
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def is_circuit_open(exc: BaseException) -> bool:
+    """True if exc, or any exception it wraps, is a CircuitOpenError."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        if isinstance(current, CircuitOpenError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def endpoint_key(url: str, prefixes: Iterable[str]) -> str:
+    """Longest configured path prefix of url, or "*" for the vendor-wide breaker."""
+    path = urlparse(url).path or url
+    best = "*"
+    for prefix in prefixes:
+        if path.startswith(prefix) and (best == "*" or len(prefix) > len(best)):
+            best = prefix
+    return best
+
+
+def _is_failure(response: Any, exc: Optional[BaseException]) -> bool:
+    """Transport errors, timeouts and 5xx count against a breaker; throttling and 4xx do not."""
+    if exc is not None:
+        return not isinstance(exc, (RateLimitError, CircuitOpenError))
+    status = getattr(response, "status_code", None)
+    return status is not None and status >= 500
+
+
+def _is_throttled(response: Any, exc: Optional[BaseException]) -> bool:
+    """Rate-limit rejections (local RateLimitError or a vendor 429); neutral for a half-open trial."""
+    if exc is not None:
+        return isinstance(exc, RateLimitError)
+    return getattr(response, "status_code", None) == 429
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=max(int(size), 1))
+        self._lock = threading.Lock()
+
+    def add(self, latency_s: float) -> None:
+        with self._lock:
+            self._samples.append(latency_s)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """Nearest-rank quantile, or None with fewer than min_samples samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = min(max(math.ceil(q * len(samples)), 1), len(samples))
+        return samples[rank - 1]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker.
+
+    - closed: calls pass; ``failure_threshold`` failures in a row open it.
+    - open: calls are rejected for ``reset_s``.
+    - half_open: one trial call passes; success closes, failure reopens, and a
+      throttled trial (429) just frees the slot for the next trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_s: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.reset_s = float(reset_s)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_s:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> Optional[float]:
+        """None if the call may proceed, else seconds until the next trial call."""
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self._opened_at + self.reset_s - self._clock()
+                if remaining > 0:
+                    self.rejected += 1
+                    return remaining
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    self.rejected += 1
+                    return self.reset_s
+                self._trial_in_flight = True
+            return None
+
+    def record(self, failed: bool, throttled: bool = False) -> None:
+        with self._lock:
+            self._trial_in_flight = False
+            if throttled and self._state == self.HALF_OPEN:
+                # Throttling says nothing about the vendor's health; stay half-open.
+                return
+            if not failed:
+                self._failures = 0
+                self._state = self.CLOSED
+                return
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self.trips += 1
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            cfg = load_http_config()
+            workers = 2 * max(int(cfg["pool_maxsize"]), int(cfg["max_concurrency"]))
+            _hedge_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedge")
+        return _hedge_pool
+
+
+def _loses(future: Any) -> bool:
+    """Sort key putting usable hedged results (no exception, no 5xx) first."""
+    return future.exception() is not None or _is_failure(future.result(), None)
+
+
+def _close_loser(future: Future) -> None:
+    """Release the connection of a hedged attempt whose response nobody will read."""
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if callable(close):
+            close()
+
+
+class EndpointGuard:
+    """
+    Breaker, latency window and hedging for one (vendor, endpoint).
+
+    A hedged call runs the attempt on a worker; if it has not answered after
+    the endpoint's ``hedge_quantile`` latency, a duplicate attempt is sent and
+    the first response wins. Only idempotent GETs should be hedged. Each
+    attempt goes through the vendor rate limiter on its own.
+    """
+
+    def __init__(self, vendor: str, endpoint: str, config: Dict[str, Any]) -> None:
+        self.vendor = vendor
+        self.endpoint = endpoint
+        self.config = config
+        self.breaker = (
+            CircuitBreaker(config["breaker_failure_threshold"], config["breaker_reset_s"])
+            if config["breaker_enabled"]
+            else None
+        )
+        self.latencies = LatencyWindow(config["latency_window"])
+        self._lock = threading.Lock()
+        self._counts = {"calls": 0, "failures": 0, "hedges": 0, "hedge_wins": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or latency history is short."""
+        if not self.config["hedge_enabled"]:
+            return None
+        q = self.latencies.quantile(self.config["hedge_quantile"], int(self.config["hedge_min_samples"]))
+        return None if q is None else max(q, float(self.config["hedge_min_delay_s"]))
+
+    def _admit(self) -> None:
+        self._count("calls")
+        if self.breaker is None:
+            return
+        retry_in = self.breaker.allow()
+        if retry_in is not None:
+            raise CircuitOpenError(
+                f"{self.vendor} circuit open for {self.endpoint}; retry in {retry_in:.1f}s",
+                vendor=self.vendor,
+                endpoint=self.endpoint,
+                retry_in=retry_in,
+            )
+
+    def _finish(self, started: float, response: Any, exc: Optional[BaseException]) -> None:
+        failed = _is_failure(response, exc)
+        if failed:
+            self._count("failures")
+        elif exc is None:
+            self.latencies.add(time.perf_counter() - started)
+        if self.breaker is not None:
+            self.breaker.record(failed, throttled=_is_throttled(response, exc))
+
+    def call(self, attempt: Callable[[], Any], hedge: bool = False) -> Any:
+        """Run attempt under the breaker, hedging it when allowed and latency history exists."""
+        self._admit()
+        delay = self.hedge_delay() if hedge else None
+        started = time.perf_counter()
+        try:
+            response = attempt() if delay is None else self._hedged(attempt, delay)
+        except BaseException as exc:
+            self._finish(started, None, exc)
+            raise
+        self._finish(started, response, None)
+        return response
+
+    def _hedged(self, attempt: Callable[[], Any], delay: float) -> Any:
+        pool = _pool()
+        primary = pool.submit(attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        self._count("hedges")
+        secondary = pool.submit(attempt)
+        pending = {primary, secondary}
+        error: Optional[BaseException] = None
+        failed: Optional[Future] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=_loses):
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                if pending and _is_failure(future.result(), None):
+                    # A 5xx only wins once no other attempt can still succeed.
+                    failed = failed or future
+                    continue
+                if future is secondary:
+                    self._count("hedge_wins")
+                for other in pending:
+                    other.add_done_callback(_close_loser)
+                for other in (done | {failed}) - {future, None}:
+                    _close_loser(other)
+                return future.result()
+        if failed is not None:
+            return failed.result()
+        raise error
+
+    async def acall(self, attempt: Callable[[], Awaitable[Any]], hedge: bool = False) -> Any:
+        """Async variant of call; the losing hedged attempt is cancelled."""
+        self._admit()
+        delay = self.hedge_delay() if hedge else None
+        started = time.perf_counter()
+        try:
+            response = await attempt() if delay is None else await self._ahedged(attempt, delay)
+        except BaseException as exc:
+            self._finish(started, None, exc)
+            raise
+        self._finish(started, response, None)
+        return response
+
+    async def _ahedged(self, attempt: Callable[[], Awaitable[Any]], delay: float) -> Any:
+        primary = asyncio.ensure_future(attempt())
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            self._count("hedges")
+            secondary = asyncio.ensure_future(attempt())
+            pending = {primary, secondary}
+            error: Optional[BaseException] = None
+            failed: Optional[asyncio.Future] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=_loses):
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    if pending and _is_failure(task.result(), None):
+                        failed = failed or task
+                        continue
+                    if task is secondary:
+                        self._count("hedge_wins")
+                    return task.result()
+            if failed is not None:
+                return failed.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        p50 = self.latencies.quantile(0.5)
+        p95 = self.latencies.quantile(0.95)
+        breaker = self.breaker.stats() if self.breaker is not None else {"state": "disabled"}
+        return {
+            **breaker,
+            **counts,
+            "latency_samples": len(self.latencies),
+            "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedge_delay_ms": round(d * 1000, 1) if (d := self.hedge_delay()) is not None else None,
+        }
+
+
+_guards: Dict[Tuple[str, str], EndpointGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_guard(vendor: str, url: str) -> Optional[EndpointGuard]:
+    """Guard for the endpoint of url, or None when breakers and hedging are both disabled."""
+    cfg = load_resilience_config()
+    if not cfg["breaker_enabled"] and not cfg["hedge_enabled"]:
+        return None
+    key = (vendor, endpoint_key(url, cfg["breaker_endpoints"]))
+    with _guards_lock:
+        guard = _guards.get(key)
+        if guard is None or guard.config != cfg:
+            guard = EndpointGuard(key[0], key[1], cfg)
+            _guards[key] = guard
+        return guard
+
+
+def resilience_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Breaker state, latency quantiles and hedge counters by vendor and endpoint."""
+    with _guards_lock:
+        guards = list(_guards.values())
+    stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for guard in guards:
+        stats.setdefault(guard.vendor, {})[guard.endpoint] = guard.stats()
+    return stats
+
+
+def reset_resilience() -> None:
+    """Drop all guards so breakers close and latency history restarts (tests and config reloads)."""
+    with _guards_lock:
+        _guards.clear()
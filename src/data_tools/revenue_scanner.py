@@ -0,0 +1,167 @@
+"""
+Early-exit scan of filing HTML for the first revenue table row.
+
+The document is tokenized incrementally with ``html.parser`` and each table
+row is checked as soon as it closes; scanning stops at the first revenue row
+that yields year-labelled values, so the rest of a multi-megabyte 10-K is
+never tokenized and no DataFrame is built for any table.
+
+Year columns come from the table's most recent header row: a row whose cells
+are years (``2023``, ``Fiscal 2023``) and text such as ``Change``, with no
+other numbers. That covers ``<th>`` headers and the ``<td>`` year rows SEC
+filings use. Cells are placed by column with ``colspan`` applied, so a value
+is matched to the year header it sits under regardless of the ``$`` and
+spacer cells around it.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+YEAR_PATTERN = re.compile(r"(20\d{2})")
+# Row labels that name total revenue: "Revenue", "Total net revenues", "Net sales", "Total net sales".
+REVENUE_LABEL = re.compile(r"^(?:total\s+)?(?:net\s+)?revenues?\b|^(?:total\s+)?net\s+sales\b")
+_NUMBER = re.compile(r"^\(?-?[\d,]*\.?\d+\)?$")
+# Scanning stops between chunks; a chunk this size rarely holds more than a few rows.
+CHUNK_CHARS = 64 * 1024
+
+
+def _parse_numeric(value) -> Optional[float]:
+    """Convert textual cell values to floats."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if not text or text in {"-", "—", "N/A"}:
+        return None
+    text = text.replace(",", "").replace("$", "")
+    if text.startswith("(") and text.endswith(")"):
+        text = f"-{text[1:-1]}"
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _header_years(cells: List[Tuple[str, int, int]]) -> Optional[Dict[int, int]]:
+    """{column: year} for every column a year cell spans, if the row is a year header row."""
+    years: Dict[int, int] = {}
+    for text, col, span in cells:
+        # Column 0 holds row labels ("As of September 30, 2023"), never a year column.
+        if not text or col == 0:
+            continue
+        match = YEAR_PATTERN.search(text)
+        if match and len(text) <= 20:
+            years.update((c, int(match.group(1))) for c in range(col, col + span))
+        elif _NUMBER.match(text.replace("$", "").replace("%", "").strip()):
+            return None
+    return years or None
+
+
+class _Found(Exception):
+    """Raised from a parser callback to stop tokenizing once the revenue row is found."""
+
+
+class _RevenueTableScanner(HTMLParser):
+    def __init__(self, max_years: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.max_years = max_years
+        self.result: List[dict] = []
+        self.rows_checked = 0
+        # Per-table state, stacked for nested tables.
+        self._tables: List[Dict[int, int]] = []
+        self._row: Optional[List[Tuple[str, int, int]]] = None  # (text, first column, colspan)
+        self._cell: Optional[List[str]] = None
+        self._col = 0
+        self._span = 1
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self._tables.append({})
+        elif not self._tables:
+            return
+        elif tag == "tr":
+            self._row = []
+            self._col = 0
+        elif tag in ("td", "th") and self._row is not None:
+            self._close_cell()
+            self._cell = []
+            span = dict(attrs).get("colspan") or "1"
+            self._span = int(span) if span.isdigit() and int(span) > 0 else 1
+        elif tag == "br" and self._cell is not None:
+            self._cell.append(" ")
+
+    def handle_endtag(self, tag):
+        if not self._tables:
+            return
+        if tag in ("td", "th"):
+            self._close_cell()
+        elif tag == "tr":
+            self._close_row()
+        elif tag == "table":
+            self._close_row()
+            self._tables.pop()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _close_cell(self) -> None:
+        if self._cell is None or self._row is None:
+            return
+        text = " ".join("".join(self._cell).split())
+        self._row.append((text, self._col, self._span))
+        self._col += self._span
+        self._cell = None
+
+    def _close_row(self) -> None:
+        self._close_cell()
+        cells, self._row = self._row, None
+        if not cells:
+            return
+        self.rows_checked += 1
+        header = _header_years(cells)
+        if header is not None:
+            self._tables[-1] = header
+            return
+        years = self._tables[-1]
+        if not years:
+            return
+        label = next((i for i, cell in enumerate(cells) if cell[0]), None)
+        if label is None or not REVENUE_LABEL.match(cells[label][0].lower()):
+            return
+        entries: List[dict] = []
+        seen = set()
+        for text, col, span in cells[label + 1 :]:
+            year = next((years[c] for c in range(col, col + span) if c in years), None)
+            if year is None or year in seen:
+                continue
+            value = _parse_numeric(text)
+            if value is None:
+                continue
+            seen.add(year)
+            entries.append({"year": year, "value": value})
+        if entries:
+            entries.sort(key=lambda item: item["year"], reverse=True)
+            self.result = entries[: self.max_years]
+            raise _Found()
+
+
+def scan_revenue_table(html: str, max_years: int = 4) -> List[dict]:
+    """
+    First revenue row of the document as [{year, value}], newest first; [] if none.
+
+    Tokenizes ``html`` in CHUNK_CHARS pieces and stops at the first
+    qualifying row.
+    """
+    scanner = _RevenueTableScanner(max_years)
+    try:
+        for start in range(0, len(html), CHUNK_CHARS):
+            scanner.feed(html[start : start + CHUNK_CHARS])
+        scanner.close()
+    except _Found:
+        pass
+    return scanner.result
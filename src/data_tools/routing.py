@@ -0,0 +1,206 @@
+"""
+Latency-aware routing of price lookups across vendors.
+
+Each vendor's recent calls for an operation are tracked in a rolling window
+(latency of successful calls, rate of transport/vendor errors). A lookup goes
+to the fastest healthy vendor and falls back down the ranking when a vendor
+raises; the record's ``source`` names the vendor that answered.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import date
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from src.data_tools.batch import fetch_many
+from src.data_tools.config import load_routing_config
+from src.data_tools.records import PriceRecord
+
+PriceFetcher = Callable[[str, date], PriceRecord]
+
+
+def _fd_price(ticker: str, end_date: date) -> PriceRecord:
+    from src.data_tools import fd_api
+
+    return fd_api.get_price_record(ticker, end_date)
+
+
+def _fmp_price(ticker: str, end_date: date) -> PriceRecord:
+    from src.data_tools import fmp_api
+
+    return fmp_api.get_price_record(ticker, end_date)
+
+
+# vendor -> (fetcher, available). FinancialDatasets is always available because
+# its bar store and price history can answer without an API key.
+PRICE_SOURCES: Dict[str, Tuple[PriceFetcher, Callable[[], bool]]] = {
+    "financialdatasets": (_fd_price, lambda: True),
+    "fmp": (_fmp_price, lambda: bool(os.getenv("FMP_API_KEY"))),
+}
+
+
+class VendorHealth:
+    """Rolling (timestamp, latency_s, ok) outcomes for one vendor and operation."""
+
+    def __init__(self, window: int, window_s: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.window_s = float(window_s)
+        self._clock = clock
+        self._outcomes: Deque[Tuple[float, float, bool]] = deque(maxlen=max(int(window), 1))
+        self._lock = threading.Lock()
+
+    def record(self, latency_s: float, ok: bool) -> None:
+        with self._lock:
+            self._outcomes.append((self._clock(), latency_s, ok))
+
+    def snapshot(self) -> Tuple[int, Optional[float], float]:
+        """(recent calls, median latency of recent successes, recent error rate)."""
+        cutoff = self._clock() - self.window_s
+        with self._lock:
+            recent = [(lat, ok) for ts, lat, ok in self._outcomes if ts >= cutoff]
+        if not recent:
+            return 0, None, 0.0
+        latencies = sorted(lat for lat, ok in recent if ok)
+        median = latencies[max(math.ceil(0.5 * len(latencies)), 1) - 1] if latencies else None
+        errors = sum(1 for _, ok in recent if not ok)
+        return len(recent), median, errors / len(recent)
+
+
+class VendorRouter:
+    """
+    Routes one operation (e.g. price lookups) across interchangeable vendors.
+
+    Ranking: healthy vendors before unhealthy ones (recent error rate above
+    ``max_error_rate``); among them, vendors with fewer than ``min_samples``
+    recent calls first (so a vendor that was slow or failing a while ago is
+    re-probed once its window ages out), then lowest median latency, then
+    configured priority. Transport and vendor errors (RequestException) count
+    against a vendor; data errors such as an unknown ticker only cause a fallback.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        vendors: Dict[str, Callable[..., Any]],
+        config: Dict[str, Any],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.operation = operation
+        self.vendors = dict(vendors)
+        self.config = config
+        self._health = {name: VendorHealth(config["window"], config["window_s"], clock) for name in self.vendors}
+        self._lock = threading.Lock()
+        self._served = {name: 0 for name in self.vendors}
+        self._fallbacks = 0
+
+    def ranked(self) -> List[str]:
+        keys = []
+        for priority, name in enumerate(self.vendors):
+            samples, median, error_rate = self._health[name].snapshot()
+            probing = samples < int(self.config["min_samples"])
+            unhealthy = not probing and error_rate > float(self.config["max_error_rate"])
+            latency = median if median is not None else math.inf
+            keys.append(((unhealthy, not probing, 0.0 if probing else latency, priority), name))
+        return [name for _, name in sorted(keys)]
+
+    def call(self, *args: Any) -> Any:
+        """Call vendors in ranked order until one succeeds; raise if all fail."""
+        errors: List[Tuple[str, Exception]] = []
+        for name in self.ranked():
+            started = time.perf_counter()
+            try:
+                result = self.vendors[name](*args)
+            except requests.exceptions.RequestException as exc:
+                self._health[name].record(time.perf_counter() - started, False)
+                errors.append((name, exc))
+                continue
+            except (KeyError, ValueError, TypeError) as exc:
+                errors.append((name, exc))
+                continue
+            self._health[name].record(time.perf_counter() - started, True)
+            with self._lock:
+                self._served[name] += 1
+                if errors:
+                    self._fallbacks += 1
+            return result
+        if not errors:
+            raise ValueError(f"No vendors available for {self.operation}")
+        if len(errors) == 1:
+            raise errors[0][1]
+        summary = "; ".join(f"{name}: {exc}" for name, exc in errors)
+        cls = (
+            requests.exceptions.RequestException
+            if any(isinstance(exc, requests.exceptions.RequestException) for _, exc in errors)
+            else ValueError
+        )
+        raise cls(f"All vendors failed for {self.operation}: {summary}") from errors[0][1]
+
+    def stats(self) -> Dict[str, Any]:
+        ranking = self.ranked()
+        with self._lock:
+            served, fallbacks = dict(self._served), self._fallbacks
+        vendors = {}
+        for name in self.vendors:
+            samples, median, error_rate = self._health[name].snapshot()
+            vendors[name] = {
+                "rank": ranking.index(name) + 1,
+                "samples": samples,
+                "latency_p50_ms": round(median * 1000, 1) if median is not None else None,
+                "error_rate": round(error_rate, 3),
+                "served": served[name],
+            }
+        return {"operation": self.operation, "fallbacks": fallbacks, "vendors": vendors}
+
+
+_routers: Dict[str, VendorRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_price_router() -> VendorRouter:
+    """Process-wide price router over the configured vendors with credentials; rebuilt when settings change."""
+    cfg = load_routing_config()
+    vendors = {
+        name: PRICE_SOURCES[name][0]
+        for name in cfg["price_vendors"]
+        if name in PRICE_SOURCES and PRICE_SOURCES[name][1]()
+    }
+    with _routers_lock:
+        router = _routers.get("prices")
+        if router is None or router.config != cfg or list(router.vendors) != list(vendors):
+            router = VendorRouter("prices", vendors, cfg)
+            _routers["prices"] = router
+        return router
+
+
+def get_price_record(ticker: str, end_date: date) -> PriceRecord:
+    """Price record from the fastest healthy vendor, falling back to the others."""
+    return get_price_router().call(ticker, end_date)
+
+
+def get_price_records(
+    tickers: Iterable[str],
+    end_date: date,
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, PriceRecord], Dict[str, Exception]]:
+    """Routed price records for many tickers concurrently (see fd_api.get_price_records)."""
+    symbols = [t.upper().strip() for t in tickers if isinstance(t, str) and t.strip()]
+    return fetch_many(lambda symbol: get_price_record(symbol, end_date), symbols, max_workers=max_workers)
+
+
+def routing_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-vendor ranking, latency, error rate and fallback counts for every router."""
+    with _routers_lock:
+        routers = list(_routers.values())
+    return {r.operation: r.stats() for r in routers}
+
+
+def reset_routers() -> None:
+    """Drop routers and their health history (tests and config reloads)."""
+    with _routers_lock:
+        _routers.clear()
@@ -38,6 +38,15 @@ class EquitySnapshot(BaseModel):
     industry: Optional[str] = None
     date: str
     source: str = Field(default="financialdatasets.ai")
+    volatility_20d: Optional[float] = Field(
+        default=None, description="Annualized 20-session realized volatility of daily log returns (analytics engine)."
+    )
+    drawdown: Optional[float] = Field(
+        default=None, description="Drawdown from the trailing 63-session high as a fraction (<= 0)."
+    )
+    max_drawdown: Optional[float] = Field(
+        default=None, description="Worst drawdown within the trailing 63 sessions as a fraction (<= 0)."
+    )
 
 
 class QAPair(BaseModel):
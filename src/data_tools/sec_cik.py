@@ -1,50 +1,214 @@
-"""SEC ticker-to-CIK mapping helper."""
+"""
+SEC ticker-to-CIK mapping helper.
+
+``company_tickers.json`` is kept on disk as a precomputed two-way index
+(ticker -> CIK and CIK -> tickers) with the response's ETag and
+Last-Modified. A new process loads the index from disk without touching the
+network; once it is older than DATA_TOOLS_SEC_CIK_REVALIDATE_S it is
+revalidated with a conditional GET, which is a body-less 304 unless the SEC
+has published a new file.
+"""
 
 from __future__ import annotations
 
 import json
+import logging
 import os
 import re
-from functools import lru_cache
-from typing import Dict, Optional
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from src.data_tools.config import load_cache_config
+from src.data_tools.http_client import get_session_manager
+
+logger = logging.getLogger(__name__)
+
 SEC_TICKER_URL = "https://www.sec.gov/files/company_tickers.json"
 DEFAULT_USER_AGENT = "transient-ai/0.1 (mailto:example@example.com)"
+VENDOR = "sec"
+INDEX_FILE = "sec_cik_index.json"
 
 
-@lru_cache(maxsize=1)
-def fetch_cik_map() -> Dict[str, str]:
-    """
-    Fetch the SEC ticker->CIK mapping.
+@dataclass(slots=True)
+class CikIndex:
+    """Two-way ticker/CIK index plus the validators of the response it was built from."""
 
-    Returns:
-        Dict of uppercased ticker -> zero-padded 10-digit CIK.
-    """
+    ticker_to_cik: Dict[str, str]
+    cik_to_tickers: Dict[str, Tuple[str, ...]]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0
+
+    @classmethod
+    def from_sec(cls, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> "CikIndex":
+        ticker_to_cik: Dict[str, str] = {}
+        cik_to_tickers: Dict[str, List[str]] = {}
+        if isinstance(data, dict):
+            # Format: {"0": {"ticker": "A", "cik_str": 861459, ...}, ...}
+            for entry in data.values():
+                if not isinstance(entry, dict):
+                    continue
+                ticker = entry.get("ticker")
+                cik_str = entry.get("cik_str")
+                if ticker and cik_str is not None:
+                    cik = str(cik_str).zfill(10)
+                    symbol = ticker.upper()
+                    ticker_to_cik[symbol] = cik
+                    # SEC file order lists a company's primary listing first.
+                    cik_to_tickers.setdefault(cik, []).append(symbol)
+        return cls(
+            ticker_to_cik,
+            {cik: tuple(tickers) for cik, tickers in cik_to_tickers.items()},
+            etag,
+            last_modified,
+            time.time(),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "checked_at": self.checked_at,
+            "ticker_to_cik": self.ticker_to_cik,
+            "cik_to_tickers": {cik: list(tickers) for cik, tickers in self.cik_to_tickers.items()},
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> "CikIndex":
+        return cls(
+            dict(payload["ticker_to_cik"]),
+            {cik: tuple(tickers) for cik, tickers in payload["cik_to_tickers"].items()},
+            payload.get("etag"),
+            payload.get("last_modified"),
+            float(payload.get("checked_at", 0.0)),
+        )
+
+
+def _index_path() -> Path:
+    return Path(load_cache_config()["cache_dir"]) / INDEX_FILE
+
+
+def _read_index(path: Path) -> Optional[CikIndex]:
+    try:
+        return CikIndex.from_json(json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError) as exc:
+        logger.warning("ignoring unreadable SEC CIK index %s: %s", path, exc)
+        return None
+
+
+def _write_index(path: Path, index: CikIndex) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(index.to_json(), separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _download(cached: Optional[CikIndex]) -> CikIndex:
+    """GET company_tickers.json, conditional on the cached validators; 304 keeps the cached index."""
     ua = os.getenv("SEC_USER_AGENT") or os.getenv("USER_AGENT") or DEFAULT_USER_AGENT
     headers = {"User-Agent": ua}
-    resp = requests.get(SEC_TICKER_URL, headers=headers, timeout=15)
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    resp = get_session_manager(VENDOR).get(SEC_TICKER_URL, headers=headers, timeout=15)
+    if resp.status_code == 304 and cached is not None:
+        cached.checked_at = time.time()
+        return cached
     if resp.status_code == 403:
         raise requests.HTTPError(
             "SEC request forbidden (403). Set SEC_USER_AGENT with contact info per SEC guidelines."
         )
     resp.raise_for_status()
-    data = resp.json()
-
-    mapping: Dict[str, str] = {}
-    if isinstance(data, dict):
-        # Format: {"0": {"ticker": "A", "cik_str": 861459, ...}, ...}
-        for entry in data.values():
-            if not isinstance(entry, dict):
-                continue
-            ticker = entry.get("ticker")
-            cik_str = entry.get("cik_str")
-            if ticker and cik_str is not None:
-                cik_str = str(cik_str)
-                cik = cik_str.zfill(10)
-                mapping[ticker.upper()] = cik
-    return mapping
+    return CikIndex.from_sec(resp.json(), resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+
+
+_indexes: Dict[Path, CikIndex] = {}
+_retry_after: Dict[Path, float] = {}
+_refresh_locks: Dict[Path, threading.Lock] = {}
+_indexes_lock = threading.Lock()
+
+
+def _refresh_lock(path: Path) -> threading.Lock:
+    with _indexes_lock:
+        return _refresh_locks.setdefault(path, threading.Lock())
+
+
+def _due(path: Path, index: Optional[CikIndex], max_age: float) -> bool:
+    """Whether the index must be (re)fetched: missing, or stale and not backing off after a failure."""
+    if index is None:
+        return True
+    now = time.time()
+    return now - index.checked_at >= max_age and now >= _retry_after.get(path, 0.0)
+
+
+def load_cik_index(refresh: bool = False) -> CikIndex:
+    """
+    The ticker/CIK index: from memory, else from disk, revalidating with the SEC when stale.
+
+    Only one thread downloads per index; while it does, other callers holding
+    a cached index are served that index instead of waiting. If revalidation
+    fails and a cached index exists, the stale index is served, the failure
+    logged, and the SEC is not retried for DATA_TOOLS_SEC_CIK_RETRY_S. With
+    no cached index, the failure propagates.
+    """
+    path = _index_path()
+    cfg = load_cache_config()
+    max_age = cfg["sec_cik_revalidate_s"]
+    index = _indexes.get(path)
+    if not refresh and not _due(path, index, max_age):
+        return index
+    lock = _refresh_lock(path)
+    if index is not None and not refresh:
+        if not lock.acquire(blocking=False):
+            return index
+    else:
+        lock.acquire()
+    try:
+        index = _indexes.get(path) or _read_index(path)
+        if not refresh and not _due(path, index, max_age):
+            _indexes[path] = index
+            return index
+        try:
+            fresh = _download(index)
+        except requests.exceptions.RequestException as exc:
+            if index is None:
+                raise
+            logger.warning("SEC CIK revalidation failed; serving cached index: %s", exc)
+            _retry_after[path] = time.time() + cfg["sec_cik_retry_s"]
+            _indexes[path] = index
+            return index
+        _write_index(path, fresh)
+        _retry_after.pop(path, None)
+        _indexes[path] = fresh
+        return fresh
+    finally:
+        lock.release()
+
+
+def reset_cik_index() -> None:
+    """Forget in-memory indexes so the next lookup reloads from disk (tests and config reloads)."""
+    with _indexes_lock:
+        _indexes.clear()
+        _retry_after.clear()
+
+
+def fetch_cik_map() -> Dict[str, str]:
+    """
+    Fetch the SEC ticker->CIK mapping.
+
+    Returns:
+        Dict of uppercased ticker -> zero-padded 10-digit CIK.
+    """
+    return load_cik_index().ticker_to_cik
 
 
 def get_cik_for_ticker(ticker: str) -> Optional[str]:
@@ -57,3 +221,11 @@ def get_cik_for_ticker(ticker: str) -> Optional[str]:
         return None
     mapping = fetch_cik_map()
     return mapping.get(symbol)
+
+
+def get_tickers_for_cik(cik: str | int) -> Tuple[str, ...]:
+    """Tickers registered under a CIK (primary listing first), or () if unknown."""
+    digits = str(cik).strip()
+    if not digits.isdigit():
+        return ()
+    return load_cik_index().cik_to_tickers.get(digits.zfill(10), ())
@@ -0,0 +1,137 @@
+"""Coalesce concurrent identical calls so only one reaches the vendor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlparse
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Tuple]:
+    """Hashable (url, sorted params) key; auth headers are not part of the key."""
+    return url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    The first caller (leader) runs the function; callers arriving while it is
+    running wait for the same result or exception. Nothing is cached: once the
+    leader finishes, the next call starts a fresh request.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executed = 0
+        self._coalesced = 0
+        self._coalesced_by_endpoint: Dict[str, int] = {}
+
+    def _count_coalesced(self, key: Hashable) -> None:
+        raw = key[0] if isinstance(key, tuple) and key else key
+        endpoint = (urlparse(raw).path or raw) if isinstance(raw, str) else str(raw)
+        self._coalesced += 1
+        self._coalesced_by_endpoint[endpoint] = self._coalesced_by_endpoint.get(endpoint, 0) + 1
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn once per concurrent key; followers block on the leader's result."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self._executed += 1
+            else:
+                self._count_coalesced(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of do(); coalesces coroutines running on the same event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.setdefault(loop, {})
+            future = calls.get(key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                calls[key] = future
+                self._executed += 1
+            else:
+                self._count_coalesced(key)
+        if not leader:
+            return await asyncio.shield(future)
+        try:
+            result = await fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an un-awaited follower-less failure does not log a warning.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                calls.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Executed vs coalesced call counters."""
+        with self._lock:
+            in_flight = len(self._calls) + sum(len(c) for c in self._async_calls.values())
+            return {
+                "name": self.name,
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "coalesced_by_endpoint": dict(self._coalesced_by_endpoint),
+                "in_flight": in_flight,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._executed = 0
+            self._coalesced = 0
+            self._coalesced_by_endpoint = {}
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """Return the process-wide singleflight group for a vendor, creating it on first use."""
+    group = _groups.get(name)
+    if group is None:
+        with _groups_lock:
+            group = _groups.get(name)
+            if group is None:
+                group = SingleFlight(name)
+                _groups[name] = group
+    return group
+
+
+def singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """Coalescing counters for every singleflight group in this process."""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {g.name: g.stats() for g in groups}
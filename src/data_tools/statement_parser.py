@@ -0,0 +1,277 @@
+"""
+Schema-driven parsing of vendor financial statements.
+
+Each statement type declares its canonical fields with alias names in
+priority order. For a given payload key shape (the tuple of keys of an entry)
+the aliases are resolved once into the concrete keys to read, so parsing an
+entry is a fixed list of dict lookups instead of a case-insensitive scan of
+every key for every alias. Vendors return every entry of a response with the
+same shape, so a whole payload normally compiles one plan.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.data_tools.schemas import BalanceSheet, CashFlowStatement, IncomeStatement
+
+Aliases = Tuple[str, ...]
+
+INCOME_STATEMENT_FIELDS: Dict[str, Aliases] = {
+    "fiscal_year": ("fiscalYear", "fiscal_year", "calendarYear", "calendar_year", "year", "fiscalYearEnd", "fiscal_year_end"),
+    "date": ("date", "reportDate", "report_date", "filingDate", "filing_date"),
+    "fiscal_period": ("fiscalPeriod", "fiscal_period", "quarter", "fiscalQuarter", "fiscal_quarter"),
+    "total_revenue": ("totalRevenue", "total_revenue", "revenue", "sales", "netSales", "net_sales"),
+    "cost_of_revenue": ("costOfRevenue", "cost_of_revenue", "costOfSales", "cost_of_sales", "cogs", "COGS"),
+    "gross_profit": ("grossProfit", "gross_profit", "grossIncome", "gross_income"),
+    "operating_income": (
+        "operatingIncome", "operating_income", "operatingIncomeLoss", "operating_income_loss",
+        "operatingProfit", "operating_profit", "ebit", "EBIT",
+    ),
+    "net_income": (
+        "netIncome", "net_income", "netIncomeLoss", "net_income_loss",
+        "netIncomeApplicableToCommonShares", "net_income_applicable_to_common_shares",
+        "netEarnings", "net_earnings", "profit", "netProfit", "net_profit",
+    ),
+    "diluted_eps": (
+        "dilutedEPS", "diluted_eps", "epsDiluted", "eps_diluted",
+        "earningsPerShareDiluted", "earnings_per_share_diluted", "eps", "EPS",
+    ),
+    "currency": ("currency", "reportedCurrency", "reported_currency", "currencyCode", "currency_code"),
+}
+
+# FinancialDatasets.ai names (snake_case) first, other vendors' spellings as fallbacks.
+BALANCE_SHEET_FIELDS: Dict[str, Aliases] = {
+    "report_period": ("report_period",),
+    "fiscal_period": ("fiscal_period",),
+    "total_assets": ("total_assets",),
+    "current_assets": ("current_assets", "currentAssets", "totalCurrentAssets"),
+    "cash_and_cash_equivalents": (
+        "cash_and_equivalents", "cashAndCashEquivalents", "cash_and_cash_equivalents",
+        "cashAndShortTermInvestments", "cash_and_short_term_investments",
+    ),
+    "total_liabilities": ("total_liabilities",),
+    "current_liabilities": ("current_liabilities", "currentLiabilities", "totalCurrentLiabilities"),
+    "current_debt": ("current_debt", "currentDebt", "shortTermDebt", "short_term_debt"),
+    "non_current_debt": ("non_current_debt", "nonCurrentDebt", "longTermDebt", "long_term_debt"),
+    "total_debt": ("total_debt", "totalDebt"),
+    "shareholders_equity": ("shareholders_equity", "shareholdersEquity", "totalStockholdersEquity", "total_stockholders_equity"),
+    "currency": ("currency",),
+}
+
+CASH_FLOW_FIELDS: Dict[str, Aliases] = {
+    "report_period": ("report_period",),
+    "fiscal_period": ("fiscal_period",),
+    "operating_cash_flow": ("net_cash_flow_from_operations", "operatingCashFlow", "cashFromOperatingActivities"),
+    "capital_expenditures": ("capital_expenditure", "capital_expenditures", "capitalExpenditure"),
+    "free_cash_flow": ("free_cash_flow",),
+    "investing_cash_flow": ("net_cash_flow_from_investing", "cashFromInvestingActivities", "investingCashFlow"),
+    "financing_cash_flow": ("net_cash_flow_from_financing", "cashFromFinancingActivities", "financingCashFlow"),
+    "net_change_in_cash": ("change_in_cash_and_equivalents", "netChangeInCash", "netChangeInCashAndCashEquivalents"),
+    "currency": ("currency",),
+}
+
+
+class FieldResolver:
+    """
+    Per-shape plan mapping each canonical field to the entry keys to read.
+
+    Keys are tried in alias priority order (an exact-case key before its
+    case variants) and the first non-None value wins.
+    """
+
+    __slots__ = ("plan",)
+
+    def __init__(self, fields: Dict[str, Aliases], keys: Tuple[Any, ...]) -> None:
+        by_lower: Dict[str, List[str]] = {}
+        for key in keys:
+            if isinstance(key, str):
+                by_lower.setdefault(key.lower(), []).append(key)
+        present = set(keys)
+        plan = []
+        for field, aliases in fields.items():
+            candidates: List[str] = []
+            for alias in aliases:
+                if alias in present and alias not in candidates:
+                    candidates.append(alias)
+                for key in by_lower.get(alias.lower(), ()):
+                    if key not in candidates:
+                        candidates.append(key)
+            if candidates:
+                plan.append((field, tuple(candidates)))
+        self.plan: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(plan)
+
+    def resolve(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for field, candidates in self.plan:
+            for key in candidates:
+                value = entry[key]
+                if value is not None:
+                    values[field] = value
+                    break
+        return values
+
+
+_resolvers: Dict[Tuple[int, Tuple[Any, ...]], FieldResolver] = {}
+_resolvers_lock = threading.Lock()
+_MAX_RESOLVERS = 256
+
+
+def get_resolver(fields: Dict[str, Aliases], keys: Tuple[Any, ...]) -> FieldResolver:
+    """Compiled resolver for a schema and key shape (cached)."""
+    cache_key = (id(fields), keys)
+    resolver = _resolvers.get(cache_key)
+    if resolver is None:
+        resolver = FieldResolver(fields, keys)
+        with _resolvers_lock:
+            if len(_resolvers) >= _MAX_RESOLVERS:
+                _resolvers.clear()
+            _resolvers[cache_key] = resolver
+    return resolver
+
+
+def _resolved_entries(fields: Dict[str, Aliases], statements: List[Any]):
+    """Yield (entry, resolved values) for dict entries, reusing the plan while the shape repeats."""
+    shape: Optional[Tuple[Any, ...]] = None
+    resolver: Optional[FieldResolver] = None
+    for entry in statements:
+        if not isinstance(entry, dict):
+            continue
+        keys = tuple(entry)
+        if keys != shape:
+            shape, resolver = keys, get_resolver(fields, keys)
+        yield entry, resolver.resolve(entry)
+
+
+def _year_from_date(value: Any) -> Optional[int]:
+    """Year from a YYYY-MM-DD string, if parseable."""
+    if isinstance(value, str):
+        try:
+            return int(value.split("-")[0])
+        except (ValueError, AttributeError):
+            return None
+    return None
+
+
+def parse_income_statements(statements: List[Any], symbol: str, years: int, period: str) -> List[IncomeStatement]:
+    """Normalize raw income statement entries (newest first) into models."""
+    normalized: List[IncomeStatement] = []
+    for entry, f in _resolved_entries(INCOME_STATEMENT_FIELDS, statements):
+        fiscal_year = f.get("fiscal_year")
+        if fiscal_year is None:
+            fiscal_year = _year_from_date(f.get("date"))
+        normalized.append(
+            IncomeStatement(
+                ticker=entry.get("ticker") or entry.get("symbol") or symbol,
+                period=str(entry.get("period") or entry.get("reportType") or entry.get("report_type") or period),
+                fiscal_year=int(fiscal_year) if fiscal_year is not None else None,
+                fiscal_period=f.get("fiscal_period"),
+                total_revenue=f.get("total_revenue"),
+                cost_of_revenue=f.get("cost_of_revenue"),
+                gross_profit=f.get("gross_profit"),
+                operating_income=f.get("operating_income"),
+                net_income=f.get("net_income"),
+                diluted_eps=f.get("diluted_eps"),
+                currency=f.get("currency"),
+                raw=entry,
+            )
+        )
+    if not normalized:
+        raise ValueError(f"Unable to parse income statements for {symbol}")
+    return normalized[:years]
+
+
+def parse_balance_sheets(statements: List[Any], symbol: str, years: int, period: str) -> List[BalanceSheet]:
+    """Normalize raw balance sheet entries (newest first) into models with derived risk ratios."""
+    normalized: List[BalanceSheet] = []
+    for entry, f in _resolved_entries(BALANCE_SHEET_FIELDS, statements):
+        fiscal_year = _year_from_date(f.get("report_period"))
+        current_assets = f.get("current_assets")
+        current_liabilities = f.get("current_liabilities")
+        current_debt = f.get("current_debt")
+        non_current_debt = f.get("non_current_debt")
+
+        total_debt = f.get("total_debt")
+        if total_debt is None:
+            lt_debt = non_current_debt or 0
+            st_debt = current_debt or 0
+            if lt_debt != 0 or st_debt != 0:
+                total_debt = lt_debt + st_debt
+
+        shareholders_equity = f.get("shareholders_equity")
+        total_equity = shareholders_equity
+
+        current_ratio = None
+        if current_assets is not None and current_liabilities is not None and current_liabilities != 0:
+            current_ratio = current_assets / current_liabilities
+
+        debt_to_equity = None
+        if total_debt is not None and total_equity is not None and total_equity != 0:
+            debt_to_equity = total_debt / total_equity
+
+        working_capital = None
+        if current_assets is not None and current_liabilities is not None:
+            working_capital = current_assets - current_liabilities
+
+        normalized.append(
+            BalanceSheet(
+                ticker=entry.get("ticker") or entry.get("symbol") or symbol,
+                period=str(entry.get("period") or period),
+                fiscal_year=fiscal_year,
+                fiscal_period=f.get("fiscal_period"),
+                total_assets=f.get("total_assets"),
+                current_assets=current_assets,
+                cash_and_cash_equivalents=f.get("cash_and_cash_equivalents"),
+                total_liabilities=f.get("total_liabilities"),
+                current_liabilities=current_liabilities,
+                total_debt=total_debt if total_debt != 0 else None,
+                long_term_debt=non_current_debt,
+                short_term_debt=current_debt,
+                total_equity=total_equity,
+                shareholders_equity=shareholders_equity,
+                current_ratio=current_ratio,
+                debt_to_equity=debt_to_equity,
+                working_capital=working_capital,
+                currency=f.get("currency"),
+                raw=entry,
+            )
+        )
+    if not normalized:
+        raise ValueError(f"Unable to parse balance sheets for {symbol}")
+    return normalized[:years]
+
+
+def parse_cash_flow_statements(statements: List[Any], symbol: str, years: int, period: str) -> List[CashFlowStatement]:
+    """Normalize raw cash flow entries (newest first) into models, deriving free cash flow when absent."""
+    normalized: List[CashFlowStatement] = []
+    for entry, f in _resolved_entries(CASH_FLOW_FIELDS, statements):
+        operating_cash_flow = f.get("operating_cash_flow")
+        capital_expenditures = f.get("capital_expenditures")
+        free_cash_flow = f.get("free_cash_flow")
+        if free_cash_flow is None and operating_cash_flow is not None:
+            if capital_expenditures is not None:
+                # CapEx is usually reported negative; subtract its magnitude either way.
+                free_cash_flow = operating_cash_flow - abs(capital_expenditures)
+            else:
+                free_cash_flow = operating_cash_flow
+
+        normalized.append(
+            CashFlowStatement(
+                ticker=entry.get("ticker") or entry.get("symbol") or symbol,
+                period=str(entry.get("period") or period),
+                fiscal_year=_year_from_date(f.get("report_period")),
+                fiscal_period=f.get("fiscal_period"),
+                operating_cash_flow=operating_cash_flow,
+                capital_expenditures=capital_expenditures,
+                investing_cash_flow=f.get("investing_cash_flow"),
+                financing_cash_flow=f.get("financing_cash_flow"),
+                net_change_in_cash=f.get("net_change_in_cash"),
+                free_cash_flow=free_cash_flow,
+                currency=f.get("currency"),
+                raw=entry,
+            )
+        )
+    if not normalized:
+        raise ValueError(f"Unable to parse cash flow statements for {symbol}")
+    return normalized[:years]
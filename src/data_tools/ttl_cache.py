@@ -0,0 +1,195 @@
+"""In-memory TTL cache that serves stale entries while refreshing them in the background."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_refresh_pool: Optional[ThreadPoolExecutor] = None
+_refresh_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _refresh_pool
+    with _refresh_pool_lock:
+        if _refresh_pool is None:
+            _refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ttl-refresh")
+        return _refresh_pool
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry age.
+
+    - age <= ttl_s: served as-is.
+    - ttl_s < age <= ttl_s + max_stale_s: served immediately and refreshed once
+      in the background; a failed refresh keeps the stale value.
+    - older, or missing: loaded synchronously by the caller.
+
+    Loader exceptions are never cached. ``ttl_s <= 0`` disables caching.
+    """
+
+    def __init__(self, name: str, ttl_s: float, max_stale_s: float, max_size: int) -> None:
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_stale_s = max_stale_s
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._counts = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0 and self.max_size > 0
+
+    def _lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """(value, needs_refresh); value None means load synchronously."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_s + self.max_stale_s:
+                if entry is not None:
+                    del self._entries[key]
+                # A refresh that never finished (e.g. its event loop closed) must not block future ones.
+                self._refreshing.discard(key)
+                self._counts["misses"] += 1
+                return None, False
+            age = time.monotonic() - entry[0]
+            self._entries.move_to_end(key)
+            if age <= self.ttl_s:
+                self._counts["hits"] += 1
+                return entry[1], False
+            self._counts["stale_hits"] += 1
+            if key in self._refreshing:
+                return entry[1], False
+            self._refreshing.add(key)
+            return entry[1], True
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def _refresh_done(self, key: Hashable, value: Any = None, exc: Optional[BaseException] = None) -> None:
+        if exc is None:
+            self.put(key, value)
+        else:
+            logger.warning("%s cache refresh failed for %s, keeping stale value: %s", self.name, key, exc)
+        with self._lock:
+            self._refreshing.discard(key)
+            self._counts["refreshes"] += 1
+            if exc is not None:
+                self._counts["refresh_errors"] += 1
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        try:
+            value = loader()
+        except Exception as exc:
+            self._refresh_done(key, exc=exc)
+        else:
+            self._refresh_done(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, scheduling a background refresh when stale; load on miss."""
+        if not self.enabled:
+            return loader()
+        value, needs_refresh = self._lookup(key)
+        if value is None:
+            value = loader()
+            self.put(key, value)
+        elif needs_refresh:
+            _pool().submit(self._refresh, key, loader)
+        return value
+
+    async def _arefresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            value = await loader()
+        except Exception as exc:
+            self._refresh_done(key, exc=exc)
+        else:
+            self._refresh_done(key, value)
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of get_or_load; stale refreshes run as tasks on the current loop."""
+        if not self.enabled:
+            return await loader()
+        value, needs_refresh = self._lookup(key)
+        if value is None:
+            value = await loader()
+            self.put(key, value)
+        elif needs_refresh:
+            task = asyncio.get_running_loop().create_task(self._arefresh(key, loader))
+            self._tasks.add(task)
+            task.add_done_callback(lambda t: self._arefresh_finished(key, t))
+        return value
+
+    def _arefresh_finished(self, key: Hashable, task: asyncio.Task) -> None:
+        """Task done-callback; clears the refresh flag when the task was cancelled (e.g. its loop shut down)."""
+        self._tasks.discard(task)
+        if task.cancelled():
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or everything when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_s": self.ttl_s,
+                "refreshing": len(self._refreshing),
+                **self._counts,
+            }
+
+
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ttl_cache(name: str, ttl_s: float, max_stale_s: float, max_size: int) -> TTLCache:
+    """
+    Return the process-wide cache for ``name``.
+
+    A cache is rebuilt (empty) when its settings change, so environment
+    overrides picked up after import take effect.
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None or (cache.ttl_s, cache.max_stale_s, cache.max_size) != (ttl_s, max_stale_s, max_size):
+            cache = TTLCache(name, ttl_s, max_stale_s, max_size)
+            _caches[name] = cache
+        return cache
+
+
+def ttl_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters for every TTL cache in this process."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {c.name: c.stats() for c in caches}
+
+
+def reset_ttl_caches() -> None:
+    """Drop all caches (tests and config reloads)."""
+    with _caches_lock:
+        _caches.clear()
@@ -0,0 +1,192 @@
+"""
+Pre-open warm-up of the data_tools caches for the refmaster universe.
+
+Fetches each symbol's latest price window, company facts and statements
+through the normal fd_api entry points, so the persistent bar store and
+fundamentals warehouse are populated before the EOD desk run. The
+company-facts cache is in memory, so it only stays warm when the job runs
+inside the serving process (``run_daily`` on a background thread).
+Vendor concurrency is bounded by fetch_many and the per-vendor rate limiters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.data_tools import fd_api
+from src.data_tools.bar_store import get_bar_store
+from src.data_tools.batch import fetch_many
+from src.data_tools.calendar import get_calendar
+from src.data_tools.fundamentals_store import get_fundamentals_store
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_DATASETS = ("income-statements", "balance-sheets", "cash-flow-statements")
+DATASETS = ("prices", "facts") + STATEMENT_DATASETS
+
+
+def universe_symbols() -> List[str]:
+    """Distinct refmaster symbols, upper-cased and sorted."""
+    from src.refmaster.normalizer_agent import load_equities
+
+    return sorted({eq.symbol.upper().strip() for eq in load_equities() if eq.symbol and eq.symbol.strip()})
+
+
+def _fetchers(as_of: date, years: int, period: str) -> Dict[str, Callable[[str], Any]]:
+    statements = {
+        "income-statements": fd_api.get_income_statements,
+        "balance-sheets": fd_api.get_balance_sheets,
+        "cash-flow-statements": fd_api.get_cash_flow_statements,
+    }
+    fetchers: Dict[str, Callable[[str], Any]] = {
+        "prices": lambda symbol: fd_api.get_price_record(symbol, as_of),
+        "facts": fd_api.get_company_facts,
+    }
+    for name, fn in statements.items():
+        fetchers[name] = lambda symbol, fn=fn: fn(symbol, years, period)
+    return fetchers
+
+
+def _cache_warnings(datasets: Iterable[str]) -> List[str]:
+    """Datasets whose cache does not outlive this process."""
+    warnings = []
+    datasets = set(datasets)
+    if "prices" in datasets and get_bar_store() is None:
+        warnings.append("prices: bar cache disabled (DATA_TOOLS_BAR_CACHE=0); bars are not persisted")
+    if "facts" in datasets:
+        warnings.append("facts: company facts are cached in memory; only this process benefits")
+    if datasets & set(STATEMENT_DATASETS) and get_fundamentals_store() is None:
+        warnings.append("statements: fundamentals warehouse disabled (DATA_TOOLS_FUNDAMENTALS_CACHE=0)")
+    return warnings
+
+
+def warm_universe(
+    symbols: Optional[Iterable[str]] = None,
+    as_of: Optional[date] = None,
+    datasets: Iterable[str] = DATASETS,
+    years: int = 4,
+    period: str = "annual",
+    max_workers: Optional[int] = None,
+    build_history: bool = False,
+) -> Dict[str, Any]:
+    """
+    Prefetch market data for every symbol and report coverage.
+
+    Args:
+        symbols: Symbols to warm (default: the refmaster universe).
+        as_of: Price window end date (default: the last session before today).
+        datasets: Subset of DATASETS to fetch.
+        years: Statement history length, matching the desk run's requests.
+        period: Statement period ("annual" or "quarterly").
+        max_workers: Concurrency limit per dataset (default DATA_TOOLS_MAX_CONCURRENCY).
+        build_history: Rebuild the memory-mapped price history afterwards.
+
+    Returns:
+        Report with per-dataset ok/failed counts, coverage, elapsed time and
+        failure messages by symbol. A failing symbol never aborts the run.
+    """
+    started = time.perf_counter()
+    if symbols is None:
+        symbols = universe_symbols()
+    symbol_list = sorted({s.upper().strip() for s in symbols if s and s.strip()})
+    if as_of is None:
+        as_of = get_calendar().previous_session(date.today())
+    datasets = [d for d in DATASETS if d in set(datasets)]
+    fetchers = _fetchers(as_of, years, period)
+
+    report: Dict[str, Any] = {
+        "as_of": as_of.isoformat(),
+        "symbols": len(symbol_list),
+        "datasets": {},
+        "failures": {},
+        "warnings": _cache_warnings(datasets),
+    }
+    for name in datasets:
+        t0 = time.perf_counter()
+        results, errors = fetch_many(fetchers[name], symbol_list, max_workers=max_workers)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        report["datasets"][name] = {
+            "ok": len(results),
+            "failed": len(errors),
+            "coverage": len(results) / len(symbol_list) if symbol_list else 1.0,
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
+        if errors:
+            report["failures"][name] = {symbol: str(exc) for symbol, exc in sorted(errors.items())}
+        logger.info("warmup %s ok=%d failed=%d elapsed_ms=%.0f", name, len(results), len(errors), elapsed_ms)
+
+    if build_history and "prices" in datasets and get_bar_store() is not None:
+        from src.data_tools.price_history import build_price_history
+
+        store = build_price_history(symbols=symbol_list or None)
+        report["price_history"] = {"symbols": len(store.symbols), "days": len(store.dates)}
+
+    report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return report
+
+
+def next_run(now: datetime, at: dt_time) -> datetime:
+    """Next datetime at ``at`` that falls on an exchange session, strictly after ``now``."""
+    calendar = get_calendar()
+    candidate = datetime.combine(now.date(), at)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    while not calendar.is_session(candidate.date()):
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def run_daily(at: dt_time, **kwargs: Any) -> None:
+    """Run warm_universe at local time ``at`` on every session day, forever."""
+    while True:
+        due = next_run(datetime.now(), at)
+        logger.info("next warmup at %s", due.isoformat(timespec="minutes"))
+        time.sleep(max((due - datetime.now()).total_seconds(), 0))
+        try:
+            report = warm_universe(**kwargs)
+            logger.info("warmup done: %s", json.dumps({k: v for k, v in report.items() if k != "failures"}))
+        except Exception:
+            logger.exception("warmup run failed")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm data_tools caches for the refmaster universe before the desk run")
+    parser.add_argument("--symbols", nargs="*", help="Symbols to warm (default: refmaster universe)")
+    parser.add_argument("--as-of", type=date.fromisoformat, help="Price window end date (default: last session before today)")
+    parser.add_argument("--datasets", nargs="*", choices=DATASETS, default=list(DATASETS), help="Datasets to fetch")
+    parser.add_argument("--years", type=int, default=4, help="Statement history length")
+    parser.add_argument("--period", choices=("annual", "quarterly"), default="annual")
+    parser.add_argument("--max-workers", type=int, help="Concurrency limit (default DATA_TOOLS_MAX_CONCURRENCY)")
+    parser.add_argument("--build-history", action="store_true", help="Rebuild the memory-mapped price history afterwards")
+    parser.add_argument("--daily-at", type=dt_time.fromisoformat, help="Run every session day at HH:MM local time instead of once")
+    parser.add_argument("--output", help="Optional path to write the report JSON")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    kwargs = {
+        "symbols": args.symbols or None,
+        "datasets": args.datasets,
+        "years": args.years,
+        "period": args.period,
+        "max_workers": args.max_workers,
+        "build_history": args.build_history,
+    }
+    if args.daily_at:
+        run_daily(args.daily_at, **kwargs)
+        return 0
+    report = warm_universe(as_of=args.as_of, **kwargs)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0 if not report["failures"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
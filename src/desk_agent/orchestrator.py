@@ -13,11 +13,12 @@ from typing import Any, Dict, List, Tuple
 
 import yaml
 from src.desk_agent.config import load_config
-from src.refmaster import NormalizerAgent
+from src.refmaster import NormalizerAgent, get_default_agent
 from src.oms import OMSAgent
 from src.pricing import PricingAgent
 from src.ticker_agent import ticker_agent
-from src.data_tools.fd_api import get_equity_snapshot
+from src.data_tools.batch import fetch_many
+from src.data_tools.fd_api import get_equity_record
 logger = logging.getLogger(__name__)
 
 SCENARIO_SCHEMA = {
@@ -81,7 +82,7 @@ class DeskAgentOrchestrator:
             ],
             force=True,
         )
-        self.normalizer = normalizer or NormalizerAgent()
+        self.normalizer = normalizer or get_default_agent()
         self.oms_agent = oms_agent or OMSAgent()
         self.pricing_agent = pricing_agent or PricingAgent()
         self.ticker_runner = ticker_runner or ticker_agent.run
@@ -305,13 +306,10 @@ class DeskAgentOrchestrator:
 
     def _market_context(self, trades: List[Dict[str, Any]], marks: List[Dict[str, Any]]) -> Dict[str, Any]:
         tickers = {t.get("ticker") for t in trades if t.get("ticker")} | {m.get("ticker") for m in marks if m.get("ticker")}
-        snapshots = []
-        for tkr in tickers:
-            try:
-                snap = get_equity_snapshot(tkr)
-                snapshots.append(snap.model_dump())
-            except Exception as exc:
-                logger.warning("market context snapshot failed for %s: %s", tkr, exc)
+        fetched, failures = fetch_many(get_equity_record, sorted(tickers))
+        for tkr, exc in failures.items():
+            logger.warning("market context snapshot failed for %s: %s", tkr, exc)
+        snapshots = [snap.to_dict() for snap in fetched.values()]
         sector_perf: Dict[str, Dict[str, Any]] = {}
         market_movements: Dict[str, Any] = {}
         if snapshots:
@@ -325,6 +323,15 @@ class DeskAgentOrchestrator:
                 "avg_return_1d": sum(s.get("return_1d", 1.0) for s in snapshots) / len(snapshots),
                 "avg_return_5d": sum(s.get("return_5d", 1.0) for s in snapshots) / len(snapshots),
             }
+            # Risk metrics come from the vectorized analytics engine via the snapshots; absent
+            # when the price history has not been built for these tickers.
+            vols = [s["volatility_20d"] for s in snapshots if s.get("volatility_20d") is not None]
+            if vols:
+                market_movements["avg_volatility_20d"] = sum(vols) / len(vols)
+                market_movements["max_volatility_20d"] = max(vols)
+            drawdowns = [s["max_drawdown"] for s in snapshots if s.get("max_drawdown") is not None]
+            if drawdowns:
+                market_movements["worst_drawdown"] = min(drawdowns)
         else:
             logger.info("market context unavailable for tickers=%s", tickers)
         return {
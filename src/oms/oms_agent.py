@@ -6,14 +6,17 @@ import json
 import logging
 import os
 import time
+from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
-from src.data_tools.fd_api import get_price_snapshot
+from src.data_tools.batch import fetch_many
+from src.data_tools.calendar import get_calendar
+from src.data_tools.fd_api import get_price_record
 from src.oms.schema import Trade
-from src.refmaster import NormalizerAgent
+from src.refmaster import NormalizerAgent, get_default_agent
 from src.refmaster.schema import NormalizationResult
 
 
@@ -37,7 +40,7 @@ class OMSAgent:
         ref_currency_map: Optional[Dict[str, str]] = None,
         settlement_days: Optional[int] = None,
     ) -> None:
-        self.normalizer = normalizer or NormalizerAgent()
+        self.normalizer = normalizer or get_default_agent()
         env_thresholds = {
             "warning": float(os.getenv("OMS_PRICE_WARNING_THRESHOLD", DEFAULT_THRESHOLDS["warning"])),
             "error": float(os.getenv("OMS_PRICE_ERROR_THRESHOLD", DEFAULT_THRESHOLDS["error"])),
@@ -51,7 +54,8 @@ class OMSAgent:
         self.audit_log_path = os.getenv("OMS_AUDIT_LOG")
         self.performance_budget_ms = int(os.getenv("OMS_PERF_BUDGET_MS", 30000))
 
-    def run(self, trade_json: Any) -> Dict[str, Any]:
+    def run(self, trade_json: Any, prices: Optional[Dict[Tuple[str, str], Any]] = None) -> Dict[str, Any]:
+        """Validate one trade; ``prices`` holds prefetched records/errors by (ticker, trade_dt)."""
         trade_dict, parse_issues = self._coerce_trade_dict(trade_json)
         issues: List[Dict[str, Any]] = []
         issues.extend(self._check_required(trade_dict))
@@ -73,7 +77,7 @@ class OMSAgent:
             checks = [
                 ("identifier", self._check_identifier),
                 ("currency", self._check_currency),
-                ("price", self._check_price),
+                ("price", lambda t: self._check_price(t, prices)),
                 ("counterparty", self._check_counterparty),
                 ("settlement", self._check_settlement),
             ]
@@ -119,9 +123,8 @@ class OMSAgent:
     def run_batch(self, trades: List[Any]) -> Dict[str, Any]:
         """Validate a batch of trades and return aggregate results with timing."""
         batch_start = time.perf_counter()
-        results: List[Dict[str, Any]] = []
-        for trade in trades:
-            results.append(self.run(trade))
+        prices = self._prefetch_prices(trades)
+        results = [self.run(trade, prices) for trade in trades]
         batch_ms = (time.perf_counter() - batch_start) * 1000
         errors = sum(1 for r in results if r.get("status") == "ERROR")
         warnings = sum(1 for r in results if r.get("status") == "WARNING")
@@ -133,10 +136,30 @@ class OMSAgent:
                 "warnings": warnings,
                 "ok": len(results) - errors - warnings,
                 "total_ms": batch_ms,
-                "within_budget": batch_ms <= self._batch_budget_ms(),
+                "within_budget": batch_ms <= self.performance_budget_ms,
             },
         }
 
+    def _prefetch_prices(self, trades: List[Any]) -> Dict[Tuple[str, str], Any]:
+        """Fetch market snapshots for every distinct (ticker, trade_dt) in one bounded concurrent pass."""
+        keys: List[Tuple[str, str]] = []
+        for trade in trades:
+            trade_dict, _ = self._coerce_trade_dict(trade)
+            ticker = trade_dict.get("ticker")
+            trade_dt = trade_dict.get("trade_dt")
+            if not isinstance(ticker, str) or not ticker.strip() or not isinstance(trade_dt, str):
+                continue
+            try:
+                Trade._parse_date(trade_dt)
+            except ValueError:
+                continue
+            keys.append((ticker.strip().upper(), trade_dt))
+        if not keys:
+            return {}
+        snapshots, errors = fetch_many(lambda key: get_price_record(key[0], Trade._parse_date(key[1])), keys)
+        logger.info("oms price prefetch fetched=%d failed=%d", len(snapshots), len(errors))
+        return {**snapshots, **errors}
+
     def evaluate_scenarios(self, scenarios: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Evaluate scenarios against expected_status/expected_issues fields."""
         results = []
@@ -229,10 +252,14 @@ class OMSAgent:
             return [_issue("currency_mismatch", "WARNING", f"Currency {trade.currency} vs ref {ref_ccy}", "currency")]
         return []
 
-    def _check_price(self, trade: Trade) -> List[Dict[str, Any]]:
+    def _check_price(self, trade: Trade, prices: Optional[Dict[Tuple[str, str], Any]] = None) -> List[Dict[str, Any]]:
         issues: List[Dict[str, Any]] = []
         try:
-            snap = get_price_snapshot(trade.ticker, trade._parse_date(trade.trade_dt))
+            snap = (prices or {}).get((trade.ticker, trade.trade_dt))
+            if isinstance(snap, Exception):
+                raise snap
+            if snap is None:
+                snap = get_price_record(trade.ticker, trade._parse_date(trade.trade_dt))
         except Exception as exc:
             issues.append(_issue("price_tolerance", "WARNING", f"Market data unavailable: {exc}", "price"))
             return issues
@@ -263,12 +290,15 @@ class OMSAgent:
         issues: List[Dict[str, Any]] = []
         trade_dt = trade._parse_date(trade.trade_dt)
         settle_dt = trade._parse_date(trade.settle_dt)
+        calendar = get_calendar()
         if settle_dt < trade_dt:
             issues.append(_issue("settlement_date", "ERROR", "Settlement before trade date", "settle_dt"))
         if settle_dt.weekday() >= 5:
             issues.append(_issue("settlement_date", "ERROR", "Settlement on weekend", "settle_dt"))
-        delta_days = (settle_dt - trade_dt).days
-        if delta_days < self.settlement_days:
+        elif calendar.covers(settle_dt) and not calendar.is_session(settle_dt):
+            issues.append(_issue("settlement_date", "ERROR", "Settlement on exchange holiday", "settle_dt"))
+        delta_sessions = self._settlement_interval(trade_dt, settle_dt)
+        if delta_sessions < self.settlement_days:
             issues.append(
                 _issue(
                     "settlement_date",
@@ -277,17 +307,28 @@ class OMSAgent:
                     "settle_dt",
                 )
             )
-        elif delta_days > self.settlement_days + 1:
+        elif delta_sessions > self.settlement_days + 1:
             issues.append(
                 _issue(
                     "settlement_date",
                     "WARNING",
-                    f"Non-standard settlement interval T+{delta_days} (expected ~T+{self.settlement_days})",
+                    f"Non-standard settlement interval T+{delta_sessions} (expected ~T+{self.settlement_days})",
                     "settle_dt",
                 )
             )
         return issues
 
+    def _settlement_interval(self, trade_dt: date, settle_dt: date) -> int:
+        """
+        T+N between the dates in exchange sessions, so a holiday inside the window extends the settle date.
+
+        Dates outside the trading calendar range fall back to calendar days.
+        """
+        calendar = get_calendar()
+        if calendar.covers(trade_dt, settle_dt):
+            return calendar.sessions_between(trade_dt, settle_dt)
+        return (settle_dt - trade_dt).days
+
     def _status(self, issues: List[Dict[str, Any]]) -> str:
         """Overall status: ERROR if any errors, WARNING if warnings only, otherwise OK."""
         if any(i["severity"] == "ERROR" for i in issues):
@@ -8,7 +8,9 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from src.data_tools.fd_api import get_price_snapshot
+from src.data_tools.rate_limit import is_rate_limited
+from src.data_tools.resilience import is_circuit_open
+from src.data_tools.routing import get_price_record, get_price_records
 from src.refmaster import NormalizerAgent, normalize as ref_normalize
 from src.pricing.config import load_tolerances
 from src.pricing.schema import EnrichedMark, Mark
@@ -41,24 +43,50 @@ class MarketNormalizer:
         attempt = 0
         while True:
             try:
-                snap = get_price_snapshot(ticker, dt)
-                result = {"price": snap.price, "date": snap.date}
+                snap = get_price_record(ticker, dt)
+                result = {"price": snap.price, "date": snap.date, "source": snap.source}
                 self._cache[cache_key] = result
                 return result
             except Exception as exc:
+                if is_circuit_open(exc):
+                    # Retrying into an open breaker only burns the backoff; fail fast.
+                    return {"error": "vendor_unavailable"}
                 if attempt >= retries:
                     error_msg = str(exc).lower()
-                    if "network" in error_msg or "connection" in error_msg:
+                    if is_rate_limited(exc):
+                        return {"error": "rate_limit_exceeded"}
+                    elif "network" in error_msg or "connection" in error_msg:
                         return {"error": f"network_error: {exc}"}
                     elif "not found" in error_msg or "invalid ticker" in error_msg:
                         return {"error": "ticker_not_found"}
-                    elif "rate limit" in error_msg:
-                        return {"error": "rate_limit_exceeded"}
                     else:
                         return {"error": f"fetch_failed: {exc}"}
                 attempt += 1
                 time.sleep(backoff_ms / 1000.0 if backoff_ms else 0)
 
+    def prefetch_market_prices(self, records: List[Dict[str, Any]]) -> None:
+        """Warm the price cache with one batched fetch per as_of_date for every distinct ticker."""
+        by_date: Dict[str, set[str]] = {}
+        for record in records:
+            ticker = record.get("ticker")
+            as_of_date = record.get("as_of_date")
+            if not isinstance(ticker, str) or not ticker.strip() or not isinstance(as_of_date, str):
+                continue
+            ticker = ticker.strip().upper()
+            if (ticker, as_of_date) not in self._cache:
+                by_date.setdefault(as_of_date, set()).add(ticker)
+        for as_of_date, tickers in by_date.items():
+            try:
+                dt = date.fromisoformat(as_of_date)
+            except ValueError:
+                continue
+            snapshots, errors = get_price_records(sorted(tickers), dt)
+            for ticker, snap in snapshots.items():
+                self._cache[(ticker, as_of_date)] = {"price": snap.price, "date": snap.date, "source": snap.source}
+            if errors:
+                # Failed tickers fall back to fetch_market_price, which applies retries and error mapping.
+                logger.info("prefetch as_of=%s fetched=%d failed=%d", as_of_date, len(snapshots), len(errors))
+
     def compare_mark_to_market(self, internal_mark: float, market_price: Optional[float], ticker: str) -> Dict[str, Any]:
         """Compute deviation and classification given tolerances."""
         if market_price is None:
@@ -123,6 +151,7 @@ class MarketNormalizer:
 
         total = len(records)
         logger.info("enrich_marks starting count=%d", total)
+        self.prefetch_market_prices(records)
         if self.max_workers > 1:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 for enriched in executor.map(self._enrich_one, records):
@@ -168,7 +197,7 @@ class MarketNormalizer:
         market_price = result.get("price")
         enriched_fields = self.compare_mark_to_market(mark.internal_mark, market_price, mark.ticker)
         enriched_fields["market_data_date"] = result.get("date")
-        enriched_fields["market_data_source"] = "financialdatasets.ai"
+        enriched_fields["market_data_source"] = result.get("source", "financialdatasets.ai")
         enriched_fields["fetch_timestamp"] = datetime.utcnow().isoformat() + "Z"
         enriched_fields["tolerance_override_applied"] = mark.ticker in self.tolerances.get("instrument_overrides", {})
         if self._is_stale(mark.as_of_date) and enriched_fields["classification"] != "NO_MARKET_DATA":
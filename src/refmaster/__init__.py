@@ -1,5 +1,6 @@
 from src.refmaster.normalizer_agent import (
     NormalizerAgent,
+    get_default_agent,
     load_equities,
     normalize,
     resolve_ticker,
@@ -12,6 +13,7 @@ __all__ = [
     "RefMasterEquity",
     "NormalizationResult",
     "NormalizerAgent",
+    "get_default_agent",
     "normalize",
     "resolve_ticker",
     "load_equities",
@@ -7,9 +7,10 @@ import json
 import logging
 import os
 import re
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 
 from src.refmaster.schema import RefMasterEquity, NormalizationResult
 
@@ -57,7 +58,14 @@ def load_equities(data_path: Optional[str] = None) -> List[RefMasterEquity]:
 
 
 class NormalizerAgent:
-    """Normalize free-form identifiers to canonical equities."""
+    """
+    Normalize free-form identifiers to canonical equities.
+
+    Symbol, ISIN, CUSIP and CIK hash indexes are built at construction, so an
+    input that is exactly one identifier is answered by dict lookup; only
+    free-form text goes through the per-equity scoring loop. Rebuild the
+    agent (or call ``reindex``) after mutating ``equities``.
+    """
 
     def __init__(
         self,
@@ -74,6 +82,26 @@ class NormalizerAgent:
         }
         if thresholds:
             self.thresholds.update(thresholds)
+        self.reindex()
+
+    def reindex(self) -> None:
+        """(Re)build the maps from upper-cased symbol/ISIN/CUSIP/CIK to positions in ``equities``."""
+        # Positions are int tuples rather than lists: the GC stops tracking them,
+        # which keeps index builds over large universes from triggering collections.
+        self._indexes: Dict[str, Dict[str, Tuple[int, ...]]] = {}
+        for field in ("symbol", "isin", "cusip", "cik"):
+            index: Dict[str, Tuple[int, ...]] = {}
+            for pos, eq in enumerate(self.equities):
+                value = getattr(eq, field)
+                if value:
+                    key = value.upper()
+                    index[key] = index.get(key, ()) + (pos,)
+            self._indexes[field] = index
+
+    def lookup_symbol(self, symbol: str) -> Optional[RefMasterEquity]:
+        """Equity whose symbol exactly matches (case-insensitive, surrounding spaces ignored), else None."""
+        positions = self._indexes["symbol"].get((symbol or "").strip().upper(), ())
+        return self.equities[positions[0]] if positions else None
 
     def normalize(self, description_or_id: str, top_k: int = 5) -> List[NormalizationResult]:
         """Return ranked matches with confidence and reasons."""
@@ -81,18 +109,20 @@ class NormalizerAgent:
             return []
         input_str = description_or_id.strip()
         extracted = self._extract_identifiers(input_str)
-        scored: List[NormalizationResult] = []
-        for eq in self.equities:
-            conf, reasons = self._score(eq, extracted, input_str)
-            if conf > 0:
-                scored.append(
-                    NormalizationResult(
-                        equity=eq,
-                        confidence=conf,
-                        reasons=reasons,
-                        ambiguous=False,
+        scored = self._exact_matches(extracted, input_str)
+        if scored is None:
+            scored = []
+            for eq in self.equities:
+                conf, reasons = self._score(eq, extracted, input_str)
+                if conf > 0:
+                    scored.append(
+                        NormalizationResult(
+                            equity=eq,
+                            confidence=conf,
+                            reasons=reasons,
+                            ambiguous=False,
+                        )
                     )
-                )
         scored.sort(key=self._sort_key)
         if not scored or scored[0].confidence < self.thresholds["reject"]:
             logger.info("normalize input=%s result=unknown", input_str)
@@ -112,6 +142,36 @@ class NormalizerAgent:
         )
         return scored[:top_k]
 
+    def _exact_matches(self, extracted: dict, input_str: str) -> Optional[List[NormalizationResult]]:
+        """
+        Index hits when the whole input is one identifier; None sends it to the scoring loop.
+
+        Confidences and reasons are those ``_score`` gives the matching
+        equities (ISIN over CUSIP over CIK per equity). Incidental
+        ``symbol_in_text`` substring matches of other equities are not
+        collected for these inputs.
+        """
+        text = input_str.upper()
+        hits: Dict[int, tuple[float, List[str]]] = {}
+        if text in (extracted["isin"], extracted["cusip"]) or (text.isdigit() and text.zfill(10) == extracted["cik"]):
+            for field, conf in (
+                ("isin", self.thresholds["exact"]),
+                ("cusip", self.thresholds["high"]),
+                ("cik", self.thresholds["high"]),
+            ):
+                if extracted[field]:
+                    for pos in self._indexes[field].get(extracted[field], ()):
+                        hits.setdefault(pos, (conf, [f"{field}_exact"]))
+        elif text == extracted["symbol"]:
+            for pos in self._indexes["symbol"].get(text, ()):
+                hits[pos] = (0.9, ["symbol_exact", "symbol_in_text"])
+        if not hits:
+            return None
+        return [
+            NormalizationResult(equity=self.equities[pos], confidence=conf, reasons=reasons, ambiguous=False)
+            for pos, (conf, reasons) in sorted(hits.items())
+        ]
+
     def _score(self, eq: RefMasterEquity, extracted: dict, input_str: str) -> tuple[float, List[str]]:
         reasons: List[str] = []
         score = 0.0
@@ -187,31 +247,49 @@ class NormalizerAgent:
         )
 
 
+_default_agent: Optional[Tuple[List[RefMasterEquity], NormalizerAgent]] = None
+_default_agent_lock = threading.Lock()
+
+
+def get_default_agent() -> NormalizerAgent:
+    """
+    Process-wide agent over ``load_equities()``, so its indexes are built once.
+
+    The agent is rebuilt whenever ``load_equities`` returns a different list
+    (e.g. after ``load_equities.cache_clear()``).
+    """
+    global _default_agent
+    equities = load_equities()
+    cached = _default_agent
+    if cached is not None and cached[0] is equities:
+        return cached[1]
+    with _default_agent_lock:
+        cached = _default_agent
+        if cached is None or cached[0] is not equities:
+            cached = (equities, NormalizerAgent(equities))
+            _default_agent = cached
+    return cached[1]
+
+
 def normalize(description_or_id: str, top_k: int = 5) -> List[NormalizationResult]:
     """Convenience function using default agent/cache."""
-    agent = NormalizerAgent()
-    return agent.normalize(description_or_id, top_k=top_k)
+    return get_default_agent().normalize(description_or_id, top_k=top_k)
 
 
 def resolve_ticker(symbol: str) -> Optional[RefMasterEquity]:
     """Return a canonical equity for an exact symbol match."""
-    agent = NormalizerAgent()
-    symbol = (symbol or "").upper()
-    for eq in agent.equities:
-        if eq.symbol.upper() == symbol:
-            return eq
-    return None
+    return get_default_agent().lookup_symbol(symbol)
 
 
 def batch_normalize(inputs: List[str], top_k: int = 5) -> Dict[str, List[NormalizationResult]]:
     """Normalize a list of identifier strings."""
-    agent = NormalizerAgent()
+    agent = get_default_agent()
     return {inp: agent.normalize(inp, top_k=top_k) for inp in inputs}
 
 
 def export_equities(path: str, fmt: str = "csv") -> Path:
     """Export the loaded equities to CSV or JSON for audit."""
-    equities = [eq.model_dump() for eq in NormalizerAgent().equities]
+    equities = [eq.model_dump() for eq in get_default_agent().equities]
     out_path = Path(path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     if fmt.lower() == "json":
@@ -16,10 +16,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from src.data_tools.calendar import get_calendar
+from src.data_tools.resilience import resilience_stats
 from src.desk_agent.orchestrator import DeskAgentOrchestrator
 from src.oms import OMSAgent
 from src.pricing import PricingAgent
-from src.refmaster.normalizer_agent import NormalizerAgent
+from src.refmaster.normalizer_agent import get_default_agent
 from src.service.config import load_config, validate_config
 from src.ticker_agent import ticker_agent
 
@@ -168,7 +170,7 @@ def _get_ticker_agent():
 
 def _get_refmaster():
     """Factory for Refmaster normalizer; isolated for test monkeypatching."""
-    return NormalizerAgent()
+    return get_default_agent()
 
 
 @lru_cache(maxsize=32)
@@ -247,6 +249,11 @@ async def health():
             "ticker_agent": "active",
             "scenarios_path": str(scenarios_path),
             "scenarios_path_exists": scenarios_path.exists(),
+            "vendor_circuits": {
+                f"{vendor}:{endpoint}": guard["state"]
+                for vendor, endpoints in resilience_stats().items()
+                for endpoint, guard in endpoints.items()
+            },
         },
     }
     return details
@@ -562,20 +569,26 @@ def _validate_trade_verbose(oms: OMSAgent, trade_json: Any) -> Dict[str, Any]:
     settlement_issues = oms._check_settlement(trade)
     trade_date = trade._parse_date(trade.trade_dt)
     settle_date = trade._parse_date(trade.settle_dt)
-    delta_days = (settle_date - trade_date).days
-    steps.append(
-        {
-            "step": "settlement_validation",
-            "description": "Validate settlement date rules",
-            "status": "ok" if not settlement_issues else "error",
-            "trade_date": trade.trade_dt,
-            "settle_date": trade.settle_dt,
-            "settlement_days": delta_days,
-            "expected_settlement_days": oms.settlement_days,
-            "is_weekend": settle_date.weekday() >= 5,
-            "issues": settlement_issues,
-        }
-    )
+    calendar = get_calendar()
+    settlement_step = {
+        "step": "settlement_validation",
+        "description": "Validate settlement date rules",
+        "status": "ok" if not settlement_issues else "error",
+        "trade_date": trade.trade_dt,
+        "settle_date": trade.settle_dt,
+        "settlement_days": oms._settlement_interval(trade_date, settle_date),
+        "expected_settlement_days": oms.settlement_days,
+        "is_weekend": settle_date.weekday() >= 5,
+        "issues": settlement_issues,
+    }
+    # Calendar-derived fields are left out when the dates fall outside the trading calendar range.
+    if calendar.covers(trade_date, settle_date):
+        try:
+            settlement_step["expected_settle_date"] = calendar.add_sessions(trade_date, oms.settlement_days).isoformat()
+        except ValueError:
+            pass
+        settlement_step["is_holiday"] = settle_date.weekday() < 5 and not calendar.is_session(settle_date)
+    steps.append(settlement_step)
 
     return {"steps": steps}
 
@@ -774,10 +787,14 @@ def _validate_pricing_verbose(
 async def ticker_agent_endpoint(payload: TickerAgentRequest):
     """Answer a question about a ticker using the ticker agent."""
     try:
+        agent = _get_ticker_agent()
+        if hasattr(agent, "arun"):
+            # Native async path: vendor calls share the event loop's HTTP pool.
+            return await agent.arun(payload.question)
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
             None,
-            _get_ticker_agent().run,
+            agent.run,
             payload.question,
         )
         return result
@@ -6,14 +6,16 @@ import json
 import os
 from typing import List, Tuple
 
-import requests
 from dotenv import load_dotenv
 
+from src.data_tools.http_client import get_session_manager
 from src.ticker_agent.intents_loader import IntentDef, load_intent_definitions
 
 
 load_dotenv()
 
+VENDOR = "llm"
+
 
 def _get_llm_api_key() -> str:
     api_key = os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY")
@@ -41,7 +43,8 @@ def _call_llm_chat(messages: List[dict], model: str) -> str:
         "messages": messages,
         "temperature": 0,
     }
-    resp = requests.post(endpoint, headers=headers, json=payload, timeout=30)
+    # Pooled session: keep-alive, rate limiting and record/replay like the market-data vendors.
+    resp = get_session_manager(VENDOR).post(endpoint, headers=headers, json=payload, timeout=30)
     resp.raise_for_status()
     data = resp.json()
     return data["choices"][0]["message"]["content"]
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import logging
-from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
 from src.data_tools.fd_api import (
+    aget_balance_sheets,
+    aget_cash_flow_statements,
+    aget_equity_snapshot,
+    aget_income_statements,
     get_balance_sheets,
     get_cash_flow_statements,
     get_equity_snapshot,
@@ -164,7 +168,12 @@ def _build_metrics(
         # Placeholder since dividends not available from current tool
         base.update({"dividend_yield": None, "next_ex_date": None})
     elif intent == "volatility_comparison_convertible":
-        base.update({"return_5d": snap.return_5d})
+        base.update({
+            "return_5d": snap.return_5d,
+            "volatility_20d": snap.volatility_20d,
+            "drawdown": snap.drawdown,
+            "max_drawdown": snap.max_drawdown,
+        })
     elif intent == "news_sentiment_stub":
         base.update({"sentiment": None, "headline_sample": None})
     elif intent == "fundamentals_risk_summary":
@@ -282,6 +291,13 @@ def _summary(
     if intent == "dividend_overview":
         return f"{snap.ticker} dividend details unavailable from current data source."
     if intent == "volatility_comparison_convertible":
+        if snap.volatility_20d is not None:
+            drawdown_text = f", {snap.drawdown:.1%} from its 3M high" if snap.drawdown is not None else ""
+            return (
+                f"{snap.ticker} 20D realized vol {snap.volatility_20d:.1%} annualized{drawdown_text}; "
+                f"5D return multiplier {snap.return_5d:.2f}. "
+                "Convertible implied vol is not available from current source."
+            )
         return (
             f"{snap.ticker} recent 5D return multiplier {snap.return_5d:.2f}; "
             "use as proxy until convertible vol data is available."
@@ -431,22 +447,21 @@ def _error_response(reason: str, detail: str = "") -> Dict[str, Any]:
     }
 
 
-@lru_cache(maxsize=64)
+# Caching lives in data_tools: company facts in the TTL cache (stale-while-revalidate),
+# prices in the bar store/price history and statements in the fundamentals warehouse.
+# Memoizing here would pin the first answer for the life of the process.
 def _cached_snapshot(ticker: str) -> EquitySnapshot:
     return get_equity_snapshot(ticker)
 
 
-@lru_cache(maxsize=64)
 def _cached_income_statements(ticker: str) -> Tuple[IncomeStatement, ...]:
     return tuple(get_income_statements(ticker))
 
 
-@lru_cache(maxsize=64)
 def _cached_balance_sheets(ticker: str) -> Tuple[BalanceSheet, ...]:
     return tuple(get_balance_sheets(ticker))
 
 
-@lru_cache(maxsize=64)
 def _cached_cash_flow_statements(ticker: str) -> Tuple[CashFlowStatement, ...]:
     return tuple(get_cash_flow_statements(ticker))
 
@@ -511,6 +526,77 @@ def run(question: str) -> Dict[str, Any]:
                 "Unable to fetch financial statements for fundamentals analysis."
             )
     
+    return _answer(intent, snap, income_history, balance_sheets, cash_flows, data_warnings)
+
+
+async def arun(question: str) -> Dict[str, Any]:
+    """
+    Async variant of run() for event-loop callers such as the FastAPI service.
+
+    Data is fetched with the fd_api ``aget_*`` functions; for fundamentals the
+    three statement requests run concurrently. Intent classification may call
+    the LLM over blocking HTTP, so it runs in a worker thread.
+    """
+    intent, meta = await asyncio.to_thread(_classify_intent, question)
+    resolved_ticker = meta.get("ticker") or _extract_ticker(question or "")
+    if not resolved_ticker:
+        return _error_response("invalid_ticker", "Provide a ticker in the question.")
+    try:
+        snap = await aget_equity_snapshot(resolved_ticker)
+    except Exception as exc:
+        return _error_response("data_unavailable", str(exc))
+
+    income_history: Optional[List[IncomeStatement]] = None
+    balance_sheets: Optional[List[BalanceSheet]] = None
+    cash_flows: Optional[List[CashFlowStatement]] = None
+
+    data_warnings: List[str] = []
+
+    if intent == "income_statement_summary":
+        try:
+            income_history = await aget_income_statements(resolved_ticker)
+            if not income_history:
+                raise ValueError("Income statements unavailable")
+        except Exception as exc:
+            return _error_response("data_unavailable", f"Income statements unavailable: {exc}")
+    elif intent == "fundamentals_risk_summary":
+        income_result, balance_result, cash_result = await asyncio.gather(
+            aget_income_statements(resolved_ticker),
+            aget_balance_sheets(resolved_ticker),
+            aget_cash_flow_statements(resolved_ticker),
+            return_exceptions=True,
+        )
+        if isinstance(income_result, Exception):
+            data_warnings.append(f"Income statements unavailable: {income_result}")
+        else:
+            income_history = income_result
+        if isinstance(balance_result, Exception):
+            data_warnings.append(f"Balance sheets unavailable: {balance_result}")
+        else:
+            balance_sheets = balance_result
+        if isinstance(cash_result, Exception):
+            data_warnings.append(f"Cash flow statements unavailable: {cash_result}")
+        else:
+            cash_flows = cash_result
+
+        if not income_history and not balance_sheets and not cash_flows:
+            return _error_response(
+                "data_unavailable",
+                "Unable to fetch financial statements for fundamentals analysis."
+            )
+
+    return _answer(intent, snap, income_history, balance_sheets, cash_flows, data_warnings)
+
+
+def _answer(
+    intent: str,
+    snap: EquitySnapshot,
+    income_history: Optional[List[IncomeStatement]],
+    balance_sheets: Optional[List[BalanceSheet]],
+    cash_flows: Optional[List[CashFlowStatement]],
+    data_warnings: List[str],
+) -> Dict[str, Any]:
+    """Build metrics and summary from fetched data; shared by run() and arun()."""
     metrics = _build_metrics(
         intent, snap,
         income_history=income_history,
@@ -0,0 +1,16 @@
+import pytest
+
+from src.data_tools.config import reset_config_cache
+from src.data_tools.resilience import reset_resilience
+from src.data_tools.routing import reset_routers
+from src.data_tools.ttl_cache import reset_ttl_caches
+
+
+@pytest.fixture(autouse=True)
+def _isolated_data_tools_cache(tmp_path, monkeypatch):
+    """Keep on-disk data_tools caches out of the repo and independent per test."""
+    monkeypatch.setenv("DATA_TOOLS_CACHE_DIR", str(tmp_path / "data_tools_cache"))
+    reset_config_cache()
+    reset_ttl_caches()
+    reset_resilience()
+    reset_routers()
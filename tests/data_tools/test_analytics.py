@@ -0,0 +1,62 @@
+"""Tests for the vectorized analytics engine."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.data_tools import analytics
+from src.data_tools.bar_store import DailyBarStore
+from src.data_tools.price_history import build_price_history
+
+
+def _random_closes(symbols=5, days=80, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(symbols, days)), axis=1))
+
+
+def test_clean_closes_forward_fills_and_masks_zero_volume():
+    closes = np.array([[np.nan, 10.0, np.nan, 12.0], [5.0, 6.0, 7.0, 8.0]])
+    volumes = np.array([[0, 100, 0, 100], [100, 100, 0, 100]])
+    cleaned = analytics.clean_closes(closes, volumes)
+    assert np.isnan(cleaned[0, 0])
+    assert cleaned[0].tolist()[1:] == [10.0, 10.0, 12.0]
+    assert cleaned[1].tolist() == [5.0, 6.0, 6.0, 8.0]
+
+
+def test_rolling_volatility_matches_naive_std():
+    closes = _random_closes()
+    vol = analytics.rolling_volatility(closes, window=20, annualize=False)
+    log_ret = np.diff(np.log(closes), axis=1)
+    for day in (20, 45, 79):
+        expected = np.std(log_ret[:, day - 20:day], axis=1, ddof=1)
+        assert np.allclose(vol[:, day], expected)
+    assert np.isnan(vol[:, 19]).all()
+
+
+def test_compute_metrics_returns_and_drawdown():
+    closes = np.array([[100.0, 110.0, 99.0, 104.5, 105.0, 106.0, 107.0]])
+    metrics = analytics.compute_metrics(closes, horizons=(1, 5), vol_window=3, drawdown_lookback=10)
+    assert metrics["return_1d"][0] == pytest.approx(107.0 / 106.0)
+    assert metrics["return_5d"][0] == pytest.approx(107.0 / 110.0)
+    assert metrics["drawdown"][0] == pytest.approx(107.0 / 110.0 - 1)
+    assert metrics["max_drawdown"][0] == pytest.approx(99.0 / 110.0 - 1)
+    assert metrics["volatility_3d"][0] > 0
+
+
+def test_universe_metrics_from_price_history(tmp_path):
+    store = DailyBarStore(tmp_path / "bars.sqlite")
+    start = date(2024, 1, 1)
+    days = [start + timedelta(days=i) for i in range(40)]
+    closes = _random_closes(symbols=2, days=len(days))
+    for row, symbol in enumerate(["AAPL", "MSFT"]):
+        bars = [{"date": d.isoformat(), "close": float(c), "volume": 1000} for d, c in zip(days, closes[row])]
+        store.save(symbol, bars, days[0], days[-1])
+    history = build_price_history(bar_store=store, root=tmp_path / "history")
+
+    metrics = analytics.universe_metrics(days[-1], history=history)
+    assert set(metrics) == {"AAPL", "MSFT"}
+    assert metrics["MSFT"]["return_5d"] == pytest.approx(closes[1, -1] / closes[1, -6])
+    expected_vol = np.std(np.diff(np.log(closes[1, -21:])), ddof=1) * np.sqrt(252)
+    assert metrics["MSFT"]["volatility_20d"] == pytest.approx(expected_vol)
+    assert analytics.universe_metrics(days[-1], symbols=["aapl"], history=history).keys() == {"AAPL"}
@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+from src.data_tools.calendar import TradingCalendar, easter_sunday, get_calendar, nyse_holidays
+
+
+def test_nyse_holidays_2024():
+    assert nyse_holidays(2024) == {
+        date(2024, 1, 1),
+        date(2024, 1, 15),
+        date(2024, 2, 19),
+        date(2024, 3, 29),
+        date(2024, 5, 27),
+        date(2024, 6, 19),
+        date(2024, 7, 4),
+        date(2024, 9, 2),
+        date(2024, 11, 28),
+        date(2024, 12, 25),
+    }
+
+
+def test_observed_rules():
+    # Juneteenth 2022 fell on a Sunday; 2021 predates the NYSE holiday.
+    assert date(2022, 6, 20) in nyse_holidays(2022)
+    assert not any(d.month == 6 for d in nyse_holidays(2021))
+    # Jan 1 2022 was a Saturday: no Friday Dec 31 2021 closure.
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert not any(d.month == 1 and d.day <= 3 for d in nyse_holidays(2022))
+    # July 4 2026 is a Saturday, observed Friday.
+    assert date(2026, 7, 3) in nyse_holidays(2026)
+    assert easter_sunday(2025) == date(2025, 4, 20)
+
+
+def test_session_lookup_and_special_closures():
+    cal = get_calendar()
+    assert cal.is_session(date(2024, 6, 5))
+    assert not cal.is_session(date(2024, 6, 8))
+    assert not cal.is_session(date(2023, 6, 19))
+    assert not cal.is_session(date(2025, 1, 9))
+    assert cal.session_on_or_before(date(2024, 3, 31)) == date(2024, 3, 28)
+
+
+def test_session_arithmetic_across_holidays():
+    cal = get_calendar()
+    # Good Friday 2024-03-29: T+2 from Wednesday lands on Monday.
+    assert cal.add_sessions(date(2024, 3, 27), 2) == date(2024, 4, 1)
+    assert cal.sessions_between(date(2024, 3, 27), date(2024, 4, 1)) == 2
+    assert cal.sessions_between(date(2024, 4, 1), date(2024, 3, 27)) == -2
+    assert cal.previous_session(date(2024, 4, 1)) == date(2024, 3, 28)
+    assert cal.previous_session(date(2024, 3, 30), 2) == date(2024, 3, 27)
+    assert cal.next_session(date(2024, 3, 28)) == date(2024, 4, 1)
+    assert cal.sessions(date(2024, 3, 27), date(2024, 4, 2)) == [
+        date(2024, 3, 27),
+        date(2024, 3, 28),
+        date(2024, 4, 1),
+        date(2024, 4, 2),
+    ]
+
+
+def test_out_of_range_raises():
+    cal = TradingCalendar([], date(2024, 1, 1), date(2024, 1, 31))
+    assert cal.covers(date(2024, 1, 1), date(2024, 1, 31))
+    assert not cal.covers(date(2024, 1, 2), date(2024, 2, 1))
+    with pytest.raises(ValueError):
+        cal.is_session(date(2024, 2, 1))
+    with pytest.raises(ValueError):
+        cal.next_session(date(2024, 1, 31))
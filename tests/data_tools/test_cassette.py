@@ -0,0 +1,133 @@
+"""Tests for the record/replay vendor transport."""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from src.data_tools.cassette import CassetteMissError, cassette_key, get_cassette
+from src.data_tools.config import reset_config_cache
+from src.data_tools.http_client import AsyncHttpClientManager, HttpSessionManager
+
+
+def _live_response(payload, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def _record(monkeypatch, manager, payload, method="get", **kwargs):
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_MODE", "record")
+    reset_config_cache()
+    monkeypatch.setattr(manager.session(), method, lambda url, **kw: _live_response(payload))
+    return getattr(manager, method)("https://api.example.com/prices", **kwargs)
+
+
+def test_key_ignores_credentials_and_param_order():
+    a = cassette_key("fmp", "GET", "https://x.test/profile?apikey=secret", {"b": 2, "a": 1})
+    b = cassette_key("fmp", "get", "https://x.test/profile", {"a": "1", "b": "2", "apikey": "other"})
+    assert a == b
+    assert cassette_key("fmp", "POST", "https://x.test/chat", body={"q": 1}) != cassette_key(
+        "fmp", "POST", "https://x.test/chat", body={"q": 2}
+    )
+
+
+def test_record_then_replay_without_network(monkeypatch):
+    manager = HttpSessionManager("vendor-a")
+    params = {"ticker": "AAPL", "apikey": "secret"}
+    _record(monkeypatch, manager, {"prices": [1, 2]}, params=params)
+    cassette = get_cassette()
+    path = cassette.path_for("vendor-a", cassette_key("vendor-a", "GET", "https://api.example.com/prices", params))
+    assert path.exists() and "secret" not in path.read_text()
+
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_LATENCY_MS", "0")
+    reset_config_cache()
+
+    def offline(url, **kwargs):
+        raise AssertionError("network used in replay mode")
+
+    replayer = HttpSessionManager("vendor-a")
+    monkeypatch.setattr(replayer.session(), "get", offline)
+    response = replayer.get("https://api.example.com/prices", params={"apikey": "x", "ticker": "AAPL"})
+    assert response.status_code == 200
+    assert response.json() == {"prices": [1, 2]}
+    assert get_cassette().stats()["replayed"] == 1
+
+    with pytest.raises(CassetteMissError):
+        replayer.get("https://api.example.com/prices", params={"ticker": "MSFT"})
+
+
+def test_replay_latency_and_injected_errors(monkeypatch):
+    manager = HttpSessionManager("vendor-b")
+    _record(monkeypatch, manager, {"ok": True}, method="post", json={"q": "hi"})
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_LATENCY_MS", "250")
+    reset_config_cache()
+    slept = []
+    monkeypatch.setattr("src.data_tools.cassette.time.sleep", slept.append)
+    assert manager.post("https://api.example.com/prices", json={"q": "hi"}).json() == {"ok": True}
+    assert slept == [0.25]
+
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_ERROR_RATE", "1")
+    reset_config_cache()
+    assert manager.post("https://api.example.com/prices", json={"q": "hi"}).status_code == 503
+
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_ERROR_STATUS", "0")
+    reset_config_cache()
+    with pytest.raises(requests.exceptions.Timeout):
+        manager.post("https://api.example.com/prices", json={"q": "hi"})
+    assert get_cassette().stats()["injected_errors"] == 1
+
+
+def test_streamed_response_is_recorded_as_it_is_read(monkeypatch):
+    body = json.dumps([{"close": 1}, {"close": 2}]).encode()
+    reads = []
+
+    class _Raw:
+        def __init__(self):
+            self.offset = 0
+
+        def read(self, size, **kwargs):
+            reads.append(size)
+            chunk = body[self.offset : self.offset + size]
+            self.offset += len(chunk)
+            return chunk
+
+    def live(url, **kwargs):
+        assert kwargs["stream"] is True
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = _Raw()
+        return response
+
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_MODE", "record")
+    reset_config_cache()
+    manager = HttpSessionManager("vendor-d")
+    monkeypatch.setattr(manager.session(), "get", live)
+    response = manager.get("https://api.example.com/prices", stream=True)
+    cassette = get_cassette()
+    path = cassette.path_for("vendor-d", cassette_key("vendor-d", "GET", "https://api.example.com/prices"))
+    assert reads == [] and not path.exists()
+
+    chunks = response.iter_content(chunk_size=8)
+    assert next(chunks) == body[:8] and reads == [8]
+    assert b"".join([body[:8], *chunks]) == body
+    assert json.loads(path.read_text())["text"] == body.decode()
+
+
+def test_async_replay(monkeypatch):
+    _record(monkeypatch, HttpSessionManager("vendor-c"), {"facts": 1}, params={"ticker": "AAPL"})
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("DATA_TOOLS_CASSETTE_LATENCY_MS", "0")
+    reset_config_cache()
+
+    async def scenario():
+        manager = AsyncHttpClientManager("vendor-c")
+        return await manager.get("https://api.example.com/prices", params={"ticker": "AAPL"})
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200 and response.json() == {"facts": 1}
@@ -1,14 +1,17 @@
 """Unit tests for fd_api module using real API calls."""
 
+import json
 import os
 import pytest
 from datetime import date
 from dotenv import load_dotenv
+from src.data_tools.config import reset_config_cache
 from src.data_tools.fd_api import (
     get_company_facts,
     get_income_statements,
     get_price_snapshot,
 )
+from src.data_tools.records import PriceRecord
 from src.data_tools.schemas import EquitySnapshot, PriceSnapshot
 
 # Load environment variables
@@ -287,7 +290,7 @@ def test_get_equity_snapshot_with_date(api_key):
 
 def test_get_equity_snapshot_none_date(api_key):
     """Test get_equity_snapshot function with None date (should use previous weekday)."""
-    from src.data_tools.fd_api import get_equity_snapshot, _get_previous_weekday
+    from src.data_tools.fd_api import get_equity_snapshot, _get_previous_session
     
     # Test with None date - should use previous weekday
     result = get_equity_snapshot("AAPL", None)
@@ -300,7 +303,7 @@ def test_get_equity_snapshot_none_date(api_key):
         assert key in data, f"Missing required key: {key}"
     
     # Verify the date used is the previous weekday
-    expected_date = _get_previous_weekday()
+    expected_date = _get_previous_session()
     assert data["date"] == expected_date.strftime("%Y-%m-%d")
     
     # Verify the date is a weekday (Monday=0, Friday=4)
@@ -324,7 +327,7 @@ def test_get_company_facts_non_200(monkeypatch):
         def json(self):
             return {"error": "temporarily unavailable"}
 
-    monkeypatch.setattr("src.data_tools.fd_api.requests.get", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr("src.data_tools.fd_api._http_get", lambda *a, **k: DummyResponse())
     with pytest.raises(Exception):
         get_company_facts("AAPL")
 
@@ -342,7 +345,7 @@ def test_get_company_facts_missing_fields(monkeypatch):
         def text(self):
             return ""
 
-    monkeypatch.setattr("src.data_tools.fd_api.requests.get", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr("src.data_tools.fd_api._http_get", lambda *a, **k: DummyResponse())
     with pytest.raises(ValueError, match="missing market_cap"):
         get_company_facts("AAPL")
 
@@ -360,7 +363,7 @@ def test_get_price_snapshot_insufficient_data(monkeypatch):
         def text(self):
             return ""
 
-    monkeypatch.setattr("src.data_tools.fd_api.requests.get", lambda *a, **k: DummyResponse())
+    monkeypatch.setattr("src.data_tools.fd_api._http_get", lambda *a, **k: DummyResponse())
     with pytest.raises(ValueError, match="Insufficient data"):
         get_price_snapshot("AAPL", date(2024, 6, 5))
 
@@ -374,3 +377,399 @@ def test_get_income_statements_returns_recent_years(api_key):
     first = statements[0]
     assert first.ticker == "NVDA"
     assert isinstance(first.total_revenue, (float, int, type(None)))
+
+
+def test_get_price_snapshots_dedupes_and_isolates_failures(monkeypatch):
+    """Batch fetch should call once per ticker and report failures per ticker."""
+    from src.data_tools import fd_api
+
+    calls = []
+
+    def fake_snapshot(ticker, end_date):
+        calls.append(ticker)
+        if ticker == "BAD":
+            raise ValueError("no data")
+        return PriceRecord(ticker, 100.0, 1.0, 1.0, end_date.isoformat())
+
+    monkeypatch.setattr(fd_api, "get_price_record", fake_snapshot)
+    snapshots, errors = fd_api.get_price_snapshots(["aapl", "AAPL ", "MSFT", "BAD", ""], date(2024, 6, 5))
+
+    assert sorted(calls) == ["AAPL", "BAD", "MSFT"]
+    assert set(snapshots) == {"AAPL", "MSFT"}
+    assert isinstance(snapshots["AAPL"], PriceSnapshot)
+    assert isinstance(errors["BAD"], ValueError)
+    assert "" in errors
+
+
+def _bars_response(bars):
+    class DummyResponse:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {"prices": bars}
+
+    return DummyResponse()
+
+
+def test_get_price_snapshot_served_from_bar_store(monkeypatch):
+    """A repeated snapshot for a past date should make no further API calls."""
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    days = ["2024-05-28", "2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04", "2024-06-05"]
+    bars = [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(days)]
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["params"])
+        return _bars_response(bars)
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    first = fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    second = fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    assert len(calls) == 1
+    assert first == second
+    assert second.price == 106.0
+    assert second.return_5d == pytest.approx(106.0 / 101.0)
+
+
+def test_get_price_snapshot_fetches_only_missing_days(monkeypatch):
+    """The next day's snapshot should request only the day after stored coverage."""
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    days = ["2024-05-28", "2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04", "2024-06-05"]
+    responses = [
+        [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(days)],
+        [{"date": "2024-06-06", "close": 110.0, "volume": 1000}],
+    ]
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["params"])
+        return _bars_response(responses[len(calls) - 1])
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    snap = fd_api.get_price_snapshot("AAPL", date(2024, 6, 6))
+    assert calls[1]["start_date"] == "2024-06-06"
+    assert snap.price == 110.0
+    assert snap.return_1d == pytest.approx(110.0 / 106.0)
+
+
+def test_unpublished_bar_is_not_marked_covered(monkeypatch):
+    """A session the vendor has not returned yet is refetched rather than cached as empty."""
+    from src.data_tools import fd_api
+    from src.data_tools.bar_store import get_bar_store
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    days = ["2024-05-22", "2024-05-23", "2024-05-24", "2024-05-28", "2024-05-29",
+            "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04"]
+    responses = [
+        [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(days)],
+        [{"date": "2024-06-05", "close": 110.0, "volume": 1000}],
+    ]
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["params"])
+        return _bars_response(responses[len(calls) - 1])
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    assert get_bar_store().coverage("AAPL") == (date(2024, 5, 22), date(2024, 6, 4))
+    snap = fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    assert calls[1]["start_date"] == "2024-06-05"
+    assert snap.price == 110.0
+    assert get_bar_store().coverage("AAPL") == (date(2024, 5, 22), date(2024, 6, 5))
+
+
+def test_aget_equity_snapshot_matches_sync_parsing(monkeypatch):
+    """The async snapshot should gather price and facts through the shared parsers."""
+    import asyncio
+
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    days = ["2024-05-28", "2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04", "2024-06-05"]
+    bars = [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(days)]
+
+    class FactsResponse:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {"company_facts": {"sector": "Tech", "industry": "Hardware", "market_cap": 3.0e12}}
+
+    urls = []
+
+    async def fake_aget(url, **kwargs):
+        urls.append(url)
+        return _bars_response(bars) if url.endswith("/prices") else FactsResponse()
+
+    monkeypatch.setattr(fd_api, "_ahttp_get", fake_aget)
+    snap = asyncio.run(fd_api.aget_equity_snapshot("aapl", date(2024, 6, 5)))
+    assert sorted(u.rsplit("/", 1)[-1] for u in urls) == ["facts", "prices"]
+    assert snap.ticker == "AAPL"
+    assert snap.price == 106.0
+    assert snap.return_5d == pytest.approx(106.0 / 101.0)
+    assert snap.sector == "Tech"
+
+
+def test_aget_company_facts_non_200(monkeypatch):
+    """Async non-200 responses should raise the same RequestException as the sync path."""
+    import asyncio
+
+    import requests
+
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+
+    class DummyResponse:
+        status_code = 503
+        text = "down"
+
+        def json(self):
+            return {"error": "temporarily unavailable"}
+
+    async def fake_aget(url, **kwargs):
+        return DummyResponse()
+
+    monkeypatch.setattr(fd_api, "_ahttp_get", fake_aget)
+    with pytest.raises(requests.exceptions.RequestException, match="temporarily unavailable"):
+        asyncio.run(fd_api.aget_company_facts("AAPL"))
+
+
+def test_concurrent_company_facts_coalesce_into_one_request(monkeypatch):
+    """Threads asking for the same ticker at once should share one HTTP call."""
+    import threading
+    import time
+
+    from src.data_tools import fd_api
+    from src.data_tools.singleflight import get_singleflight
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    calls = []
+    release = threading.Event()
+
+    class FactsResponse:
+        status_code = 200
+        text = ""
+        content = b""
+
+        def json(self):
+            return {"company_facts": {"sector": "Tech", "market_cap": 1.0e12}}
+
+    class FakeManager:
+        def get(self, url, **kwargs):
+            calls.append(kwargs["params"])
+            release.wait(2)
+            return FactsResponse()
+
+    monkeypatch.setattr(fd_api, "get_session_manager", lambda name: FakeManager())
+    group = get_singleflight(fd_api.VENDOR)
+    before = group.stats()["coalesced"]
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fd_api.get_company_facts("AAPL"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    while group.stats()["coalesced"] - before < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert [r.market_cap for r in results] == [1.0e12] * 4
+
+
+def test_price_window_spans_sessions_with_slack():
+    from src.data_tools.fd_api import _get_previous_session, _price_window_start
+
+    # Ten sessions ending 2024-04-02 skip Good Friday 2024-03-29.
+    assert _price_window_start(date(2024, 4, 2)) == date(2024, 3, 19)
+    # A holiday end date anchors the window on the prior session (and skips Juneteenth).
+    assert _price_window_start(date(2024, 7, 4)) == date(2024, 6, 20)
+    assert _get_previous_session(date(2024, 3, 31)) == date(2024, 3, 28)
+
+
+def test_get_price_snapshot_tolerates_missing_latest_bar(monkeypatch):
+    """No bar yet for the end date plus a zero-volume day should still leave six closes."""
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    days = ["2024-05-22", "2024-05-23", "2024-05-24", "2024-05-28", "2024-05-29",
+            "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04"]
+    bars = [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(days)]
+    bars[6]["volume"] = 0
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["params"])
+        return _bars_response(bars)
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    snap = fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    assert calls[0]["start_date"] == "2024-05-22"
+    assert snap.date == "2024-06-04"
+    assert snap.price == 108.0
+    assert snap.return_5d == pytest.approx(108.0 / 102.0)
+
+
+def test_company_facts_served_from_ttl_cache(monkeypatch):
+    """Repeat lookups (sync and async) reuse the cached CompanyFacts."""
+    import asyncio
+
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    calls = []
+
+    class FactsResponse:
+        status_code = 200
+        text = ""
+        content = b""
+
+        def json(self):
+            return {"company_facts": {"sector": "Tech", "market_cap": 1.0e12}}
+
+    def fake_get(url, headers=None, params=None, timeout=None):
+        calls.append(params)
+        return FactsResponse()
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    first = fd_api.get_company_facts("aapl")
+    assert fd_api.get_company_facts("AAPL") is first
+    assert asyncio.run(fd_api.aget_company_facts("AAPL")) is first
+    assert len(calls) == 1
+
+    monkeypatch.setenv("DATA_TOOLS_FACTS_TTL_S", "0")
+    reset_config_cache()
+    fd_api.get_company_facts("AAPL")
+    assert len(calls) == 2
+
+
+def test_statements_served_from_warehouse_then_fetched_incrementally(monkeypatch):
+    """A full fetch populates the warehouse; later calls only ask for newer report periods."""
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    calls = []
+    payloads = [
+        {"income_statements": [
+            {"report_period": "2023-09-30", "revenue": 383.0, "net_income": 97.0},
+            {"report_period": "2022-09-24", "revenue": 394.0, "net_income": 99.8},
+        ]},
+        {"income_statements": []},
+        {"income_statements": [{"report_period": "2024-09-28", "revenue": 391.0, "net_income": 93.7}]},
+    ]
+
+    class Response:
+        status_code = 200
+        text = ""
+
+        def __init__(self, payload):
+            self._payload = payload
+
+        def json(self):
+            return self._payload
+
+    def fake_get(url, **kwargs):
+        calls.append(dict(kwargs["params"]))
+        return Response(payloads[len(calls) - 1])
+
+    monkeypatch.setattr(fd_api, "_http_get", fake_get)
+    first = fd_api.get_income_statements("AAPL", years=2)
+    assert [s.total_revenue for s in first] == [383.0, 394.0]
+
+    # Within the refresh interval: no request at all.
+    assert [s.total_revenue for s in fd_api.get_income_statements("AAPL", years=2)] == [383.0, 394.0]
+    assert len(calls) == 1
+
+    # Past the refresh interval: only statements after the latest stored period.
+    monkeypatch.setenv("DATA_TOOLS_FUNDAMENTALS_REFRESH_S", "0")
+    reset_config_cache()
+    assert [s.total_revenue for s in fd_api.get_income_statements("AAPL", years=2)] == [383.0, 394.0]
+    assert calls[1]["report_period_gt"] == "2023-09-30"
+    refreshed = fd_api.get_income_statements("AAPL", years=2)
+    assert [s.total_revenue for s in refreshed] == [391.0, 383.0]
+    assert len(calls) == 3
+
+    # Asking for deeper history than was ever fetched triggers a full fetch.
+    payloads.append({"income_statements": [{"report_period": "2024-09-28", "revenue": 391.0}]})
+    fd_api.get_income_statements("AAPL", years=5)
+    assert "report_period_gt" not in calls[3] and calls[3]["limit"] == 5
+
+
+class _StreamingResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, payload, chunk=64):
+        self._body = json.dumps(payload).encode()
+        self._chunk = chunk
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), self._chunk):
+            yield self._body[i:i + self._chunk]
+
+    def json(self):
+        return json.loads(self._body)
+
+    def close(self):
+        self.closed = True
+
+
+def test_long_statement_history_is_streamed(monkeypatch):
+    from src.data_tools import fd_api
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    monkeypatch.setenv("DATA_TOOLS_STREAM_MIN_ITEMS", "3")
+    reset_config_cache()
+    quarters = [
+        {"report_period": f"{2024 - i // 4}-{12 - 3 * (i % 4):02d}-30", "period": "quarterly", "revenue": float(i)}
+        for i in range(8)
+    ]
+    responses = []
+
+    class FakeManager:
+        def get(self, url, stream=False, **kwargs):
+            assert stream, "long histories should be streamed"
+            responses.append(_StreamingResponse({"income_statements": quarters}))
+            return responses[-1]
+
+    monkeypatch.setattr(fd_api, "get_session_manager", lambda name: FakeManager())
+    statements = fd_api.get_income_statements("AAPL", years=4, period="quarterly")
+    assert [s.total_revenue for s in statements] == [0.0, 1.0, 2.0, 3.0]
+    assert responses[0].closed
+    # The full stream was persisted, so a repeat call is served by the warehouse.
+    assert len(fd_api.get_income_statements("AAPL", years=4, period="quarterly")) == 4
+    assert len(responses) == 1
+
+
+def test_backfill_price_bars_streams_into_bar_store(monkeypatch):
+    from src.data_tools import fd_api
+    from src.data_tools.bar_store import get_bar_store
+
+    monkeypatch.setenv("FINANCIAL_DATASETS_API_KEY", "test-key")
+    bars = [{"date": f"2024-01-{d:02d}", "close": 100.0 + d, "volume": 1000} for d in range(2, 30)]
+
+    class FakeManager:
+        def get(self, url, stream=False, **kwargs):
+            if kwargs["params"]["ticker"] == "BAD":
+                response = _StreamingResponse({"message": "unknown ticker"})
+                response.status_code = 404
+                return response
+            return _StreamingResponse({"ticker": kwargs["params"]["ticker"], "prices": bars}, chunk=17)
+
+    monkeypatch.setattr(fd_api, "get_session_manager", lambda name: FakeManager())
+    stored, failures = fd_api.backfill_price_bars(["aapl", "MSFT", "BAD"], date(2024, 1, 1), date(2024, 1, 31), batch_size=5)
+    assert stored == {"AAPL": len(bars), "MSFT": len(bars)}
+    assert "unknown ticker" in str(failures["BAD"])
+    store = get_bar_store()
+    assert len(store.get_bars("AAPL", date(2024, 1, 1), date(2024, 1, 31))) == len(bars)
+    # Jan 30/31 sessions were not returned, so coverage stops at the last bar.
+    assert store.coverage("MSFT") == (date(2024, 1, 1), date(2024, 1, 29))
+    assert store.coverage("BAD") is None
@@ -0,0 +1,36 @@
+from src.data_tools.config import reset_config_cache
+from src.data_tools.filing_cache import FilingCache, get_filing_cache
+
+
+def test_items_round_trip_and_are_deduplicated(tmp_path):
+    cache = FilingCache(tmp_path)
+    assert cache.get_items("AAPL", 2023, []) is None
+    full = cache.put_items("aapl", 2023, [], ["<p>Item 1</p>", "<p>Item 7 MD&A</p>"])
+    mda = cache.put_items("AAPL", 2023, ["Item 7"], ["<p>Item 7 MD&A</p>"])
+
+    assert cache.get_items("AAPL", 2023, []) == ["<p>Item 1</p>", "<p>Item 7 MD&A</p>"]
+    assert cache.get_items("AAPL", 2023, ["Item 7"]) == ["<p>Item 7 MD&A</p>"]
+    assert cache.filing_digest("AAPL", 2023) == full != mda
+    assert len(list((tmp_path / "objects").rglob("*.txt"))) == 2
+
+
+def test_derived_values_follow_filing_content(tmp_path):
+    cache = FilingCache(tmp_path)
+    first = cache.put_items("AAPL", 2023, [], ["revenue 100"])
+    cache.put_derived(first, "revenue-4", [{"year": 2023, "value": 100.0}])
+    assert cache.get_derived(first, "revenue-4") == [{"year": 2023, "value": 100.0}]
+
+    # A refiled document with different text gets a new digest and no stale value.
+    second = cache.put_items("AAPL", 2023, [], ["revenue 101"])
+    assert second != first
+    assert cache.filing_digest("AAPL", 2023) == second
+    assert cache.get_derived(second, "revenue-4") is None
+
+
+def test_cache_lives_under_cache_dir_and_can_be_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATA_TOOLS_CACHE_DIR", str(tmp_path))
+    reset_config_cache()
+    assert get_filing_cache().root == tmp_path / "filings"
+    monkeypatch.setenv("DATA_TOOLS_FILING_CACHE", "0")
+    reset_config_cache()
+    assert get_filing_cache() is None
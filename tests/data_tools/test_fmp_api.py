@@ -0,0 +1,74 @@
+import pytest
+import requests
+
+from src.data_tools import fmp_api
+from src.data_tools.config import reset_config_cache
+from src.data_tools.identifier_store import get_identifier_store
+
+
+def _profile(symbol):
+    return {"symbol": symbol, "cusip": f"{symbol}-CUSIP", "isin": f"US{symbol}", "cik": "1", "exchangeShortName": "NASDAQ"}
+
+
+@pytest.fixture
+def fake_profiles(monkeypatch):
+    paths = []
+
+    def fake_request(path, params=None):
+        paths.append(path)
+        symbols = path.split("/", 1)[1].split(",")
+        if "BOOM" in symbols:
+            raise requests.RequestException("FMP request failed with status 500: ")
+        return [_profile(s) for s in symbols if s != "NOPE"]
+
+    monkeypatch.setattr(fmp_api, "_request_json", fake_request)
+    return paths
+
+
+def test_batch_lookup_joins_symbols_and_reports_sources(fake_profiles):
+    lookup = fmp_api.get_security_identifiers_batch(["aapl", "MSFT", "NOPE", "GOOG", "AAPL"], batch_size=2)
+    assert sorted(fake_profiles) == ["profile/AAPL,MSFT", "profile/NOPE,GOOG"]
+    assert list(lookup.equities) == ["AAPL", "MSFT", "GOOG"]
+    assert lookup.fetched == ["AAPL", "MSFT", "GOOG"] and lookup.cached == []
+    assert lookup.missing == ["NOPE"]
+    assert lookup.equities["MSFT"].cusip == "MSFT-CUSIP"
+
+    fake_profiles.clear()
+    again = fmp_api.get_security_identifiers_batch(["AAPL", "MSFT", "TSLA"])
+    assert fake_profiles == ["profile/TSLA"]
+    assert again.cached == ["AAPL", "MSFT"] and again.fetched == ["TSLA"]
+    assert again.equities["AAPL"] == lookup.equities["AAPL"]
+
+
+def test_batch_lookup_isolates_failed_requests(fake_profiles):
+    lookup = fmp_api.get_security_identifiers_batch(["AAPL", "BOOM", "MSFT"], batch_size=2)
+    assert list(lookup.equities) == ["MSFT"]
+    assert set(lookup.errors) == {"AAPL", "BOOM"}
+    assert lookup.missing == []
+
+
+def test_cache_expires_after_ttl(fake_profiles, monkeypatch):
+    fmp_api.get_security_identifiers_batch(["AAPL"])
+    monkeypatch.setenv("DATA_TOOLS_IDENTIFIER_TTL_S", "0")
+    reset_config_cache()
+    assert fmp_api.get_security_identifiers_batch(["AAPL"]).fetched == ["AAPL"]
+    assert len(fake_profiles) == 2
+    assert get_identifier_store().symbols() == ["AAPL"]
+
+
+def test_single_lookup_uses_cache_and_raises_for_unknown(fake_profiles):
+    assert fmp_api.get_security_identifiers(" aapl ").isin == "USAAPL"
+    assert fmp_api.get_security_identifiers("AAPL").exchange == "NASDAQ"
+    assert fake_profiles == ["profile/AAPL"]
+    with pytest.raises(ValueError, match="No profile data"):
+        fmp_api.get_security_identifiers("NOPE")
+    with pytest.raises(requests.RequestException):
+        fmp_api.get_security_identifiers("BOOM")
+
+
+def test_cache_disabled(fake_profiles, monkeypatch):
+    monkeypatch.setenv("DATA_TOOLS_IDENTIFIER_CACHE", "0")
+    reset_config_cache()
+    fmp_api.get_security_identifiers_batch(["AAPL"])
+    assert fmp_api.get_security_identifiers_batch(["AAPL"]).cached == []
+    assert len(fake_profiles) == 2
@@ -0,0 +1,32 @@
+from datetime import date
+
+from src.data_tools.fundamentals_store import FundamentalsStore
+
+
+def _income(ticker, report_period, revenue):
+    return {"ticker": ticker, "report_period": report_period, "period": "annual", "revenue": revenue}
+
+
+def test_get_returns_newest_first_and_tracks_depth(tmp_path):
+    store = FundamentalsStore(tmp_path / "f.sqlite")
+    store.save("income-statements", "AAPL", "annual", [_income("AAPL", "2022-09-24", 394), _income("AAPL", "2023-09-30", 383)], depth=4)
+    assert [e["report_period"] for e in store.get("income-statements", "AAPL", "annual")] == ["2023-09-30", "2022-09-24"]
+    assert store.get("income-statements", "AAPL", "annual", limit=1)[0]["revenue"] == 383
+
+    store.save("income-statements", "AAPL", "annual", [_income("AAPL", "2024-09-28", 391)])
+    depth, _ = store.sync_state("income-statements", "AAPL", "annual")
+    assert depth == 4
+    assert store.get("income-statements", "AAPL", "annual", limit=1)[0]["report_period"] == "2024-09-28"
+
+
+def test_cross_section_uses_latest_statement_per_ticker(tmp_path):
+    store = FundamentalsStore(tmp_path / "f.sqlite")
+    store.save("income-statements", "AAPL", "annual", [_income("AAPL", "2023-09-30", 383), _income("AAPL", "2024-09-28", 391)])
+    store.save("income-statements", "MSFT", "annual", [_income("MSFT", "2024-06-30", 245)])
+    store.save("income-statements", "NOREV", "annual", [{"report_period": "2024-12-31"}])
+
+    assert store.cross_section("income-statements", "revenue") == {"AAPL": 391, "MSFT": 245}
+    assert store.cross_section("income-statements", "revenue", as_of=date(2024, 1, 1)) == {"AAPL": 383}
+    assert store.tickers("income-statements") == ["AAPL", "MSFT", "NOREV"]
+    store.clear("AAPL")
+    assert store.sync_state("income-statements", "AAPL", "annual") is None
@@ -0,0 +1,101 @@
+"""Tests for the shared vendor HTTP session layer."""
+
+from src.data_tools.config import load_http_config, reset_config_cache
+from src.data_tools.http_client import HttpSessionManager, get_session_manager
+
+
+def test_timeout_uses_longest_prefix():
+    cfg = dict(load_http_config())
+    cfg["endpoint_timeouts"] = {"/financials": 15.0, "/financials/balance-sheets": 20.0}
+    manager = HttpSessionManager("test", config=cfg)
+    assert manager.timeout_for("https://api.example.com/financials/balance-sheets") == 20.0
+    assert manager.timeout_for("https://api.example.com/financials/income-statements") == 15.0
+    assert manager.timeout_for("https://api.example.com/prices") == cfg["default_timeout_s"]
+
+
+def test_endpoint_timeouts_env_override(monkeypatch):
+    monkeypatch.setenv("DATA_TOOLS_ENDPOINT_TIMEOUTS", "prices=3,/company/facts=4")
+    reset_config_cache()
+    cfg = load_http_config()
+    assert cfg["endpoint_timeouts"]["/prices"] == 3.0
+    assert cfg["endpoint_timeouts"]["/company/facts"] == 4.0
+
+
+def test_config_is_parsed_once_until_reset(monkeypatch):
+    cfg = load_http_config()
+    monkeypatch.setenv("DATA_TOOLS_TIMEOUT_S", "99")
+    assert load_http_config() is cfg
+    reset_config_cache()
+    assert load_http_config()["default_timeout_s"] == 99.0
+
+
+def test_session_shared_and_counted(monkeypatch):
+    manager = HttpSessionManager("test")
+    session = manager.session()
+    assert manager.session() is session
+
+    captured = {}
+
+    def fake_get(url, **kwargs):
+        captured.update(kwargs)
+        return "ok"
+
+    monkeypatch.setattr(session, "get", fake_get)
+    assert manager.get("https://api.example.com/prices", params={"ticker": "AAPL"}) == "ok"
+    assert captured["timeout"] == manager.timeout_for("/prices")
+    stats = manager.stats()
+    assert stats["requests"] == 1
+    assert stats["requests_by_endpoint"] == {"/prices": 1}
+
+
+def test_get_session_manager_is_singleton():
+    assert get_session_manager("fd-test") is get_session_manager("fd-test")
+
+
+def test_async_manager_wraps_transport_errors():
+    import asyncio
+
+    import httpx
+    import pytest
+    import requests
+
+    from src.data_tools.http_client import AsyncHttpClientManager
+
+    def handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True, "timeout": request.extensions["timeout"]["read"]})
+
+    manager = AsyncHttpClientManager("test")
+
+    async def scenario():
+        manager._clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ok = await manager.get("https://api.example.com/prices")
+        with pytest.raises(requests.exceptions.RequestException):
+            await manager.get("https://api.example.com/down")
+        await manager.aclose()
+        return ok
+
+    response = asyncio.run(scenario())
+    assert response.json()["timeout"] == manager.timeout_for("/prices")
+    stats = manager.stats()
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+
+
+def test_429_raises_rate_limit_error(monkeypatch):
+    import pytest
+
+    from src.data_tools.rate_limit import RateLimitError, get_rate_limiter
+
+    class Throttled:
+        status_code = 429
+        headers = {"Retry-After": "0"}
+
+    manager = HttpSessionManager("test-429")
+    monkeypatch.setattr(manager.session(), "get", lambda url, **kwargs: Throttled())
+    with pytest.raises(RateLimitError) as excinfo:
+        manager.get("https://api.example.com/prices")
+    assert excinfo.value.retry_after == 0.0
+    assert manager.stats()["errors"] == 1
+    assert get_rate_limiter("test-429").stats()["throttled"] == 1
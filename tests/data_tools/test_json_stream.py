@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from src.data_tools.json_stream import iter_json_array
+
+
+def _chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_streams_array_under_key_for_any_chunking(size):
+    payload = {
+        "next_page_url": None,
+        "meta": {"nested": [1, 2]},
+        "prices": [{"close": 123.45, "date": "2024-06-05", "name": "Société"}, {"close": 1e3, "volume": 10}],
+    }
+    items = list(iter_json_array(_chunks(json.dumps(payload, ensure_ascii=False), size), keys=("prices",)))
+    assert items == payload["prices"]
+
+
+def test_top_level_array_and_scalars_split_across_chunks():
+    assert list(iter_json_array(_chunks("[1234567, true, null, \"x\"]", 2))) == [1234567, True, None, "x"]
+    assert list(iter_json_array(["[]"])) == []
+    assert list(iter_json_array(["{}"])) == []
+
+
+def test_skips_empty_arrays_when_any_key_allowed():
+    payload = '{"warnings": [], "income_statements": [{"revenue": 1}], "other": [{"x": 2}]}'
+    assert list(iter_json_array(_chunks(payload, 5))) == [{"revenue": 1}]
+
+
+def test_yields_before_stream_is_exhausted():
+    consumed = []
+
+    def chunks():
+        for piece in ('{"items": [{"a": 1},', ' {"a": 2}', "]}"):
+            consumed.append(piece)
+            yield piece
+
+    stream = iter_json_array(chunks())
+    assert next(stream) == {"a": 1}
+    assert len(consumed) < 3
+
+
+def test_malformed_stream_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_array(['{"items": [{"a": 1} {"a": 2}]}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array(['{"items": [{"a": 1}, {"a": ']))
@@ -0,0 +1,72 @@
+"""Tests for the memory-mapped price history store."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.data_tools.bar_store import DailyBarStore
+from src.data_tools.price_history import build_price_history, get_price_history
+
+DAYS = ["2024-05-28", "2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04", "2024-06-05"]
+
+
+def _seed(store: DailyBarStore) -> None:
+    store.save("AAPL", [{"date": d, "close": 100.0 + i, "volume": 1000} for i, d in enumerate(DAYS)], date(2024, 5, 20), date(2024, 6, 5))
+    # MSFT is missing one session and covers a shorter range.
+    store.save("MSFT", [{"date": d, "close": 400.0 + i, "volume": 500} for i, d in enumerate(DAYS) if d != "2024-05-30"], date(2024, 5, 28), date(2024, 6, 5))
+
+
+def test_build_and_slice_without_copy(tmp_path):
+    bars = DailyBarStore(tmp_path / "bars.sqlite")
+    _seed(bars)
+    history = build_price_history(bar_store=bars, root=tmp_path / "history")
+
+    assert history.symbols == ["AAPL", "MSFT"]
+    assert history.closes.shape == (2, len(DAYS))
+    assert isinstance(history.closes, np.memmap)
+
+    dates, closes, volumes = history.history("MSFT", date(2024, 5, 29), date(2024, 6, 3))
+    assert [str(d) for d in dates] == ["2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03"]
+    assert np.isnan(closes[1])
+    assert np.shares_memory(closes, history.closes)
+
+
+def test_bars_only_served_inside_coverage(tmp_path):
+    bars = DailyBarStore(tmp_path / "bars.sqlite")
+    _seed(bars)
+    history = build_price_history(bar_store=bars, root=tmp_path / "history")
+
+    window = history.bars("AAPL", date(2024, 5, 26), date(2024, 6, 5))
+    assert [b["close"] for b in window] == [100.0 + i for i in range(len(DAYS))]
+    assert history.bars("MSFT", date(2024, 5, 26), date(2024, 6, 5)) is None
+    assert history.bars("AAPL", date(2024, 5, 26), date(2024, 6, 6)) is None
+    assert history.bars("NVDA", date(2024, 5, 26), date(2024, 6, 5)) is None
+
+
+def test_price_snapshot_reads_history_without_network(tmp_path, monkeypatch):
+    from src.data_tools import fd_api
+    from src.data_tools.bar_store import get_bar_store
+
+    _seed(get_bar_store())
+    build_price_history(symbols=["AAPL"])
+    get_bar_store().clear()
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("network should not be used")
+
+    monkeypatch.setattr(fd_api, "_http_get", no_network)
+    snap = fd_api.get_price_snapshot("AAPL", date(2024, 6, 5))
+    assert snap.price == 106.0
+    assert snap.return_5d == pytest.approx(106.0 / 101.0)
+
+
+def test_rebuild_is_picked_up(tmp_path):
+    from src.data_tools.bar_store import get_bar_store
+
+    store = get_bar_store()
+    _seed(store)
+    build_price_history(symbols=["AAPL"])
+    assert get_price_history().symbols == ["AAPL"]
+    build_price_history(symbols=["AAPL", "MSFT"])
+    assert get_price_history().symbols == ["AAPL", "MSFT"]
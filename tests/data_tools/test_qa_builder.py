@@ -152,3 +152,122 @@ def test_generate_qa_from_file_missing_local_path(monkeypatch, tmp_path):
 
     with pytest.raises(FileNotFoundError):
         qa_builder.generate_qa_from_file(str(tmp_path / "missing.htm"))
+
+
+def _counting_parser(monkeypatch, items_by_selection):
+    """Replace FilingParser with one that counts fetches per (ticker, year, selection)."""
+    from src.data_tools import qa_builder
+
+    calls = []
+
+    class CountingParser:
+        def get_10K_items(self, ticker, year, item_names=()):
+            calls.append((ticker, year, tuple(item_names)))
+            return list(items_by_selection[tuple(item_names)])
+
+    monkeypatch.setattr(qa_builder, "FilingParser", lambda: CountingParser())
+    return calls
+
+
+REVENUE_HTML = (
+    "<table><tr><th>Metric</th><th>2023</th><th>2022</th></tr>"
+    "<tr><td>Total net revenue</td><td>383,285</td><td>394,328</td></tr></table>"
+)
+
+
+def test_filing_items_and_revenue_are_cached(monkeypatch):
+    """A second call on the same filing neither refetches nor reparses it."""
+    from src.data_tools import qa_builder
+
+    calls = _counting_parser(monkeypatch, {(): ["<p>business</p>", REVENUE_HTML]})
+    first = qa_builder.extract_revenue_history("AAPL", 2023)
+    assert first == [{"year": 2023, "value": 383285.0}, {"year": 2022, "value": 394328.0}]
+
+    def no_reparse(*a, **k):
+        raise AssertionError("revenue table reparsed")
+
+    monkeypatch.setattr(qa_builder, "_extract_revenue_from_html", no_reparse)
+    assert qa_builder.extract_revenue_history("AAPL", 2023) == first
+    assert qa_builder.get_10k_items("AAPL", 2023) == ["<p>business</p>", REVENUE_HTML]
+    assert calls == [("AAPL", 2023, ())]
+
+
+def test_extract_filings_batch_warms_cache(monkeypatch):
+    """The batch pipeline reports per-filing summaries and failures."""
+    from src.data_tools import qa_builder
+
+    calls = _counting_parser(monkeypatch, {(): [REVENUE_HTML], ("Item 7",): ["<p>mda</p>"]})
+    results, errors = qa_builder.extract_filings([("aapl", 2023), ("AAPL", 2023)], max_workers=1)
+    assert errors == {}
+    summary = results[("AAPL", 2023)]
+    assert summary["items"] == 1 and summary["mda_chars"] == len("<p>mda</p>")
+    assert summary["revenue"][0] == {"year": 2023, "value": 383285.0}
+    assert len(calls) == 2
+
+    assert qa_builder.extract_mda_section("AAPL", 2023) == "<p>mda</p>"
+    assert len(calls) == 2
+
+
+def test_extract_qa_from_10k_resumes_after_failure(monkeypatch, tmp_path):
+    """Chunks committed before a crash are kept; the rerun only generates the rest."""
+    from src.data_tools import qa_builder
+
+    _counting_parser(monkeypatch, {("Item 7",): ["mda text"]})
+    monkeypatch.setattr(qa_builder, "TokenTextSplitter", lambda **k: type("S", (), {"split_text": lambda self, t: ["c0", "c1", "c2"]})())
+    prompts = []
+
+    class FlakyGenerator:
+        fail_on = "c1"
+
+        def __init__(self, model, api_key):
+            pass
+
+        def generate_from_texts(self, texts, max_questions):
+            prompts.append(texts[0])
+            if texts[0] == FlakyGenerator.fail_on:
+                raise KeyboardInterrupt
+            return [{"question": f"{texts[0]}-q{i}", "answer": "a"} for i in range(max_questions)]
+
+    monkeypatch.setattr(qa_builder, "DatasetGenerator", FlakyGenerator)
+    out = tmp_path / "qa.jsonl"
+    with pytest.raises(KeyboardInterrupt):
+        qa_builder.extract_qa_from_10k("AAPL", 2023, str(out), max_questions=6, api_key="k")
+    assert len(out.read_text().splitlines()) == 2
+
+    FlakyGenerator.fail_on = None
+    assert qa_builder.extract_qa_from_10k("AAPL", 2023, str(out), max_questions=6, api_key="k") == 6
+    assert prompts == ["c0", "c1", "c1", "c2"]
+    assert qa_builder.extract_qa_from_10k("AAPL", 2023, str(out), max_questions=6, api_key="k") == 6
+    assert len(prompts) == 4
+
+
+def test_extract_qa_batch_shares_pool_and_reports_errors(monkeypatch, tmp_path):
+    """Batch mode writes one JSONL per filing and isolates failures."""
+    from src.data_tools import qa_builder
+
+    def fake_extract(ticker, year, output_file, resume=True, **kwargs):
+        if ticker == "BAD":
+            raise RuntimeError("no filing")
+        return 3
+
+    monkeypatch.setattr(qa_builder, "extract_qa_from_10k", fake_extract)
+    results, errors = qa_builder.extract_qa_batch([("AAPL", 2023), ("BAD", 2023)], str(tmp_path), max_workers=2)
+    assert results == {("AAPL", 2023): 3}
+    assert list(errors) == [("BAD", 2023)]
+
+
+def test_extract_qa_batch_file_jobs_with_same_stem_get_distinct_outputs(monkeypatch, tmp_path):
+    from src.data_tools import qa_builder
+
+    outputs = {}
+
+    def fake_extract(file_url, output_file, resume=True, **kwargs):
+        outputs[file_url] = output_file
+        return 1
+
+    monkeypatch.setattr(qa_builder, "extract_qa_from_file", fake_extract)
+    jobs = ["https://example.com/a/10k.htm", "https://example.com/b/10k.htm"]
+    results, errors = qa_builder.extract_qa_batch(jobs, str(tmp_path), max_workers=2)
+    assert results == {job: 1 for job in jobs} and not errors
+    assert len(set(outputs.values())) == 2
+    assert all(os.path.basename(path).startswith("10k_") for path in outputs.values())
@@ -0,0 +1,54 @@
+import json
+
+from src.data_tools.qa_checkpoint import QACheckpoint
+from src.data_tools.schemas import QAPair
+
+SOURCE = {"ticker": "AAPL", "year": 2023, "max_questions": 10}
+
+
+def _qa(i):
+    return QAPair(question=f"q{i}", answer=f"a{i}")
+
+
+def test_commits_are_appended_and_recorded(tmp_path):
+    out = tmp_path / "qa.jsonl"
+    cp = QACheckpoint(out, SOURCE)
+    assert cp.commit(0, [_qa(0), _qa(1)]) == 2
+    cp.commit(2, [_qa(2)])
+    assert [json.loads(line)["question"] for line in out.read_text().splitlines()] == ["q0", "q1", "q2"]
+    manifest = json.loads((tmp_path / "qa.jsonl.manifest.json").read_text())
+    assert manifest["done"] == [0, 2] and manifest["pairs"] == 3 and not manifest["complete"]
+    assert manifest["bytes"] == out.stat().st_size
+
+
+def test_resume_skips_done_units_and_drops_partial_writes(tmp_path):
+    out = tmp_path / "qa.jsonl"
+    first = QACheckpoint(out, SOURCE)
+    first.commit(0, [_qa(0)])
+    with open(out, "a", encoding="utf-8") as fh:
+        fh.write('{"question": "half-writ')  # crash mid-append
+
+    again = QACheckpoint(out, SOURCE)
+    assert again.resumed and again.is_done(0) and not again.is_done(1)
+    again.commit(1, [_qa(1)])
+    again.finish()
+    assert [qa.question for qa in again.read()] == ["q0", "q1"]
+    assert QACheckpoint(out, SOURCE).complete
+
+
+def test_changed_source_or_no_resume_starts_over(tmp_path):
+    out = tmp_path / "qa.jsonl"
+    QACheckpoint(out, SOURCE).commit(0, [_qa(0)])
+    other = QACheckpoint(out, {**SOURCE, "max_questions": 20})
+    assert not other.resumed and other.pairs == 0 and out.read_text() == ""
+
+    other.commit(0, [_qa(5)])
+    fresh = QACheckpoint(out, {**SOURCE, "max_questions": 20}, resume=False)
+    assert fresh.pairs == 0 and out.read_text() == ""
+
+
+def test_discard_removes_output_and_manifest(tmp_path):
+    out = tmp_path / "nested" / "qa.jsonl"
+    cp = QACheckpoint(out, SOURCE)
+    cp.discard()
+    assert not out.exists() and not cp.manifest_path.exists()
@@ -0,0 +1,112 @@
+"""Tests for vendor token buckets and adaptive concurrency."""
+
+import pytest
+
+from src.data_tools.config import reset_config_cache
+from src.data_tools.rate_limit import (
+    AdaptiveConcurrency,
+    FileTokenBucket,
+    RateLimitError,
+    TokenBucket,
+    VendorRateLimiter,
+    get_rate_limiter,
+    is_rate_limited,
+    reset_rate_limiters,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0.0
+
+
+def test_token_bucket_pause_blocks_until_retry_after():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10.0, capacity=10.0, clock=clock)
+    bucket.pause(3.0)
+    assert bucket.try_acquire() == pytest.approx(3.0)
+    clock.now += 3.1
+    assert bucket.try_acquire() == 0.0
+
+
+def test_file_bucket_shared_between_instances(tmp_path):
+    pytest.importorskip("fcntl")
+    path = tmp_path / "fmp.bucket"
+    first = FileTokenBucket(path, rate=0.001, capacity=2.0)
+    second = FileTokenBucket(path, rate=0.001, capacity=2.0)
+    assert first.try_acquire() == 0.0
+    assert second.try_acquire() == 0.0
+    assert first.try_acquire() > 0
+    assert second.try_acquire() > 0
+
+
+def test_aimd_backs_off_on_throttle_and_latency_spike():
+    limiter = AdaptiveConcurrency(initial=8, minimum=1, maximum=16, latency_spike_factor=3.0)
+    for _ in range(8):
+        assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    limiter.release(0.1)
+    grown = limiter.limit
+    assert grown > 8
+    limiter.release(0.1, throttled=True)
+    assert limiter.limit == pytest.approx(grown / 2)
+    before_spike = limiter.limit
+    limiter.release(5.0)
+    assert limiter.limit == pytest.approx(max(before_spike / 2, 1))
+    assert limiter.decreases == 2
+
+
+def test_vendor_limiter_pauses_bucket_on_429():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100.0, capacity=100.0, clock=clock)
+    limiter = VendorRateLimiter("fmp", AdaptiveConcurrency(initial=4), bucket)
+    limiter.acquire()
+    limiter.release(0.05, status_code=429, retry_after=2.0)
+    assert bucket.try_acquire() == pytest.approx(2.0)
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_is_rate_limited_walks_cause_chain():
+    try:
+        try:
+            raise RateLimitError("429", vendor="fmp")
+        except RateLimitError as inner:
+            raise ValueError("wrapped") from inner
+    except ValueError as outer:
+        assert is_rate_limited(outer)
+    assert not is_rate_limited(ValueError("rate limit"))
+
+
+def test_retry_after_header_parsing():
+    class Response:
+        headers = {"Retry-After": "7"}
+
+    assert retry_after_seconds(Response()) == 7.0
+
+
+def test_get_rate_limiter_respects_env(monkeypatch):
+    reset_rate_limiters()
+    monkeypatch.setenv("DATA_TOOLS_VENDOR_RPS", "fmp=2")
+    reset_config_cache()
+    limiter = get_rate_limiter("fmp")
+    assert limiter.bucket.rate == 2.0
+    assert get_rate_limiter("unknown-vendor").bucket is None
+    monkeypatch.setenv("DATA_TOOLS_RATE_LIMIT", "0")
+    reset_config_cache()
+    assert get_rate_limiter("fmp") is None
+    reset_rate_limiters()
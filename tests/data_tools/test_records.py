@@ -0,0 +1,27 @@
+import pytest
+
+from src.data_tools.records import EquityRecord, PriceRecord
+from src.data_tools.schemas import EquitySnapshot, PriceSnapshot
+
+
+def test_price_record_round_trips_to_model():
+    record = PriceRecord("AAPL", 195.87, 1.0078, 1.0293, "2024-06-05")
+    model = record.to_model()
+    assert isinstance(model, PriceSnapshot)
+    assert model.model_dump() == record.to_dict()
+    assert set(record.to_dict()) == set(PriceSnapshot.model_fields)
+    assert record.source == "financialdatasets.ai"
+
+
+def test_equity_record_matches_schema_fields_and_defaults():
+    record = EquityRecord(ticker="MSFT", price=420.0, market_cap=3.1e12, sector="Technology", date="2024-06-05")
+    assert set(record.to_dict()) == set(EquitySnapshot.model_fields)
+    assert record.to_model().model_dump() == record.to_dict()
+    assert record.return_1d == 1.0 and record.volatility_20d is None
+
+
+def test_records_are_slotted():
+    record = PriceRecord("AAPL", 1.0, 1.0, 1.0, "2024-06-05")
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
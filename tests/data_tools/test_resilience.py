@@ -0,0 +1,250 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from src.data_tools.config import load_resilience_config, reset_config_cache
+from src.data_tools.http_client import HttpSessionManager
+from src.data_tools.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    EndpointGuard,
+    LatencyWindow,
+    endpoint_key,
+    get_guard,
+    is_circuit_open,
+    resilience_stats,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Resp:
+    def __init__(self, status_code=200, tag=""):
+        self.status_code = status_code
+        self.tag = tag
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _guard(**overrides):
+    cfg = {**load_resilience_config(), **overrides}
+    return EndpointGuard("vendor", "/prices", cfg)
+
+
+def test_breaker_opens_after_consecutive_failures_and_half_opens():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_s=10, clock=clock)
+    for _ in range(2):
+        assert breaker.allow() is None
+        breaker.record(True)
+    breaker.record(False)  # a success resets the streak
+    for _ in range(3):
+        assert breaker.allow() is None
+        breaker.record(True)
+    assert breaker.state == "open"
+    assert breaker.allow() == pytest.approx(10)
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow() is None  # the single trial
+    assert breaker.allow() is not None  # concurrent callers still rejected
+    breaker.record(True)
+    assert breaker.state == "open" and breaker.trips == 2
+
+    clock.now = 20
+    assert breaker.allow() is None
+    breaker.record(False)
+    assert breaker.state == "closed"
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_throttled_half_open_trial_keeps_breaker_half_open():
+    from src.data_tools.rate_limit import RateLimitError
+
+    clock = _Clock()
+    guard = _guard(breaker_failure_threshold=1, breaker_reset_s=10)
+    guard.breaker._clock = clock
+    guard.call(lambda: _Resp(503))
+    assert guard.breaker.state == "open"
+
+    clock.now = 10
+    guard.call(lambda: _Resp(429))
+    assert guard.breaker.state == "half_open"
+    with pytest.raises(RateLimitError):
+        guard.call(lambda: (_ for _ in ()).throw(RateLimitError("429", vendor="vendor")))
+    assert guard.breaker.state == "half_open"
+    guard.call(lambda: _Resp(200))
+    assert guard.breaker.state == "closed"
+
+
+def test_guard_counts_5xx_and_timeouts_but_not_throttling():
+    from src.data_tools.rate_limit import RateLimitError
+
+    guard = _guard(breaker_failure_threshold=2)
+    guard.call(lambda: _Resp(503))
+    with pytest.raises(RateLimitError):
+        guard.call(lambda: (_ for _ in ()).throw(RateLimitError("429", vendor="vendor")))
+    assert guard.breaker.stats()["consecutive_failures"] == 0
+
+    with pytest.raises(requests.exceptions.Timeout):
+        guard.call(lambda: (_ for _ in ()).throw(requests.exceptions.Timeout("slow")))
+    guard.call(lambda: _Resp(500))
+    calls = []
+    with pytest.raises(CircuitOpenError) as info:
+        guard.call(lambda: calls.append(1))
+    assert calls == []
+    assert info.value.endpoint == "/prices"
+    wrapped = requests.exceptions.RequestException("wrapped")
+    wrapped.__cause__ = info.value
+    assert is_circuit_open(wrapped)
+
+
+def test_latency_window_quantiles_need_min_samples():
+    window = LatencyWindow(size=100)
+    for i in range(1, 101):
+        window.add(i / 100)
+    assert window.quantile(0.95) == pytest.approx(0.95)
+    assert window.quantile(0.5) == pytest.approx(0.5)
+    assert window.quantile(0.95, min_samples=101) is None
+
+
+def test_hedged_call_takes_faster_duplicate():
+    guard = _guard(hedge_enabled=True, hedge_min_samples=5, hedge_min_delay_s=0.01)
+    for _ in range(5):
+        guard.latencies.add(0.02)
+    assert guard.hedge_delay() == pytest.approx(0.02)
+
+    lock = threading.Lock()
+    responses = []
+
+    def attempt():
+        with lock:
+            first = not responses
+            response = _Resp(tag="slow" if first else "fast")
+            responses.append(response)
+        time.sleep(0.5 if first else 0.01)
+        return response
+
+    started = time.perf_counter()
+    result = guard.call(attempt, hedge=True)
+    assert result.tag == "fast"
+    assert time.perf_counter() - started < 0.4
+    stats = guard.stats()
+    assert (stats["hedges"], stats["hedge_wins"]) == (1, 1)
+    time.sleep(0.6)
+    assert responses[0].closed  # the losing response is released
+
+
+def test_hedged_5xx_does_not_beat_pending_attempt():
+    guard = _guard(hedge_enabled=True, hedge_min_samples=1, hedge_min_delay_s=0.01)
+    guard.latencies.add(0.01)
+    lock = threading.Lock()
+    responses = []
+
+    def attempt():
+        with lock:
+            first = not responses
+            response = _Resp(tag="ok") if first else _Resp(503, tag="unavailable")
+            responses.append(response)
+        time.sleep(0.1 if first else 0.0)
+        return response
+
+    assert guard.call(attempt, hedge=True).tag == "ok"
+    assert responses[1].closed
+    assert guard.stats()["hedge_wins"] == 0
+
+    # With no attempt left to wait for, the 5xx is returned as an unhedged call would.
+    assert guard.call(lambda: (time.sleep(0.05), _Resp(503, tag="down"))[1], hedge=True).status_code == 503
+
+
+def test_fast_primary_is_not_hedged():
+    guard = _guard(hedge_enabled=True, hedge_min_samples=1)
+    guard.latencies.add(0.2)
+    assert guard.call(lambda: _Resp(tag="primary"), hedge=True).tag == "primary"
+    assert guard.stats()["hedges"] == 0
+
+
+def test_async_hedge_cancels_loser():
+    guard = _guard(hedge_enabled=True, hedge_min_samples=1, hedge_min_delay_s=0.01)
+    guard.latencies.add(0.01)
+    cancelled = []
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return _Resp(tag="slow")
+        return _Resp(tag="fast")
+
+    async def run():
+        result = await guard.acall(attempt, hedge=True)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()).tag == "fast"
+    assert cancelled == [True]
+    assert guard.stats()["hedge_wins"] == 1
+
+
+def test_endpoint_key_uses_longest_prefix_or_vendor_wide():
+    prefixes = ["/financials", "/financials/income-statements", "/prices"]
+    assert endpoint_key("https://x/financials/income-statements/", prefixes) == "/financials/income-statements"
+    assert endpoint_key("https://x/financials/balance-sheets", prefixes) == "/financials"
+    assert endpoint_key("https://x/unknown", prefixes) == "*"
+
+
+def test_session_manager_fails_fast_once_open(monkeypatch):
+    monkeypatch.setenv("DATA_TOOLS_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("DATA_TOOLS_RATE_LIMIT", "0")
+    reset_config_cache()
+    manager = HttpSessionManager("resilience-test")
+    session = manager.session()
+    sent = []
+
+    def failing_get(url, **kwargs):
+        sent.append(url)
+        raise requests.exceptions.ConnectionError("reset")
+
+    monkeypatch.setattr(session, "get", failing_get)
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            manager.get("https://api.example.com/prices")
+    with pytest.raises(CircuitOpenError):
+        manager.get("https://api.example.com/prices")
+    assert len(sent) == 2
+
+    # Other endpoints have their own breaker.
+    monkeypatch.setattr(session, "get", lambda url, **kwargs: _Resp(200))
+    assert manager.get("https://api.example.com/company/facts").status_code == 200
+
+    stats = manager.stats()
+    assert stats["errors"] == 3
+    assert stats["endpoints"]["/prices"]["state"] == "open"
+    assert stats["endpoints"]["/company/facts"]["state"] == "closed"
+    assert resilience_stats()["resilience-test"]["/prices"]["rejected"] == 1
+
+
+def test_disabled_guards(monkeypatch):
+    monkeypatch.setenv("DATA_TOOLS_BREAKER", "0")
+    reset_config_cache()
+    assert get_guard("vendor", "https://x/prices") is None
+    monkeypatch.setenv("DATA_TOOLS_HEDGE", "1")
+    reset_config_cache()
+    guard = get_guard("vendor", "https://x/prices")
+    assert guard is not None and guard.breaker is None
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from src.data_tools import revenue_scanner
+from src.data_tools.revenue_scanner import scan_revenue_table
+
+AAPL_10K = Path(__file__).resolve().parents[2] / "examples" / "data_tools" / "filings" / "aapl-20230930.htm"
+
+
+def test_aapl_10k_total_net_sales():
+    html = AAPL_10K.read_text(encoding="utf-8")
+    assert scan_revenue_table(html) == [
+        {"year": 2023, "value": 383285.0},
+        {"year": 2022, "value": 394328.0},
+        {"year": 2021, "value": 365817.0},
+    ]
+    assert scan_revenue_table(html, max_years=2)[-1]["year"] == 2022
+
+
+def test_th_header_and_colspan_alignment():
+    html = (
+        "<table><tr><th>Metric</th><th>2023</th><th>2022</th></tr>"
+        "<tr><td>Total net revenue</td><td>383,285</td><td>394,328</td></tr></table>"
+    )
+    assert scan_revenue_table(html) == [{"year": 2023, "value": 383285.0}, {"year": 2022, "value": 394328.0}]
+
+    # Year headers span the "$" and value cells beneath them; "Change" columns are ignored.
+    html = (
+        "<table>"
+        '<tr><td></td><td colspan="2">2024</td><td colspan="2">Change</td><td colspan="2">2023</td></tr>'
+        "<tr><td>Revenues</td><td>$</td><td>(1,200)</td><td>5</td><td>%</td><td>$</td><td>1,000</td></tr>"
+        "</table>"
+    )
+    assert scan_revenue_table(html) == [{"year": 2024, "value": -1200.0}, {"year": 2023, "value": 1000.0}]
+
+
+def test_rejects_rows_that_only_mention_revenue():
+    html = (
+        "<table><tr><td></td><td>2023</td></tr>"
+        "<tr><td>Percentage of total net sales</td><td>8</td></tr>"
+        "<tr><td>Deferred revenue, net</td><td>12</td></tr>"
+        "<tr><td>As of September 30, 2023</td><td></td></tr>"
+        "<tr><td>Net sales</td><td>100</td></tr></table>"
+    )
+    assert scan_revenue_table(html) == [{"year": 2023, "value": 100.0}]
+    assert scan_revenue_table("<p>no tables</p>") == []
+
+
+def test_stops_tokenizing_after_first_match(monkeypatch):
+    monkeypatch.setattr(revenue_scanner, "CHUNK_CHARS", 64)
+    fed = []
+    original = revenue_scanner._RevenueTableScanner.feed
+
+    def counting_feed(self, data):
+        fed.append(len(data))
+        return original(self, data)
+
+    monkeypatch.setattr(revenue_scanner._RevenueTableScanner, "feed", counting_feed)
+    head = "<table><tr><th></th><th>2023</th></tr><tr><td>Revenue</td><td>7</td></tr></table>"
+    html = head + "<table><tr><td>filler</td></tr></table>" * 500
+    assert scan_revenue_table(html) == [{"year": 2023, "value": 7.0}]
+    assert sum(fed) < len(head) + 128
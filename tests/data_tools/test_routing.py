@@ -0,0 +1,146 @@
+from datetime import date
+
+import pytest
+import requests
+
+from src.data_tools import fmp_api, routing
+from src.data_tools.config import load_routing_config, reset_config_cache
+from src.data_tools.records import PriceRecord
+from src.data_tools.routing import VendorRouter, get_price_router, routing_stats
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _record(source):
+    return PriceRecord("AAPL", 100.0, 1.01, 1.02, "2024-06-05", source)
+
+
+def _router(vendors, clock=None, **overrides):
+    cfg = {**load_routing_config(), "min_samples": 2, **overrides}
+    return VendorRouter("prices", vendors, cfg, clock=clock or _Clock())
+
+
+def test_routes_to_fastest_vendor_after_probing(monkeypatch):
+    router = _router({"slow": lambda t, d: _record("slow"), "fast": lambda t, d: _record("fast")})
+    latency = {"slow": 0.2, "fast": 0.01}
+    for name in ("slow", "fast"):
+        for _ in range(2):
+            router._health[name].record(latency[name], True)
+    assert router.ranked() == ["fast", "slow"]
+    assert router.call("AAPL", date(2024, 6, 5)).source == "fast"
+    assert router.stats()["vendors"]["fast"]["served"] == 1
+
+
+def test_falls_back_and_demotes_failing_vendor():
+    calls = []
+
+    def broken(ticker, end_date):
+        calls.append("broken")
+        raise requests.exceptions.ConnectionError("reset")
+
+    router = _router({"broken": broken, "backup": lambda t, d: _record("backup")})
+    for _ in range(2):
+        assert router.call("AAPL", date(2024, 6, 5)).source == "backup"
+    assert router.ranked() == ["backup", "broken"]  # error rate 1.0 > 0.5
+    router.call("AAPL", date(2024, 6, 5))
+    assert calls == ["broken", "broken"]
+    stats = router.stats()
+    assert stats["fallbacks"] == 2
+    assert stats["vendors"]["broken"]["error_rate"] == 1.0
+
+
+def test_unhealthy_vendor_is_reprobed_after_window():
+    clock = _Clock()
+    router = _router({"a": lambda t, d: _record("a"), "b": lambda t, d: _record("b")}, clock=clock, window_s=60)
+    for _ in range(2):
+        router._health["a"].record(0.01, False)
+        router._health["b"].record(0.5, True)
+    assert router.ranked() == ["b", "a"]
+    clock.now = 61
+    assert router.ranked() == ["a", "b"]
+
+
+def test_data_errors_fall_back_without_counting_and_single_error_reraises():
+    def unknown(ticker, end_date):
+        raise ValueError(f"Could not retrieve price data for ticker {ticker}")
+
+    router = _router({"a": unknown, "b": lambda t, d: _record("b")})
+    assert router.call("ZZZZ", date(2024, 6, 5)).source == "b"
+    assert router.stats()["vendors"]["a"]["samples"] == 0
+
+    solo = _router({"a": unknown})
+    with pytest.raises(ValueError, match="Could not retrieve price data"):
+        solo.call("ZZZZ", date(2024, 6, 5))
+
+    def down(ticker, end_date):
+        raise requests.exceptions.Timeout("slow")
+
+    both = _router({"a": unknown, "b": down})
+    with pytest.raises(requests.exceptions.RequestException, match="All vendors failed"):
+        both.call("ZZZZ", date(2024, 6, 5))
+
+
+def test_fmp_is_skipped_without_api_key(monkeypatch):
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+    assert list(get_price_router().vendors) == ["financialdatasets"]
+    monkeypatch.setenv("FMP_API_KEY", "key")
+    assert list(get_price_router().vendors) == ["financialdatasets", "fmp"]
+    monkeypatch.setenv("DATA_TOOLS_PRICE_VENDORS", "fmp")
+    reset_config_cache()
+    assert list(get_price_router().vendors) == ["fmp"]
+
+
+def test_module_lookup_uses_registered_vendors(monkeypatch):
+    monkeypatch.setenv("FMP_API_KEY", "key")
+
+    def fd_down(ticker, end_date):
+        raise requests.exceptions.ConnectionError("reset")
+
+    monkeypatch.setattr("src.data_tools.fd_api.get_price_record", fd_down)
+    monkeypatch.setattr("src.data_tools.fmp_api.get_price_record", lambda t, d: _record(fmp_api.SOURCE))
+    records, errors = routing.get_price_records(["aapl"], date(2024, 6, 5))
+    assert errors == {}
+    assert records["AAPL"].source == "financialmodelingprep.com"
+    assert routing_stats()["prices"]["vendors"]["fmp"]["served"] == 1
+
+
+def test_fmp_price_record_from_historical_bars(monkeypatch):
+    seen = {}
+
+    def fake_request(path, params=None):
+        seen["path"], seen["params"] = path, params
+        closes = [100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 110.0]
+        days = ["2024-05-28", "2024-05-29", "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04", "2024-06-05"]
+        # FMP returns newest first.
+        return {"symbol": "AAPL", "historical": [{"date": d, "close": c, "volume": 1000} for d, c in zip(days, closes)][::-1]}
+
+    monkeypatch.setattr(fmp_api, "_request_json", fake_request)
+    rec = fmp_api.get_price_record("aapl", date(2024, 6, 5))
+    assert seen["path"] == "historical-price-full/AAPL"
+    assert seen["params"]["to"] == "2024-06-05"
+    assert (rec.price, rec.date, rec.source) == (110.0, "2024-06-05", "financialmodelingprep.com")
+    assert rec.return_1d == pytest.approx(110 / 105)
+    assert rec.return_5d == pytest.approx(110 / 101)
+
+
+def test_fmp_price_record_tolerates_missing_latest_bar(monkeypatch):
+    seen = {}
+
+    def fake_request(path, params=None):
+        seen["params"] = params
+        days = ["2024-05-22", "2024-05-23", "2024-05-24", "2024-05-28", "2024-05-29",
+                "2024-05-30", "2024-05-31", "2024-06-03", "2024-06-04"]
+        rows = [{"date": d, "close": 100.0 + i, "volume": 0 if i == 6 else 1000} for i, d in enumerate(days)]
+        return {"symbol": "AAPL", "historical": rows[::-1]}
+
+    monkeypatch.setattr(fmp_api, "_request_json", fake_request)
+    rec = fmp_api.get_price_record("AAPL", date(2024, 6, 5))
+    assert seen["params"]["from"] == "2024-05-22"
+    assert (rec.price, rec.date) == (108.0, "2024-06-04")
+    assert rec.return_5d == pytest.approx(108.0 / 102.0)
@@ -0,0 +1,124 @@
+import pytest
+import requests
+
+from src.data_tools import sec_cik
+from src.data_tools.config import reset_config_cache
+
+SEC_DATA = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 1652044, "ticker": "GOOGL", "title": "Alphabet Inc."},
+    "2": {"cik_str": 1652044, "ticker": "GOOG", "title": "Alphabet Inc."},
+}
+
+
+class _Resp:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+class _FakeSec:
+    def __init__(self):
+        self.calls = []
+        self.respond = lambda headers: _Resp(200, SEC_DATA, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append(dict(headers or {}))
+        return self.respond(headers or {})
+
+
+@pytest.fixture
+def sec(monkeypatch):
+    fake = _FakeSec()
+    monkeypatch.setattr(sec_cik, "get_session_manager", lambda vendor: fake)
+    sec_cik.reset_cik_index()
+    yield fake
+    sec_cik.reset_cik_index()
+
+
+def test_two_way_index_and_lookups(sec):
+    assert sec_cik.get_cik_for_ticker("aapl") == "0000320193"
+    assert sec_cik.get_tickers_for_cik(1652044) == ("GOOGL", "GOOG")
+    assert sec_cik.get_tickers_for_cik("0001652044") == ("GOOGL", "GOOG")
+    assert sec_cik.get_tickers_for_cik("999") == ()
+    assert sec_cik.get_cik_for_ticker("123") is None
+    assert len(sec.calls) == 1
+
+
+def test_new_process_loads_from_disk_without_network(sec):
+    sec_cik.fetch_cik_map()
+    sec_cik.reset_cik_index()  # simulate a fresh process
+    assert sec_cik.get_cik_for_ticker("GOOG") == "0001652044"
+    assert len(sec.calls) == 1
+
+
+def test_stale_index_revalidates_with_conditional_get(sec, monkeypatch):
+    sec_cik.fetch_cik_map()
+    sec_cik.reset_cik_index()
+    monkeypatch.setenv("DATA_TOOLS_SEC_CIK_REVALIDATE_S", "0")
+    reset_config_cache()
+    sec.respond = lambda headers: _Resp(304)
+    assert sec_cik.get_cik_for_ticker("AAPL") == "0000320193"
+    assert sec.calls[-1]["If-None-Match"] == '"v1"'
+    assert sec.calls[-1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    changed = {"0": {"cik_str": 789019, "ticker": "MSFT", "title": "Microsoft"}}
+    sec.respond = lambda headers: _Resp(200, changed, {"ETag": '"v2"'})
+    assert sec_cik.get_cik_for_ticker("MSFT") == "0000789019"
+    sec_cik.reset_cik_index()
+    monkeypatch.setenv("DATA_TOOLS_SEC_CIK_REVALIDATE_S", "86400")
+    reset_config_cache()
+    assert sec_cik.load_cik_index().etag == '"v2"'
+
+
+def test_failed_revalidation_serves_cached_index(sec, monkeypatch):
+    sec_cik.fetch_cik_map()
+    monkeypatch.setenv("DATA_TOOLS_SEC_CIK_REVALIDATE_S", "0")
+    reset_config_cache()
+
+    def down(headers):
+        raise requests.exceptions.ConnectionError("reset")
+
+    sec.respond = down
+    assert sec_cik.get_cik_for_ticker("AAPL") == "0000320193"
+    calls = len(sec.calls)
+    # The failed revalidation backs off instead of retrying on every lookup.
+    assert sec_cik.get_cik_for_ticker("GOOG") == "0001652044"
+    assert len(sec.calls) == calls
+
+
+def test_lookups_do_not_wait_on_a_revalidation_in_progress(sec, monkeypatch):
+    import threading
+
+    sec_cik.fetch_cik_map()
+    monkeypatch.setenv("DATA_TOOLS_SEC_CIK_REVALIDATE_S", "0")
+    reset_config_cache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow(headers):
+        started.set()
+        release.wait(5)
+        return _Resp(304)
+
+    sec.respond = slow
+    worker = threading.Thread(target=sec_cik.fetch_cik_map)
+    worker.start()
+    assert started.wait(5)
+    assert sec_cik.get_cik_for_ticker("AAPL") == "0000320193"
+    assert len(sec.calls) == 2
+    release.set()
+    worker.join()
+
+
+def test_forbidden_without_cache_raises(sec):
+    sec.respond = lambda headers: _Resp(403)
+    with pytest.raises(requests.HTTPError, match="SEC_USER_AGENT"):
+        sec_cik.fetch_cik_map()
@@ -0,0 +1,87 @@
+"""Tests for singleflight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+from src.data_tools.singleflight import SingleFlight, request_key
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    group = SingleFlight("test")
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(2)
+        return {"price": 1.0}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(group.do(("u", ()), fetch))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    while group.stats()["coalesced"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+    stats = group.stats()
+    assert stats["executed"] == 1 and stats["coalesced"] == 4 and stats["in_flight"] == 0
+
+
+def test_followers_receive_leader_exception_and_next_call_runs_fresh():
+    group = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(2)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            group.do("k", failing)
+        except ValueError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(2)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while group.stats()["coalesced"] < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+    assert len(errors) == 2
+    assert group.do("k", lambda: "fresh") == "fresh"
+
+
+def test_async_calls_coalesce_on_one_loop():
+    group = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def scenario():
+        return await asyncio.gather(*(group.ado(request_key("https://x/prices", {"ticker": "AAPL"}), fetch) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["ok", "ok", "ok"]
+    assert len(calls) == 1
+    assert group.stats()["coalesced_by_endpoint"] == {"/prices": 2}
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("u", {"a": 1, "b": 2}) == request_key("u", {"b": 2, "a": 1})
+    assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
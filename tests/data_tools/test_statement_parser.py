@@ -0,0 +1,74 @@
+import pytest
+
+from src.data_tools.statement_parser import (
+    INCOME_STATEMENT_FIELDS,
+    get_resolver,
+    parse_balance_sheets,
+    parse_cash_flow_statements,
+    parse_income_statements,
+)
+
+
+def test_resolver_prefers_alias_order_and_exact_case():
+    resolver = get_resolver(INCOME_STATEMENT_FIELDS, ("Revenue", "totalRevenue", "NETINCOME", "eps"))
+    values = resolver.resolve({"Revenue": 1.0, "totalRevenue": 2.0, "NETINCOME": 3.0, "eps": 4.0})
+    assert values["total_revenue"] == 2.0
+    assert values["net_income"] == 3.0
+    assert values["diluted_eps"] == 4.0
+    assert get_resolver(INCOME_STATEMENT_FIELDS, ("Revenue", "totalRevenue", "NETINCOME", "eps")) is resolver
+
+
+def test_resolver_falls_through_none_values():
+    resolver = get_resolver(INCOME_STATEMENT_FIELDS, ("totalRevenue", "revenue"))
+    assert resolver.resolve({"totalRevenue": None, "revenue": 5.0})["total_revenue"] == 5.0
+
+
+def test_parse_income_statements_mixed_shapes():
+    statements = [
+        {"fiscalYear": 2024, "revenue": 10.0, "netIncome": 2.0, "period": "quarterly"},
+        {"date": "2023-12-31", "Revenue": 9.0, "net_income": 1.5},
+        "not-a-dict",
+    ]
+    parsed = parse_income_statements(statements, "AAPL", 4, "annual")
+    assert [(s.fiscal_year, s.total_revenue, s.net_income, s.period) for s in parsed] == [
+        (2024, 10.0, 2.0, "quarterly"),
+        (2023, 9.0, 1.5, "annual"),
+    ]
+    with pytest.raises(ValueError):
+        parse_income_statements(["x"], "AAPL", 4, "annual")
+
+
+def test_parse_balance_sheets_derives_ratios():
+    (sheet,) = parse_balance_sheets(
+        [{
+            "report_period": "2024-09-28",
+            "current_assets": 150.0,
+            "current_liabilities": 100.0,
+            "current_debt": 10.0,
+            "non_current_debt": 90.0,
+            "shareholders_equity": 50.0,
+        }],
+        "AAPL",
+        4,
+        "annual",
+    )
+    assert sheet.fiscal_year == 2024
+    assert sheet.total_debt == 100.0
+    assert sheet.current_ratio == 1.5
+    assert sheet.debt_to_equity == 2.0
+    assert sheet.working_capital == 50.0
+
+
+def test_parse_cash_flow_statements_free_cash_flow():
+    flows = parse_cash_flow_statements(
+        [
+            {"report_period": "2024-09-28", "net_cash_flow_from_operations": 100.0, "capital_expenditure": -30.0},
+            {"report_period": "2023-09-30", "operatingCashFlow": 80.0, "free_cash_flow": 55.0},
+        ],
+        "AAPL",
+        1,
+        "annual",
+    )
+    assert len(flows) == 1
+    assert flows[0].free_cash_flow == 70.0
+    assert flows[0].fiscal_year == 2024
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.data_tools.ttl_cache import TTLCache, get_ttl_cache, ttl_cache_stats
+
+
+def test_fresh_hit_skips_loader():
+    cache = TTLCache("t", ttl_s=60, max_stale_s=60, max_size=10)
+    calls = []
+    assert cache.get_or_load("a", lambda: calls.append(1) or "v1") == "v1"
+    assert cache.get_or_load("a", lambda: calls.append(1) or "v2") == "v1"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_stale_served_then_refreshed_in_background(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.data_tools.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("t", ttl_s=10, max_stale_s=100, max_size=10)
+    cache.get_or_load("a", lambda: "old")
+    now[0] += 20
+
+    refreshed = threading.Event()
+
+    def loader():
+        refreshed.set()
+        return "new"
+
+    assert cache.get_or_load("a", loader) == "old"
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.stats()["refreshes"]:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_load("a", lambda: "unused") == "new"
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_failed_refresh_keeps_stale_value(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.data_tools.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("t", ttl_s=10, max_stale_s=100, max_size=10)
+    cache.get_or_load("a", lambda: "old")
+    now[0] += 20
+
+    def boom():
+        raise ValueError("vendor down")
+
+    assert cache.get_or_load("a", boom) == "old"
+    for _ in range(100):
+        if cache.stats()["refresh_errors"]:
+            break
+        time.sleep(0.01)
+    assert cache.stats()["refresh_errors"] == 1
+    assert cache.get_or_load("a", lambda: "unused") == "old"
+
+
+def test_too_stale_loads_synchronously_and_errors_not_cached(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.data_tools.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("t", ttl_s=10, max_stale_s=10, max_size=10)
+    cache.get_or_load("a", lambda: "old")
+    now[0] += 30
+    assert cache.get_or_load("a", lambda: "new") == "new"
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("b", lambda: (_ for _ in ()).throw(ValueError("x")))
+    assert cache.get_or_load("b", lambda: "ok") == "ok"
+
+
+def test_lru_eviction_and_disabled():
+    cache = TTLCache("t", ttl_s=60, max_stale_s=0, max_size=2)
+    for key in ("a", "b", "c"):
+        cache.get_or_load(key, lambda k=key: k)
+    assert cache.stats()["size"] == 2 and cache.stats()["evictions"] == 1
+
+    off = TTLCache("off", ttl_s=0, max_stale_s=0, max_size=2)
+    calls = []
+    off.get_or_load("a", lambda: calls.append(1))
+    off.get_or_load("a", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_async_stale_refresh(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.data_tools.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("t", ttl_s=10, max_stale_s=100, max_size=10)
+
+    async def load(value):
+        return value
+
+    async def scenario():
+        assert await cache.aget_or_load("a", lambda: load("old")) == "old"
+        now[0] += 20
+        assert await cache.aget_or_load("a", lambda: load("new")) == "old"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return await cache.aget_or_load("a", lambda: load("unused"))
+
+    assert asyncio.run(scenario()) == "new"
+
+
+def test_async_refresh_cancelled_with_its_loop_can_be_retried(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.data_tools.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache("t", ttl_s=10, max_stale_s=100, max_size=10)
+
+    async def load(value, delay=0.0):
+        await asyncio.sleep(delay)
+        return value
+
+    async def lookup(value, delay=0.0):
+        return await cache.aget_or_load("a", lambda: load(value, delay))
+
+    assert asyncio.run(lookup("old")) == "old"
+    now[0] += 20
+    # asyncio.run returns and shuts its loop down while the refresh is still loading, cancelling it.
+    assert asyncio.run(lookup("lost", delay=5)) == "old"
+
+    async def refresh_then_read():
+        assert await lookup("new") == "old"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return await lookup("unused")
+
+    assert asyncio.run(refresh_then_read()) == "new"
+
+
+def test_registry_rebuilds_on_config_change():
+    first = get_ttl_cache("facts", 10, 10, 5)
+    assert get_ttl_cache("facts", 10, 10, 5) is first
+    assert get_ttl_cache("facts", 20, 10, 5) is not first
+    assert "facts" in ttl_cache_stats()
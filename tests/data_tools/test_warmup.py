@@ -0,0 +1,72 @@
+from datetime import date, datetime, time
+
+from src.data_tools import fd_api, warmup
+from src.data_tools.records import PriceRecord
+
+
+def _stub_fetchers(monkeypatch, calls):
+    def price(symbol, as_of):
+        calls.append(("prices", symbol, as_of))
+        if symbol == "BAD":
+            raise ValueError("no bars")
+        return PriceRecord(symbol, 100.0, 1.0, 1.0, as_of.isoformat())
+
+    def statements(name):
+        def fetch(symbol, years, period):
+            calls.append((name, symbol, years, period))
+            return []
+
+        return fetch
+
+    monkeypatch.setattr(fd_api, "get_price_record", price)
+    monkeypatch.setattr(fd_api, "get_company_facts", lambda symbol: calls.append(("facts", symbol)))
+    monkeypatch.setattr(fd_api, "get_income_statements", statements("income-statements"))
+    monkeypatch.setattr(fd_api, "get_balance_sheets", statements("balance-sheets"))
+    monkeypatch.setattr(fd_api, "get_cash_flow_statements", statements("cash-flow-statements"))
+
+
+def test_warm_universe_reports_coverage_and_failures(monkeypatch):
+    calls = []
+    _stub_fetchers(monkeypatch, calls)
+
+    report = warmup.warm_universe(["aapl", "AAPL", "BAD"], as_of=date(2024, 6, 5), years=2, max_workers=1)
+
+    assert report["symbols"] == 2
+    assert report["as_of"] == "2024-06-05"
+    prices = report["datasets"]["prices"]
+    assert (prices["ok"], prices["failed"], prices["coverage"]) == (1, 1, 0.5)
+    assert report["datasets"]["income-statements"]["coverage"] == 1.0
+    assert report["failures"] == {"prices": {"BAD": "no bars"}}
+    assert ("balance-sheets", "AAPL", 2, "annual") in calls
+    assert report["elapsed_ms"] >= 0
+
+
+def test_warm_universe_defaults_to_refmaster_and_dataset_subset(monkeypatch):
+    calls = []
+    _stub_fetchers(monkeypatch, calls)
+    monkeypatch.setattr(warmup, "universe_symbols", lambda: ["MSFT", "NVDA"])
+
+    report = warmup.warm_universe(datasets=["facts"], max_workers=1)
+
+    assert list(report["datasets"]) == ["facts"]
+    assert sorted(c[1] for c in calls) == ["MSFT", "NVDA"]
+    assert any("in memory" in w for w in report["warnings"])
+
+
+def test_next_run_skips_past_times_and_non_sessions():
+    at = time(7, 30)
+    assert warmup.next_run(datetime(2024, 6, 5, 6, 0), at) == datetime(2024, 6, 5, 7, 30)
+    # Friday after the run time -> Monday; July 4th 2024 (Thursday) is skipped.
+    assert warmup.next_run(datetime(2024, 6, 7, 8, 0), at) == datetime(2024, 6, 10, 7, 30)
+    assert warmup.next_run(datetime(2024, 7, 3, 9, 0), at) == datetime(2024, 7, 5, 7, 30)
+
+
+def test_cli_exit_code_reflects_failures(monkeypatch, tmp_path, capsys):
+    calls = []
+    _stub_fetchers(monkeypatch, calls)
+    out = tmp_path / "report.json"
+
+    assert warmup.main(["--symbols", "AAPL", "--as-of", "2024-06-05", "--datasets", "prices", "--output", str(out)]) == 0
+    assert out.exists()
+    assert warmup.main(["--symbols", "BAD", "--as-of", "2024-06-05", "--datasets", "prices"]) == 1
+    assert '"coverage": 0.0' in capsys.readouterr().out
@@ -19,7 +19,7 @@ class DummyPricing:
 def test_run_scenario_minimal(monkeypatch):
     # Stub ticker agent and market snapshot to avoid external calls
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "generic", "summary": "ok", "metrics": {}, "question": q})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -59,7 +59,7 @@ def test_report_structure_with_failed_step(monkeypatch):
             raise RuntimeError("pricing boom")
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "generic", "summary": "ok", "metrics": {}, "question": q})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
         oms_agent=DummyOMS(),
@@ -111,7 +111,7 @@ def test_retry_logic_success_after_failure(monkeypatch):
 
     flake = FlakeyPricing()
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -159,7 +159,7 @@ def test_summary_aggregation_accuracy(monkeypatch):
             return {"enriched_marks": enriched, "summary": {}}
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -198,7 +198,7 @@ def test_summary_aggregation_accuracy(monkeypatch):
 def test_trace_metadata_populated(monkeypatch):
     """Test that trace contains all steps with durations."""
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -239,7 +239,7 @@ def test_market_context_sector_aggregation(monkeypatch):
         sector_map = {"AAPL": "TECH", "MSFT": "TECH", "JPM": "FINANCE"}
         return_map = {"AAPL": 0.05, "MSFT": 0.03, "JPM": -0.02}
         return type("Snap", (), {
-            "model_dump": lambda self: {
+            "to_dict": lambda self: {
                 "ticker": tkr,
                 "return_1d": return_map.get(tkr, 0.0),
                 "return_5d": 1.0,
@@ -249,7 +249,7 @@ def test_market_context_sector_aggregation(monkeypatch):
         })()
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", mock_snapshot)
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", mock_snapshot)
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -287,7 +287,7 @@ def test_generate_report_file_output(monkeypatch, tmp_path):
     import json
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -328,7 +328,7 @@ def test_parallel_ticker_execution(monkeypatch):
         return {"intent": "ok", "summary": "ok", "metrics": {}, "question": q}
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", slow_ticker)
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     # Test with parallel=True
     orch_parallel = DeskAgentOrchestrator(
@@ -374,7 +374,7 @@ def test_retry_logic_abort_after_max(monkeypatch):
 
     failing_pricing = AlwaysFailingPricing()
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -421,7 +421,7 @@ def test_narrative_generation(monkeypatch):
             return {"enriched_marks": enriched, "summary": {}}
 
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
@@ -502,7 +502,7 @@ def test_scenario_validation_with_missing_fields():
 def test_execution_metadata_completeness(monkeypatch):
     """Test that execution_metadata contains all required fields."""
     monkeypatch.setattr("src.desk_agent.orchestrator.ticker_agent.run", lambda q: {"intent": "ok", "summary": "ok", "metrics": {}})
-    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_snapshot", lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
+    monkeypatch.setattr("src.desk_agent.orchestrator.get_equity_record", lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})())
 
     orch = DeskAgentOrchestrator(
         normalizer=DummyNormalizer(),
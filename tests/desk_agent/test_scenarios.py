@@ -37,8 +37,8 @@ class PricingStub:
 
 def test_validate_all_scenarios(monkeypatch):
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
     orch = DeskAgentOrchestrator(
         normalizer=NormalizerStub(),
@@ -52,8 +52,8 @@ def test_validate_all_scenarios(monkeypatch):
 
 def test_run_all_scenarios(monkeypatch):
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
     orch = DeskAgentOrchestrator(
         normalizer=NormalizerStub(),
@@ -74,8 +74,8 @@ def test_run_all_scenarios(monkeypatch):
 def test_smoke_all_scenarios_reliability_summary(monkeypatch):
     """Test that smoke test returns comprehensive reliability summary."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
     orch = DeskAgentOrchestrator(
         normalizer=NormalizerStub(),
@@ -103,8 +103,8 @@ def test_smoke_all_scenarios_reliability_summary(monkeypatch):
 def test_clean_day_scenario_runs_successfully(monkeypatch):
     """Test that clean_day scenario runs and completes."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
     orch = DeskAgentOrchestrator(
         normalizer=NormalizerStub(),
@@ -124,8 +124,8 @@ def test_clean_day_scenario_runs_successfully(monkeypatch):
 def test_bad_mark_scenario_detects_pricing_issues(monkeypatch):
     """Test that bad_mark scenario identifies pricing deviations."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     class RealisticPricing:
@@ -171,8 +171,8 @@ def test_bad_mark_scenario_detects_pricing_issues(monkeypatch):
 def test_mis_booked_trade_scenario_detects_trade_errors(monkeypatch):
     """Test that mis_booked_trade scenario identifies OMS issues."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     class RealisticOMS:
@@ -213,8 +213,8 @@ def test_mis_booked_trade_scenario_detects_trade_errors(monkeypatch):
 def test_wrong_ticker_mapping_scenario_detects_normalization_issues(monkeypatch):
     """Test that wrong_ticker_mapping scenario identifies refmaster issues."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     class AmbiguousNormalizer:
@@ -252,8 +252,8 @@ def test_wrong_ticker_mapping_scenario_detects_normalization_issues(monkeypatch)
 def test_high_vol_day_scenario_market_context(monkeypatch):
     """Test that high_vol_day scenario captures market volatility."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {
             "ticker": tkr,
             "return_1d": 0.05 if tkr in ["AAPL", "MSFT"] else -0.03,
             "return_5d": 0.10,
@@ -296,8 +296,8 @@ def test_high_vol_day_scenario_market_context(monkeypatch):
 def test_validate_all_scenarios_with_invalid_scenario(tmp_path, monkeypatch):
     """Test that validate_all_scenarios catches invalid scenario files."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     # Create a temporary scenarios directory with an invalid scenario
@@ -354,8 +354,8 @@ def test_validate_all_scenarios_with_invalid_scenario(tmp_path, monkeypatch):
 def test_scenario_with_no_trades_or_marks(monkeypatch):
     """Test that scenarios with no trades or marks still complete successfully."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     orch = DeskAgentOrchestrator(
@@ -386,8 +386,8 @@ def test_scenario_with_no_trades_or_marks(monkeypatch):
 def test_scenario_overall_status_logic(monkeypatch):
     """Test that overall_status is correctly determined based on issues."""
     monkeypatch.setattr(
-        "src.desk_agent.orchestrator.get_equity_snapshot",
-        lambda tkr: type("Snap", (), {"model_dump": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
+        "src.desk_agent.orchestrator.get_equity_record",
+        lambda tkr: type("Snap", (), {"to_dict": lambda self: {"ticker": tkr, "return_1d": 1.0, "return_5d": 1.0, "sector": "TECH", "market_cap": 1.0}})(),
     )
 
     class StatusTestOMS:
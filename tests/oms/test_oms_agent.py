@@ -1,4 +1,5 @@
 import json
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -30,7 +31,7 @@ def equity(symbol: str) -> RefMasterEquity:
 
 def test_status_rules_collect_all(monkeypatch):
     agent = OMSAgent(normalizer=NormalizerStub(lambda t: []))
-    monkeypatch.setattr("src.oms.oms_agent.get_price_snapshot", lambda t, d: DummySnap(120))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: DummySnap(120))
     res = agent.run({"ticker": "BAD", "quantity": 100, "price": 200, "currency": "USD", "counterparty": "UNKNOWN", "trade_dt": "2024-06-05", "settle_dt": "2024-06-04"})
     error_types = {i["type"] for i in res["issues"] if i["severity"] == "ERROR"}
     warning_types = {i["type"] for i in res["issues"] if i["severity"] == "WARNING"}
@@ -42,7 +43,7 @@ def test_status_rules_collect_all(monkeypatch):
 
 def test_schema_validation_surfaces(monkeypatch):
     agent = OMSAgent()
-    monkeypatch.setattr("src.oms.oms_agent.get_price_snapshot", lambda t, d: DummySnap(100))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: DummySnap(100))
     res = agent.run({"ticker": "AAPL", "quantity": -1, "price": 0, "currency": "US", "counterparty": "MS", "trade_dt": "bad-date", "settle_dt": "2024-06-07"})
     assert res["status"] == "ERROR"
     assert any(i["type"] == "schema_validation" for i in res["issues"])
@@ -50,7 +51,7 @@ def test_schema_validation_surfaces(monkeypatch):
 
 def test_data_tools_trade_compatibility(monkeypatch):
     agent = OMSAgent(normalizer=NormalizerStub(lambda t: [NormalizationResult(equity=equity(t), confidence=0.99, reasons=[])]))
-    monkeypatch.setattr("src.oms.oms_agent.get_price_snapshot", lambda t, d: DummySnap(190))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: DummySnap(190))
     trade = DataTrade(ticker="AAPL", quantity=100, price=190, currency="USD", counterparty="MS", trade_dt="2024-06-05", settle_dt="2024-06-07")
     res = agent.run(trade)
     assert res["status"] == "OK"
@@ -101,12 +102,12 @@ def test_scenarios(monkeypatch, scenario_file):
         market_price = scenario.get("market_price", trade.get("price", 100.0))
         if scenario.get("market_data_unavailable"):
             monkeypatch.setattr(
-                "src.oms.oms_agent.get_price_snapshot",
+                "src.oms.oms_agent.get_price_record",
                 lambda t, d: (_ for _ in ()).throw(RuntimeError("API down")),
             )
         else:
             monkeypatch.setattr(
-                "src.oms.oms_agent.get_price_snapshot",
+                "src.oms.oms_agent.get_price_record",
                 lambda t, d, p=market_price: DummySnap(p),
             )
         agent = OMSAgent(
@@ -126,3 +127,74 @@ def test_scenarios(monkeypatch, scenario_file):
                 if i["type"] == expected["type"] and i["severity"] == expected["severity"]
             ]
             assert matches, f"{scenario['name']} missing expected issue {expected}"
+
+
+def test_run_batch_prefetches_each_price_once(monkeypatch):
+    calls = []
+
+    def fake_snapshot(ticker, trade_dt):
+        calls.append((ticker, trade_dt))
+        return DummySnap(190)
+
+    agent = OMSAgent(normalizer=NormalizerStub(lambda t: [NormalizationResult(equity=equity(t), confidence=0.99, reasons=[])]))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", fake_snapshot)
+    trade = {"ticker": "AAPL", "quantity": 100, "price": 190, "currency": "USD", "counterparty": "MS", "trade_dt": "2024-06-05", "settle_dt": "2024-06-07"}
+    res = agent.run_batch([trade, dict(trade), {**trade, "ticker": "MSFT"}])
+    assert res["summary"]["ok"] == 3
+    assert sorted(calls) == [("AAPL", date(2024, 6, 5)), ("MSFT", date(2024, 6, 5))]
+
+
+def test_concurrent_batches_keep_their_own_prefetched_prices(monkeypatch):
+    import threading
+
+    calls = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_snapshot(ticker, trade_dt):
+        calls.append(ticker)
+        barrier.wait()  # both batches finish prefetching before either validates
+        return DummySnap(190 if ticker == "AAPL" else 400)
+
+    agent = OMSAgent(normalizer=NormalizerStub(lambda t: [NormalizationResult(equity=equity(t), confidence=0.99, reasons=[])]))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", fake_snapshot)
+    trade = {"ticker": "AAPL", "quantity": 100, "price": 190, "currency": "USD", "counterparty": "MS", "trade_dt": "2024-06-05", "settle_dt": "2024-06-07"}
+    results = {}
+
+    def run(ticker, price):
+        results[ticker] = agent.run_batch([{**trade, "ticker": ticker, "price": price}])
+
+    threads = [threading.Thread(target=run, args=args) for args in (("AAPL", 190), ("MSFT", 400))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(calls) == ["AAPL", "MSFT"]
+    assert results["AAPL"]["summary"]["ok"] == 1 and results["MSFT"]["summary"]["ok"] == 1
+
+
+def test_settlement_counts_exchange_sessions(monkeypatch):
+    agent = OMSAgent(normalizer=NormalizerStub(lambda t: [NormalizationResult(equity=equity(t), confidence=0.99, reasons=[])]))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: DummySnap(190))
+    base = {"ticker": "AAPL", "quantity": 100, "price": 190, "currency": "USD", "counterparty": "MS", "trade_dt": "2024-03-27"}
+
+    # T+2 over Good Friday 2024-03-29 settles Monday 2024-04-01.
+    res = agent.run({**base, "settle_dt": "2024-04-01"})
+    assert res["status"] == "OK"
+
+    res = agent.run({**base, "settle_dt": "2024-03-29"})
+    messages = {i["message"] for i in res["issues"]}
+    assert res["status"] == "ERROR"
+    assert "Settlement on exchange holiday" in messages
+
+
+def test_settlement_outside_calendar_range_falls_back_to_calendar_days(monkeypatch):
+    agent = OMSAgent(normalizer=NormalizerStub(lambda t: [NormalizationResult(equity=equity(t), confidence=0.99, reasons=[])]))
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: DummySnap(190))
+    base = {"ticker": "AAPL", "quantity": 100, "price": 190, "currency": "USD", "counterparty": "MS"}
+
+    res = agent.run({**base, "trade_dt": "2060-12-29", "settle_dt": "2061-01-03"})
+    assert res["status"] == "WARNING"
+    assert [i["message"] for i in res["issues"]] == ["Non-standard settlement interval T+5 (expected ~T+2)"]
+
+    batch = agent.run_batch([{**base, "trade_dt": "2024-06-05", "settle_dt": "2205-06-07"}, {**base, "trade_dt": "2024-06-05", "settle_dt": "2024-06-07"}])
+    assert [r["status"] for r in batch["results"]] == ["WARNING", "OK"]
@@ -36,3 +36,48 @@ def test_enrich_marks_with_price(monkeypatch):
     enriched = norm.enrich_marks(marks)
     assert enriched[0].classification == "OUT_OF_TOLERANCE"
     assert enriched[0].market_price == 100.0
+
+
+def test_fetch_market_price_maps_rate_limit_error(monkeypatch):
+    import requests
+
+    from src.data_tools.rate_limit import RateLimitError
+
+    def throttled(ticker, dt):
+        try:
+            raise RateLimitError("financialdatasets rate limit exceeded (429)", vendor="financialdatasets")
+        except RateLimitError as exc:
+            raise requests.exceptions.RequestException(f"Failed to fetch price snapshot: {exc}") from exc
+
+    monkeypatch.setattr("src.pricing.normalizer.get_price_record", throttled)
+    norm = MarketNormalizer(tolerances={"retry_count": 0})
+    assert norm.fetch_market_price("AAPL", "2024-06-05") == {"error": "rate_limit_exceeded"}
+
+
+def test_fetch_market_price_does_not_retry_open_circuit(monkeypatch):
+    from src.data_tools.resilience import CircuitOpenError
+
+    calls = []
+
+    def open_circuit(ticker, dt):
+        calls.append(ticker)
+        raise CircuitOpenError("financialdatasets circuit open for /prices", vendor="financialdatasets", endpoint="/prices")
+
+    monkeypatch.setattr("src.pricing.normalizer.get_price_record", open_circuit)
+    norm = MarketNormalizer(tolerances={"retry_count": 3, "retry_backoff_ms": 1000})
+    assert norm.fetch_market_price("AAPL", "2024-06-05") == {"error": "vendor_unavailable"}
+    assert calls == ["AAPL"]
+
+
+def test_enrich_marks_records_routed_vendor(monkeypatch):
+    from src.data_tools.records import PriceRecord
+
+    monkeypatch.setattr(
+        "src.pricing.normalizer.get_price_record",
+        lambda t, d: PriceRecord(t, 100.0, 1.0, 1.0, d.isoformat(), "financialmodelingprep.com"),
+    )
+    norm = MarketNormalizer(tolerances={"ok_threshold": 0.02, "review_threshold": 0.05})
+    marks = [{"ticker": "AAPL", "internal_mark": 100.5, "as_of_date": "2025-12-18"}]
+    enriched = norm.enrich_marks(marks)
+    assert enriched[0].market_price == 100.0
+    assert enriched[0].market_data_source == "financialmodelingprep.com"
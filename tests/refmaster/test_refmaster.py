@@ -104,3 +104,67 @@ def test_normalization_results_include_reasons_and_confidence(query, thresholds)
     top = results[0]
     assert isinstance(top.confidence, float)
     assert top.reasons, f"missing reasons for {query}"
+
+
+def _indexed_equities():
+    return _sample_equities() + [
+        RefMasterEquity(symbol="MSFT", isin="US5949181045", cusip="594918104", cik="0000789019", currency="USD", exchange="NASDAQ", pricing_source="unit"),
+        # Shares a CIK with AAPL's 9-digit CUSIP read as a CIK.
+        RefMasterEquity(symbol="ZZZ", isin="", cusip="", cik="0037833100", currency="USD", exchange="NYSE", pricing_source="unit"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("US0378331005", [("AAPL", 1.0, ["isin_exact"])]),
+        ("us5949181045", [("MSFT", 1.0, ["isin_exact"])]),
+        ("037833100", [("ZZZ", 0.9, ["cik_exact"]), ("AAPL", 0.9, ["cusip_exact"])]),  # shorter symbol wins ties
+        ("789019", [("MSFT", 0.9, ["cik_exact"])]),
+        ("msft", [("MSFT", 0.9, ["symbol_exact", "symbol_in_text"])]),
+    ],
+)
+def test_exact_identifiers_use_indexes(monkeypatch, query, expected):
+    agent = NormalizerAgent(equities=_indexed_equities())
+    # The linear path produces the same top matches.
+    linear = [r for r in NormalizerAgent(equities=_indexed_equities()).normalize(query) if r.confidence >= 0.9]
+    monkeypatch.setattr(agent, "_score", lambda *args: pytest.fail("scoring loop used for an exact identifier"))
+    results = agent.normalize(query)
+    assert [(r.equity.symbol, r.confidence, r.reasons) for r in results] == expected
+    assert [(r.equity.symbol, r.reasons) for r in linear] == [(s, reasons) for s, _, reasons in expected]
+    assert not any(r.ambiguous for r in results)
+
+
+def test_unindexed_inputs_fall_back_to_scoring():
+    agent = NormalizerAgent(equities=_indexed_equities())
+    # Unknown identifier and free text both go through the scoring loop.
+    assert agent._exact_matches(agent._extract_identifiers("US0000000099"), "US0000000099") is None
+    assert agent._exact_matches(agent._extract_identifiers("MSFT US"), "MSFT US") is None
+    assert agent.normalize("MSFT NASDAQ")[0].reasons[:2] == ["symbol_exact", "exchange_match"]
+
+
+def test_default_agent_builds_indexes_once_per_universe(monkeypatch):
+    from src.refmaster import normalizer_agent
+
+    universe = _indexed_equities()
+    monkeypatch.setattr(normalizer_agent, "load_equities", lambda: universe)
+    agent = normalizer_agent.get_default_agent()
+    monkeypatch.setattr(agent, "reindex", lambda: pytest.fail("indexes rebuilt for the same universe"))
+    assert normalizer_agent.get_default_agent() is agent
+    assert resolve_ticker(" msft ").symbol == "MSFT"
+    assert resolve_ticker("missing") is None
+    assert normalize("US5949181045")[0].equity.symbol == "MSFT"
+
+    reloaded = _indexed_equities()
+    monkeypatch.setattr(normalizer_agent, "load_equities", lambda: reloaded)
+    assert normalizer_agent.get_default_agent() is not agent
+
+
+def test_lookup_symbol_and_reindex():
+    agent = NormalizerAgent(equities=_indexed_equities())
+    assert agent.lookup_symbol(" msft ").symbol == "MSFT"
+    assert agent.lookup_symbol("") is None
+    agent.equities.append(RefMasterEquity(symbol="NEW", isin="", cusip="", currency="USD", exchange="NYSE", pricing_source="unit"))
+    assert agent.lookup_symbol("NEW") is None
+    agent.reindex()
+    assert agent.lookup_symbol("new").symbol == "NEW"
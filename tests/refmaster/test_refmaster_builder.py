@@ -0,0 +1,114 @@
+import json
+import threading
+
+import pytest
+
+from data import refmaster_builder as builder
+from src.data_tools import fmp_api
+from src.data_tools.schemas import Equity
+from src.data_tools.sec_cik import CikIndex
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    for var in ("FMP_API_KEY", "LLM_MODEL", "OPENAI_MODEL", "LLM_API_KEY", "OPENAI_API_KEY"):
+        monkeypatch.delenv(var, raising=False)
+    ciks = {"AAPL": "0000320193", "MSFT": "0000789019", "NVDA": "0001045810"}
+    monkeypatch.setattr(builder, "load_cik_index", lambda: CikIndex(ciks, {}))
+    return ciks
+
+
+def _read(path):
+    return {item["symbol"]: item for item in json.loads(path.read_text(encoding="utf-8"))["equities"]}
+
+
+def test_build_then_incremental_diff(tmp_path, _offline):
+    out = tmp_path / "refmaster_data.json"
+    report = builder.build_universe(["aapl", "MSFT", "AAPL"], output_path=out)
+    assert report.added == ["AAPL", "MSFT"] and report.written
+    records = _read(out)
+    assert records["AAPL"]["cik"] == "0000320193"
+    assert records["AAPL"]["isin"] == builder._generate_isin_from_cusip(records["AAPL"]["cusip"])
+    assert list(tmp_path.iterdir()) == [out]  # no temp files left behind
+
+    # Same universe: nothing rebuilt, file untouched.
+    out.write_text(out.read_text(encoding="utf-8"), encoding="utf-8")
+    before = out.stat().st_mtime_ns
+    report = builder.build_universe(["AAPL", "MSFT"], output_path=out)
+    assert report.unchanged == ["AAPL", "MSFT"] and not report.written
+    assert out.stat().st_mtime_ns == before
+
+    # New symbol, dropped symbol and a CIK change in the SEC index.
+    _offline["AAPL"] = "0000000001"
+    report = builder.build_universe(["AAPL", "NVDA"], output_path=out)
+    assert (report.added, report.updated, report.removed) == (["NVDA"], ["AAPL"], ["MSFT"])
+    records = _read(out)
+    assert list(records) == ["AAPL", "NVDA"]
+    assert records["AAPL"]["cik"] == "0000000001"
+
+    report = builder.build_universe(["AAPL", "NVDA"], output_path=out, full=True)
+    assert report.written and report.unchanged == ["AAPL", "NVDA"]
+
+
+def test_placeholders_refreshed_from_fmp_then_llm(tmp_path, monkeypatch):
+    out = tmp_path / "refmaster_data.json"
+    builder.build_universe(["AAPL", "MSFT", "NVDA"], output_path=out)
+
+    monkeypatch.setenv("FMP_API_KEY", "test")
+    monkeypatch.setenv("LLM_MODEL", "test-model")
+    monkeypatch.setenv("LLM_API_KEY", "test")
+    monkeypatch.setattr(builder, "LLM_BATCH_SIZE", 1)
+    fmp_calls = []
+
+    def fake_batch(symbols, max_workers=None):
+        fmp_calls.append(list(symbols))
+        equity = Equity(
+            symbol="AAPL", isin="US0378331005", cusip="037833100", cik="320193",
+            currency="USD", exchange="NASDAQ", pricing_source="financialmodelingprep.com",
+        )
+        return fmp_api.IdentifierLookup(equities={"AAPL": equity}, fetched=["AAPL"], missing=["MSFT", "NVDA"])
+
+    prompts = []
+    lock = threading.Lock()
+
+    def fake_llm(symbols):
+        with lock:
+            prompts.append(symbols)
+        if symbols == ("NVDA",):
+            raise ValueError("bad JSON")
+        return {
+            "MSFT": builder.RefMasterEquity(
+                symbol="MSFT", isin="US5949181045", cusip="594918104", currency="usd",
+                exchange="nasdaq", pricing_source="llm",
+            )
+        }
+
+    monkeypatch.setattr(fmp_api, "get_security_identifiers_batch", fake_batch)
+    monkeypatch.setattr(builder, "_request_llm_identifiers", fake_llm)
+    report = builder.build_universe(["AAPL", "MSFT", "NVDA"], output_path=out, max_workers=4)
+
+    assert fmp_calls == [["AAPL", "MSFT", "NVDA"]]
+    assert sorted(prompts) == [("MSFT",), ("NVDA",)]
+    # A failed prompt leaves its placeholder record as it was.
+    assert report.updated == ["AAPL", "MSFT"] and report.unchanged == ["NVDA"]
+    records = _read(out)
+    assert records["AAPL"]["isin"] == "US0378331005"
+    assert records["AAPL"]["cik"] == "0000320193"  # SEC CIK wins over the vendor's
+    assert records["MSFT"]["cusip"] == "594918104" and records["MSFT"]["cik"] == "0000789019"
+
+    # Sourced identifiers are not looked up again.
+    fmp_calls.clear()
+    prompts.clear()
+    report = builder.build_universe(["AAPL", "MSFT"], output_path=out)
+    assert fmp_calls == [] and prompts == []
+    assert report.removed == ["NVDA"]
+
+
+def test_main_reads_tickers_file(tmp_path, capsys):
+    tickers = tmp_path / "tickers.txt"
+    tickers.write_text("AAPL, msft  # mega caps\n\nNVDA\n", encoding="utf-8")
+    out = tmp_path / "out.json"
+    report = builder.main(["--tickers-file", str(tickers), "--output", str(out), "--limit", "2"])
+    assert list(_read(out)) == ["AAPL", "MSFT"]
+    assert report.added == ["AAPL", "MSFT"]
+    assert "2 added" in capsys.readouterr().out
@@ -237,3 +237,20 @@ def test_payload_size_limit(monkeypatch, client):
                       data=large_data,
                       headers={"Content-Type": "application/json", "Content-Length": str(len(large_data))})
     assert resp.status_code in (400, 413, 422)  # Bad request or payload too large
+
+
+def test_validate_trade_verbose_outside_calendar_range(monkeypatch):
+    from src.oms.oms_agent import OMSAgent
+    from src.service.api import _validate_trade_verbose
+
+    class Normalizer:
+        def normalize(self, ticker, top_k=3):
+            return []
+
+    monkeypatch.setattr("src.oms.oms_agent.get_price_record", lambda t, d: None)
+    trade = {"ticker": "AAPL", "quantity": 100, "price": 190, "currency": "USD", "counterparty": "MS",
+             "trade_dt": "2060-12-29", "settle_dt": "2061-01-03"}
+    step = _validate_trade_verbose(OMSAgent(normalizer=Normalizer()), trade)["steps"][-1]
+    assert step["step"] == "settlement_validation"
+    assert step["settlement_days"] == 5
+    assert "expected_settle_date" not in step and "is_holiday" not in step
@@ -207,3 +207,25 @@ def test_run_news_intent(monkeypatch, sample_snapshot):
     assert result["intent"] == "news_sentiment_stub"
     assert "news sentiment" in result["summary"].lower()
     assert result["metrics"]["sentiment"] is None
+
+
+def test_run_volatility_intent_uses_engine_metrics(monkeypatch, sample_snapshot):
+    snap = sample_snapshot.model_copy(update={"volatility_20d": 0.32, "drawdown": -0.08, "max_drawdown": -0.12})
+    monkeypatch.setattr(ticker_agent, "_cached_snapshot", lambda ticker: snap)
+    result = ticker_agent.run("Compare vol for TEST vs peers.")
+    assert result["metrics"]["volatility_20d"] == 0.32
+    assert result["metrics"]["max_drawdown"] == -0.12
+    assert "32.0%" in result["summary"]
+
+
+def test_snapshot_is_not_memoized_past_the_data_tools_caches(monkeypatch, sample_snapshot):
+    calls = []
+
+    def fake_snapshot(ticker):
+        calls.append(ticker)
+        return sample_snapshot
+
+    monkeypatch.setattr(ticker_agent, "get_equity_snapshot", fake_snapshot)
+    ticker_agent.run("What is the market cap for TEST?")
+    ticker_agent.run("What is the market cap for TEST?")
+    assert calls == ["TEST", "TEST"]